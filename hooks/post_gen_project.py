@@ -165,9 +165,22 @@ def cleanup_conditional_files() -> None:
     if "{{ cookiecutter.include_background_jobs }}" == "no":
         remove_dir(Path("src/{{ cookiecutter.project_slug }}/jobs"))
 
+    # The enqueue benchmark and job tests drive the ARQ worker module
+    if "{{ cookiecutter.include_background_jobs }}" != "arq":
+        remove_file(Path("benchmarks/bench_enqueue.py"))
+        remove_dir(Path("tests/unit/jobs"))
+
     # Remove caching utilities if not needed
     if "{{ cookiecutter.include_caching }}" == "no":
         remove_file(Path("src/{{ cookiecutter.project_slug }}/core/cache.py"))
+        remove_file(Path("benchmarks/bench_cache_codecs.py"))
+        remove_file(Path("benchmarks/bench_cache_keys.py"))
+        remove_dir(Path("tests/unit/cache"))
+
+    # Remove benchmarks directory if no benchmarks remain
+    benchmarks_dir = Path("benchmarks")
+    if benchmarks_dir.exists() and not any(benchmarks_dir.glob("*.py")):
+        remove_dir(benchmarks_dir)
 
     # Remove load testing files if not needed
     if "{{ cookiecutter.include_load_testing }}" == "no":
@@ -601,7 +614,7 @@ def print_success_message() -> None:
     if include_background_jobs != "no":
         if include_background_jobs == "arq":
             print("\n  ⚙️  ARQ Worker:")
-            print(f"     uv run arq {project_slug}.jobs.worker.WorkerSettings")
+            print(f"     uv run python -m {project_slug}.jobs.worker")
         else:
             print("\n  ⚙️  Celery Worker:")
             print(f"     uv run celery -A {project_slug}.jobs worker -l info")
@@ -0,0 +1,111 @@
+"""Benchmark cache serializers: encode/decode time and bytes stored.
+
+Compares every codec and compression combination available in the current
+environment on a small payload and on large payloads with and without
+non-JSON types (datetimes, Decimals, UUIDs), which the type-preserving codecs
+must tag. Codecs or compressors whose optional dependency is missing are
+skipped.
+
+Usage:
+    uv run python benchmarks/bench_cache_codecs.py
+    uv run python benchmarks/bench_cache_codecs.py --iterations 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+import uuid
+from datetime import UTC, datetime
+from decimal import Decimal
+
+from {{ cookiecutter.project_slug }}.core.cache import (
+    CacheSerializer,
+    JsonCodec,
+    MsgpackCodec,
+    OrjsonCodec,
+)
+from {{ cookiecutter.project_slug }}.core.exceptions import ConfigurationError
+
+CODECS = {"json": JsonCodec, "orjson": OrjsonCodec, "msgpack": MsgpackCodec}
+COMPRESSIONS = [None, "zlib", "zstd", "lz4"]
+
+
+def make_payloads():
+    small = {
+        "id": str(uuid.uuid4()),
+        "name": "Example User",
+        "email": "user@example.com",
+        "active": True,
+        "roles": ["admin", "editor"],
+    }
+    large_native = [
+        {
+            "id": i,
+            "uuid": str(uuid.uuid4()),
+            "created_at": datetime.now(UTC).isoformat(),
+            "amount": 1234.56,
+            "description": "Order line item " * 4,
+            "tags": ["alpha", "beta", "gamma"],
+        }
+        for i in range(1000)
+    ]
+    large_rich = [
+        {
+            **record,
+            "uuid": uuid.uuid4(),
+            "created_at": datetime.now(UTC),
+            "amount": Decimal("1234.56"),
+        }
+        for record in large_native
+    ]
+    return {
+        "small (user profile)": small,
+        "large, JSON types (1000 records)": large_native,
+        "large, rich types (1000 records)": large_rich,
+    }
+
+
+def bench(serializer, payload, iterations):
+    encoded = serializer.dumps(payload)
+    encode_s = timeit.timeit(lambda: serializer.dumps(payload), number=iterations)
+    decode_s = timeit.timeit(lambda: serializer.loads(encoded), number=iterations)
+    return (
+        encode_s / iterations * 1e6,
+        decode_s / iterations * 1e6,
+        len(encoded),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--compress-threshold", type=int, default=1024)
+    args = parser.parse_args()
+
+    for payload_name, payload in make_payloads().items():
+        print(f"\n{payload_name}")
+        print(
+            f"{'codec':<10}{'compression':<13}"
+            f"{'encode µs':>12}{'decode µs':>12}{'bytes':>10}"
+        )
+        for codec_name, codec_cls in CODECS.items():
+            for compression in COMPRESSIONS:
+                try:
+                    serializer = CacheSerializer(
+                        codec_cls(),
+                        compression=compression,
+                        compress_threshold=args.compress_threshold,
+                    )
+                except ConfigurationError as e:
+                    print(f"{codec_name:<10}{compression or '-':<13}skipped: {e}")
+                    continue
+                encode_us, decode_us, size = bench(serializer, payload, args.iterations)
+                print(
+                    f"{codec_name:<10}{compression or '-':<13}"
+                    f"{encode_us:>12.1f}{decode_us:>12.1f}{size:>10}"
+                )
+
+
+if __name__ == "__main__":
+    main()
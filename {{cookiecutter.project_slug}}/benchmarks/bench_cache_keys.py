@@ -0,0 +1,84 @@
+"""Benchmark cache key building: cost per decorated call.
+
+Compares the previous key scheme (MD5 of the arguments' repr, truncated to
+32 bits) with the canonical argument encoding hashed by each available
+128-bit hash, on small, keyword, large and nested arguments. xxh3 is skipped
+when xxhash is not installed.
+
+Usage:
+    uv run python benchmarks/bench_cache_keys.py
+    uv run python benchmarks/bench_cache_keys.py --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import hashlib
+import timeit
+import uuid
+from datetime import UTC, datetime
+
+from {{ cookiecutter.project_slug }}.core.cache import build_cache_key, configure_key_hash
+from {{ cookiecutter.project_slug }}.core.exceptions import ConfigurationError
+
+HASHES = ["blake2b", "xxh3"]
+
+
+def get_report(*args, **kwargs):
+    return None
+
+
+def legacy_key(func, args, kwargs):
+    key_data = f"{args}:{sorted(kwargs.items())}"
+    key_hash = hashlib.md5(key_data.encode(), usedforsecurity=False).hexdigest()[:8]
+    return f"{func.__name__}:{key_hash}"
+
+
+def make_calls():
+    records = [
+        {
+            "id": i,
+            "uuid": str(uuid.uuid4()),
+            "created_at": datetime.now(UTC).isoformat(),
+            "tags": ["alpha", "beta"],
+        }
+        for i in range(100)
+    ]
+    return {
+        "two scalars": (("user", 42), {}),
+        "keyword filters": ((), {"status": "active", "page": 3, "limit": 50}),
+        "10k-int list": ((list(range(10_000)),), {}),
+        "100 nested records": ((records,), {}),
+    }
+
+
+def bench(build, iterations):
+    return timeit.timeit(build, number=iterations) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"\n{'arguments':<22}{'key builder':<22}{'µs/call':>10}")
+    for call_name, (call_args, call_kwargs) in make_calls().items():
+        build = functools.partial(legacy_key, get_report, call_args, call_kwargs)
+        micros = bench(build, args.iterations)
+        print(f"{call_name:<22}{'legacy md5/repr':<22}{micros:>10.2f}")
+        for name in HASHES:
+            try:
+                configure_key_hash(name)
+            except ConfigurationError as e:
+                print(f"{call_name:<22}{'canonical ' + name:<22}skipped: {e}")
+                continue
+            build = functools.partial(
+                build_cache_key, get_report, call_args, call_kwargs
+            )
+            micros = bench(build, args.iterations)
+            print(f"{call_name:<22}{'canonical ' + name:<22}{micros:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
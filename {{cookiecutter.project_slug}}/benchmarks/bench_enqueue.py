@@ -0,0 +1,91 @@
+"""Benchmark ARQ job submission: jobs per second, one at a time vs batched.
+
+Enqueues the same jobs with ``enqueue_task`` in a loop (one WATCH/MULTI
+exchange per job) and with ``enqueue_many`` at several chunk sizes (one
+pipeline per chunk), into a throwaway queue that is deleted afterwards. Needs
+a running Redis; round-trip latency dominates, so compare against a remote
+Redis as well as a local one.
+
+Usage:
+    uv run python benchmarks/bench_enqueue.py
+    uv run python benchmarks/bench_enqueue.py --jobs 20000 --redis-url redis://cache:6379/1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from arq import create_pool
+from arq.connections import RedisSettings
+from arq.constants import job_key_prefix
+
+from {{ cookiecutter.project_slug }}.jobs.worker import JobSpec, enqueue_many, enqueue_task
+
+QUEUE = "bench:enqueue"
+CHUNK_SIZES = [100, 500, 2000]
+
+
+def make_jobs(count):
+    for i in range(count):
+        yield JobSpec(
+            "send_email_task",
+            (f"user{i}@example.com", "Welcome", "Hello!"),
+            options={"_queue_name": QUEUE},
+        )
+
+
+async def cleanup(redis, job_ids):
+    for start in range(0, len(job_ids), 1000):
+        keys = [job_key_prefix + job_id for job_id in job_ids[start : start + 1000]]
+        await redis.unlink(*keys)
+    await redis.delete(QUEUE)
+
+
+async def bench_single(redis, count):
+    start = time.perf_counter()
+    job_ids = [
+        await enqueue_task(redis, job.task_name, *job.args, **job.options)
+        for job in make_jobs(count)
+    ]
+    elapsed = time.perf_counter() - start
+    await cleanup(redis, job_ids)
+    return elapsed
+
+
+async def bench_many(redis, count, chunk_size):
+    start = time.perf_counter()
+    job_ids = await enqueue_many(redis, make_jobs(count), chunk_size=chunk_size)
+    elapsed = time.perf_counter() - start
+    await cleanup(redis, job_ids)
+    return elapsed
+
+
+async def run(args):
+    redis = await create_pool(RedisSettings.from_dsn(args.redis_url))
+    try:
+        print(f"\n{'method':<28}{'seconds':>10}{'jobs/s':>12}{'speedup':>10}")
+        baseline = await bench_single(redis, args.jobs)
+        rate = args.jobs / baseline
+        print(f"{'enqueue_task loop':<28}{baseline:>10.3f}{rate:>12,.0f}{1:>9.1f}x")
+        for chunk_size in CHUNK_SIZES:
+            elapsed = await bench_many(redis, args.jobs, chunk_size)
+            name = f"enqueue_many chunk={chunk_size}"
+            rate = args.jobs / elapsed
+            speedup = baseline / elapsed
+            print(f"{name:<28}{elapsed:>10.3f}{rate:>12,.0f}{speedup:>9.1f}x")
+    finally:
+        await redis.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--redis-url", default="redis://localhost:6379/0")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
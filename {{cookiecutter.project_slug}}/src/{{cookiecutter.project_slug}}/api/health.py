@@ -20,8 +20,21 @@ import time
 from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, HTTPException, status
+{% if cookiecutter.include_caching == "yes" -%}
+from fastapi.responses import PlainTextResponse
+{% endif -%}
 from pydantic import BaseModel, Field
 
+{% if cookiecutter.include_caching == "yes" -%}
+from {{ cookiecutter.project_slug }}.core.cache import (
+    get_cache_backend,
+    get_cache_stats,
+    get_circuit_breaker_state,
+    render_prometheus_metrics,
+)
+
+{% endif -%}
+
 if TYPE_CHECKING:
     {% if cookiecutter.include_database != "none" -%}
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -33,6 +46,10 @@ router = APIRouter(prefix="/health", tags=["health"])
 # Track application start time for uptime calculation
 _START_TIME = time.time()
 
+# Dependencies the application degrades without; failing them reports
+# "degraded" instead of taking the pod out of rotation
+_NON_CRITICAL_CHECKS = frozenset({"cache"})
+
 
 class HealthStatus(BaseModel):
     """Health check response model."""
@@ -116,18 +133,33 @@ async def check_database() -> ReadinessCheck:
 
 {% endif -%}
 async def check_cache() -> ReadinessCheck:
-    """Check Redis/cache connectivity.
+    """Check connectivity to the configured cache backend.
 
     Returns:
         ReadinessCheck with cache status and latency
     """
     start = time.time()
     try:
+        {% if cookiecutter.include_caching == "yes" -%}
+        # Fails instantly while the circuit breaker is open
+        circuit = get_circuit_breaker_state()
+        if circuit["state"] == "open":
+            latency_ms = (time.time() - start) * 1000
+            return ReadinessCheck(
+                name="cache",
+                status=False,
+                latency_ms=round(latency_ms, 2),
+                error=f"circuit breaker open (trips: {circuit['trips']})",
+            )
+        # Round trip to the backend CACHE_BACKEND selects (redis, memory or disk)
+        await get_cache_backend().exists("health:cache")
+        {% else -%}
         # Example Redis check - adjust based on your cache implementation
-        # from {{ cookiecutter.project_slug }}.core.cache import redis_client
-        # await redis_client.ping()
+        # from {{ cookiecutter.project_slug }}.core.cache import get_redis
+        # await (await get_redis()).ping()
 
         # Placeholder - replace with actual cache check
+        {% endif -%}
         latency_ms = (time.time() - start) * 1000
         return ReadinessCheck(
             name="cache",
@@ -192,7 +224,8 @@ async def readiness() -> ReadinessStatus:
     {% if cookiecutter.include_database != "none" -%}
     - Database connectivity
     {% endif -%}
-    - Cache availability (if configured)
+    - Cache availability (if configured; an unavailable cache only marks the
+      response "degraded", since cached calls fall back to the source)
     - External service health (if applicable)
 
     Returns HTTP 503 if any critical dependency is unavailable.
@@ -205,14 +238,24 @@ async def readiness() -> ReadinessStatus:
     {% if cookiecutter.include_database != "none" -%}
     checks["database"] = await check_database()
     {% endif -%}
+    {% if cookiecutter.include_caching == "yes" -%}
+    checks["cache"] = await check_cache()
+
+    {% else -%}
     # Uncomment if using cache:
     # checks["cache"] = await check_cache()
 
+    {% endif -%}
     # Uncomment if checking external services:
     # checks["external_api"] = await check_external_service()
 
     # Determine overall status
-    all_healthy = all(check.status for check in checks.values())
+    all_healthy = all(
+        check.status
+        for name, check in checks.items()
+        if name not in _NON_CRITICAL_CHECKS
+    )
+    degraded = not all(check.status for check in checks.values())
 
     if not all_healthy:
         # Return 503 if any critical check fails
@@ -227,7 +270,7 @@ async def readiness() -> ReadinessStatus:
         )
 
     return ReadinessStatus(
-        status="ok",
+        status="degraded" if degraded else "ok",
         uptime_seconds=time.time() - _START_TIME,
         checks=checks,
     )
@@ -274,6 +317,32 @@ async def health() -> HealthStatus:
     return await liveness()
 
 
+{% if cookiecutter.include_caching == "yes" -%}
+@router.get(
+    "/cache",
+    summary="Cache statistics",
+    description="Per-prefix hit rates, latency and payload sizes for this process.",
+)
+async def cache_stats() -> dict[str, Any]:
+    """Cache statistics for tuning TTLs and finding cache-unfriendly call sites.
+
+    Combines Redis server counters with this process's per-prefix metrics.
+    """
+    return await get_cache_stats()
+
+
+@router.get(
+    "/cache/metrics",
+    response_class=PlainTextResponse,
+    summary="Cache metrics (Prometheus)",
+    description="Per-prefix cache counters and histograms in Prometheus text format.",
+)
+async def cache_metrics() -> str:
+    """Prometheus scrape target for this process's cache metrics."""
+    return render_prometheus_metrics()
+
+
+{% endif -%}
 # =============================================================================
 # Kubernetes Probe Configuration Examples
 # =============================================================================
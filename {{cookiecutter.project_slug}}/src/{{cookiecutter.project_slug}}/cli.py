@@ -4,12 +4,22 @@ Provides commands for common operations and demonstrates Click best practices
 with structured logging integration.
 """
 
+{% if cookiecutter.include_caching == "yes" -%}
+import asyncio
+{% endif -%}
 import sys
 from dataclasses import dataclass
 
 import click
 from structlog.stdlib import BoundLogger
 
+{% if cookiecutter.include_caching == "yes" -%}
+from {{ cookiecutter.project_slug }}.core.cache import (
+    WarmupProgress,
+    get_cache_backend,
+    warm_manifest,
+)
+{% endif -%}
 from {{ cookiecutter.project_slug }}.core.config import settings
 from {{ cookiecutter.project_slug }}.utils.logging import get_logger
 
@@ -99,6 +109,61 @@ def config(ctx: click.Context) -> None:
         logger.exception("Failed to display configuration", error=str(e))
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
+{%- if cookiecutter.include_caching == "yes" %}
+
+
+async def _warm_cache(*, force: bool, concurrency: int | None) -> WarmupProgress:
+    """Warm the manifest, echoing progress per batch, then close the backend."""
+
+    def report(progress: WarmupProgress) -> None:
+        handled = progress.warmed + progress.skipped + progress.failed
+        click.echo(f"  {handled}/{progress.total} keys")
+
+    try:
+        return await warm_manifest(
+            force=force, concurrency=concurrency, on_progress=report
+        )
+    finally:
+        await get_cache_backend().close()
+
+
+@cli.command("warm-cache")
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Reload keys that are already cached",
+)
+@click.option(
+    "--concurrency",
+    type=int,
+    default=None,
+    help="Loaders run at once (default: CACHE_WARMUP_CONCURRENCY)",
+)
+def warm_cache(force: bool, concurrency: int | None) -> None:
+    """Warm the registered cache manifest, e.g. after a deploy.
+
+    Exits with status 1 if any key could not be loaded or written.
+    """
+    try:
+        logger.info("Warming cache manifest", force=force, concurrency=concurrency)
+
+        progress = asyncio.run(_warm_cache(force=force, concurrency=concurrency))
+        click.echo(
+            f"Warmed {progress.warmed}, skipped {progress.skipped} already cached, "
+            f"failed {progress.failed} of {progress.total} keys "
+            f"in {progress.elapsed:.2f}s"
+        )
+
+        logger.info("Cache warm-up completed", failed=progress.failed)
+
+    except Exception as e:
+        logger.exception("Cache warm-up failed", error=str(e))
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    if progress.failed:
+        sys.exit(1)
+{%- endif %}
 
 
 if __name__ == "__main__":
@@ -1,22 +1,35 @@
 """Redis caching utilities for performance optimization.
 
 This module provides production-ready caching patterns:
-- Function result caching with decorators
-- Cache invalidation strategies
-- Async Redis connection pool
+- Function result caching with decorators (``memoize`` for sync functions)
+- Optional in-process L1 tier (LRU + TTL) in front of Redis, kept coherent
+  across processes through a pub/sub invalidation channel
+- Single-flight request coalescing for cache misses (per process or cluster-wide)
+- Distributed locks with fencing tokens and auto-extension
+- Stale-while-revalidate and probabilistic early refresh (XFetch)
+- Adaptive TTLs and refresh-ahead driven by approximate access frequency
+- Pluggable serialization (JSON, orjson, msgpack) with optional compression
+- Bulk operations (MGET / pipelined SETEX) and a batch-aware decorator
+- Cache invalidation strategies (namespace generation, tag index or key pattern)
+- Async Redis connection pool (standalone, Sentinel or Cluster) with replica reads
+- Pluggable storage backends: Redis, in-process memory or a local SQLite file
+- Large values stored in Redis as checksummed chunks, under a hard size limit
 - TTL (time-to-live) management
-- Cache warming patterns
+- Cache warming, one key at a time or from a prioritized manifest
 
 Setup:
-    1. Install Redis client:
+    1. Install Redis client (plus optional faster codecs and compression):
        uv add redis[hiredis]
+       uv add orjson msgpack zstandard lz4 xxhash  # optional
 
     2. Start Redis:
        docker-compose up -d redis
 
-    3. Configure in .env:
+    3. Configure in .env (read through core.config.Settings):
        REDIS_URL=redis://localhost:6379/0
-       CACHE_TTL_SECONDS=3600
+       REDIS_MODE=standalone  # or sentinel / cluster
+       CACHE_MAX_CONNECTIONS=50
+       CACHE_BACKEND=redis  # or memory / disk (no Redis service needed)
 
 Performance:
     - 10-100x faster than database queries for cached data
@@ -26,301 +39,4285 @@ Performance:
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import contextlib
+import fnmatch
 import functools
 import hashlib
+import importlib
+import inspect
 import json
-import logging
-from typing import TYPE_CHECKING, Any, TypeVar
+import math
+import random
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+import zlib
+from array import array
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from datetime import time as dt_time
+from decimal import Decimal
+from itertools import islice
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Literal,
+    Protocol,
+    TypeVar,
+    cast,
+)
 
-from redis.asyncio import Redis, from_url
-from redis.exceptions import RedisError
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from redis.asyncio.cluster import ClusterPipeline, RedisCluster
+from redis.asyncio.connection import BlockingConnectionPool, parse_url
+from redis.asyncio.sentinel import Sentinel, SentinelConnectionPool
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import RedisError, ResponseError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from {{ cookiecutter.project_slug }}.core.config import settings
+from {{ cookiecutter.project_slug }}.core.exceptions import ConfigurationError
+from {{ cookiecutter.project_slug }}.utils.canonical import (
+    UnstableArgumentError,
+    canonical_json,
+)
+from {{ cookiecutter.project_slug }}.utils.logging import get_logger
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import (
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Iterable,
+        Iterator,
+        Mapping,
+        Sequence,
+    )
+
+    from redis.asyncio.connection import AbstractConnection
+    from structlog.stdlib import BoundLogger
+
+logger: BoundLogger = get_logger(__name__)
+
+T = TypeVar("T")  # Covariant type variable for cached function return types
+
+# Global Redis connection pool (primary) and optional replica for reads. These
+# return raw bytes for cache payloads; get_redis() hands out decoding clients.
+_redis_pool: Redis | None = None
+_redis_replica: Redis | None = None
+_redis_text: Redis | None = None
+_redis_text_replica: Redis | None = None
+_sentinel: Sentinel | None = None
+
+# Sentinel distinguishing "not in local cache" from a cached None
+_MISSING: Any = object()
+
+# Keys per MGET / pipeline round trip in bulk operations
+_BULK_CHUNK_SIZE = 500
+
+# Redis sets indexing cache keys by tag
+_TAG_KEY_PREFIX = "cache:tag:"
+
+# Redis counters holding each namespace's current generation
+_NAMESPACE_KEY_PREFIX = "cache:ns:"
+
+# Seconds a namespace generation is reused locally before re-reading Redis
+_NAMESPACE_LOCAL_TTL = 5.0
+
+K = TypeVar("K")  # Entity id type for batch-cached functions
+V = TypeVar("V")  # Entity value type for batch-cached functions
+R_co = TypeVar("R_co", covariant=True)  # Return type of memoized functions
+
+
+# =============================================================================
+# Circuit Breaker
+# =============================================================================
+
+
+class CacheCircuitOpenError(RedisError):
+    """Raised instead of contacting Redis while the circuit breaker is open.
+
+    Subclasses ``RedisError`` so every cache helper degrades exactly as it
+    does when Redis is down, minus the wait for a timeout.
+    """
+
+
+class CircuitBreaker:
+    """Fail fast while Redis is unreachable or timing out.
+
+    The breaker opens after ``failure_threshold`` consecutive connection
+    errors or timeouts, or once at least ``timeout_rate_threshold`` of the last
+    ``window_size`` calls (and at least ``min_calls``) timed out. While open,
+    every command raises ``CacheCircuitOpenError`` immediately. After
+    ``recovery_timeout`` seconds it turns half-open and lets a single probe
+    command through: success closes it, failure re-opens it for another
+    ``recovery_timeout``. Redis error replies (``ResponseError``) prove the
+    server is reachable and count as successes.
+
+    Example:
+        >>> configure_circuit_breaker(
+        ...     CircuitBreaker(failure_threshold=3, recovery_timeout=5.0)
+        ... )
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 10.0,
+        *,
+        timeout_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        min_calls: int = 10,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.timeout_rate_threshold = timeout_rate_threshold
+        self.min_calls = min_calls
+        self.state = self.CLOSED
+        self.trips = 0
+        self.rejected = 0
+        self._consecutive_failures = 0
+        self._recent_timeouts: deque[bool] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def before_call(self) -> None:
+        """Admit a command, or raise ``CacheCircuitOpenError``."""
+        if self.state == self.CLOSED:
+            return
+        if (
+            self.state == self.OPEN
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self.state = self.HALF_OPEN
+            logger.info("cache_circuit_half_open")
+        if self.state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return
+        self.rejected += 1
+        msg = "Redis circuit breaker is open"
+        raise CacheCircuitOpenError(msg)
+
+    def record_success(self) -> None:
+        """Record a command that reached Redis."""
+        self._consecutive_failures = 0
+        self._recent_timeouts.append(False)
+        if self.state == self.HALF_OPEN:
+            self.state = self.CLOSED
+            self._probe_in_flight = False
+            self._recent_timeouts.clear()
+            logger.info("cache_circuit_closed")
+
+    def record_failure(self, *, timeout: bool) -> None:
+        """Record a connection error or timeout, tripping the breaker if due."""
+        self._consecutive_failures += 1
+        self._recent_timeouts.append(timeout)
+        if self.state == self.OPEN:
+            return
+        if (
+            self.state == self.HALF_OPEN
+            or self._consecutive_failures >= self.failure_threshold
+            or self._timeout_rate_exceeded()
+        ):
+            self._trip()
+
+    def release_probe(self) -> None:
+        """Let another probe through after one ended without a verdict."""
+        self._probe_in_flight = False
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current state and counters, for health checks and metrics."""
+        calls = len(self._recent_timeouts)
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "timeout_rate": sum(self._recent_timeouts) / calls if calls else 0.0,
+            "trips": self.trips,
+            "rejected": self.rejected,
+        }
+
+    def _timeout_rate_exceeded(self) -> bool:
+        calls = len(self._recent_timeouts)
+        return (
+            calls >= self.min_calls
+            and sum(self._recent_timeouts) / calls >= self.timeout_rate_threshold
+        )
+
+    def _trip(self) -> None:
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+        self.trips += 1
+        logger.warning(
+            "cache_circuit_opened",
+            consecutive_failures=self._consecutive_failures,
+            retry_in=self.recovery_timeout,
+        )
+
+
+_circuit_breaker = CircuitBreaker()
+
+
+def configure_circuit_breaker(breaker: CircuitBreaker) -> None:
+    """Replace the circuit breaker guarding every Redis command."""
+    global _circuit_breaker
+
+    _circuit_breaker = breaker
+
+
+def get_circuit_breaker_state() -> dict[str, Any]:
+    """Get the circuit breaker's state (closed, open or half_open) and counters."""
+    return _circuit_breaker.snapshot()
+
+
+async def _guarded(call: Callable[[], Awaitable[Any]]) -> Any:
+    """Run a Redis round trip through the circuit breaker."""
+    breaker = _circuit_breaker
+    breaker.before_call()
+    try:
+        result = await call()
+    except (RedisConnectionError, RedisTimeoutError) as e:
+        breaker.record_failure(timeout=isinstance(e, RedisTimeoutError))
+        raise
+    except ResponseError:
+        breaker.record_success()
+        raise
+    except BaseException:
+        breaker.release_probe()
+        raise
+    breaker.record_success()
+    return result
+
+
+class _GuardedPipeline(Pipeline):
+    """Pipeline whose round trip goes through the circuit breaker."""
+
+    async def execute(self, raise_on_error: bool = True) -> list[Any]:
+        return await _guarded(functools.partial(super().execute, raise_on_error))
+
+
+class _GuardedRedis(Redis):
+    """Redis client whose commands go through the circuit breaker."""
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        return await _guarded(
+            functools.partial(super().execute_command, *args, **options)
+        )
+
+    def pipeline(
+        self, transaction: bool = True, shard_hint: str | None = None
+    ) -> Pipeline:
+        return _GuardedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
+
+
+class _GuardedClusterPipeline(ClusterPipeline):
+    """Cluster pipeline whose round trips go through the circuit breaker."""
+
+    async def execute(
+        self, raise_on_error: bool = True, allow_redirections: bool = True
+    ) -> list[Any]:
+        return await _guarded(
+            functools.partial(super().execute, raise_on_error, allow_redirections)
+        )
+
+
+class _GuardedRedisCluster(RedisCluster):
+    """Redis Cluster client whose commands go through the circuit breaker."""
+
+    async def execute_command(self, *args: Any, **kwargs: Any) -> Any:
+        return await _guarded(
+            functools.partial(super().execute_command, *args, **kwargs)
+        )
+
+    def pipeline(
+        self, transaction: Any | None = None, shard_hint: Any | None = None
+    ) -> ClusterPipeline:
+        super().pipeline(transaction, shard_hint)  # Rejects unsupported options
+        return _GuardedClusterPipeline(self)  # type: ignore[abstract]
+
+
+# =============================================================================
+# Connection Management
+# =============================================================================
+
+
+class _PoolStats:
+    """Checkout wait time and connections in use for one connection pool."""
+
+    def __init__(self, role: str, max_connections: int) -> None:
+        self.role = role
+        self.max_connections = max_connections
+        self.checked_out: set[int] = set()
+        self.peak_in_use = 0
+        self.checkout_failures = 0
+        self.wait = _Histogram(_LATENCY_BUCKETS)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current utilization and checkout wait summary."""
+        in_use = len(self.checked_out)
+        return {
+            "in_use": in_use,
+            "max_connections": self.max_connections,
+            "utilization": in_use / max(self.max_connections, 1),
+            "peak_in_use": self.peak_in_use,
+            "checkout_failures": self.checkout_failures,
+            "wait_seconds": self.wait.summary(),
+        }
+
+
+# Pool statistics by role ("primary" or "replica")
+_pool_stats: dict[str, _PoolStats] = {}
+
+
+async def _timed_checkout(
+    stats: _PoolStats, checkout: Awaitable[AbstractConnection]
+) -> AbstractConnection:
+    """Await a pool checkout, recording its wait time and the connection."""
+    started = time.perf_counter()
+    try:
+        connection = await checkout
+    except RedisError:
+        stats.checkout_failures += 1
+        raise
+    finally:
+        stats.wait.observe(time.perf_counter() - started)
+    stats.checked_out.add(id(connection))
+    stats.peak_in_use = max(stats.peak_in_use, len(stats.checked_out))
+    return connection
+
+
+class _InstrumentedPool(BlockingConnectionPool):
+    """Blocking pool (waits for a free connection) that records its usage."""
+
+    stats: _PoolStats
+
+    async def get_connection(self, *args: Any, **kwargs: Any) -> AbstractConnection:
+        return await _timed_checkout(
+            self.stats, super().get_connection(*args, **kwargs)
+        )
+
+    async def release(self, connection: AbstractConnection) -> None:
+        self.stats.checked_out.discard(id(connection))
+        await super().release(connection)
+
+
+class _InstrumentedSentinelPool(SentinelConnectionPool):
+    """Sentinel-managed pool that records its usage."""
+
+    stats: _PoolStats
+
+    async def get_connection(self, *args: Any, **kwargs: Any) -> AbstractConnection:
+        return await _timed_checkout(
+            self.stats, super().get_connection(*args, **kwargs)
+        )
+
+    async def release(self, connection: AbstractConnection) -> None:
+        self.stats.checked_out.discard(id(connection))
+        await super().release(connection)
+
+
+def _connection_options(*, decode_responses: bool) -> dict[str, Any]:
+    """Per-connection options shared by every topology, from settings."""
+    return {
+        "decode_responses": decode_responses,
+        "socket_keepalive": True,
+        "socket_connect_timeout": settings.cache_socket_connect_timeout,
+        "socket_timeout": settings.cache_socket_timeout,
+        "health_check_interval": settings.cache_health_check_interval,
+    }
+
+
+def _track_pool(client: Redis, role: str) -> Redis:
+    """Attach usage statistics to a client's instrumented pool."""
+    pool = client.connection_pool
+    if isinstance(pool, (_InstrumentedPool, _InstrumentedSentinelPool)):
+        pool.stats = _pool_stats[role] = _PoolStats(
+            role, settings.cache_max_connections
+        )
+    return client
+
+
+def _standalone_client(url: str, role: str, *, decode_responses: bool) -> Redis:
+    """Client for a single Redis server with a bounded, blocking pool."""
+    pool = _InstrumentedPool.from_url(
+        url,
+        max_connections=settings.cache_max_connections,
+        timeout=settings.cache_pool_timeout,
+        retry_on_timeout=True,
+        **_connection_options(decode_responses=decode_responses),
+    )
+    return _track_pool(_GuardedRedis.from_pool(pool), role)
+
+
+def _sentinel_clients(*, decode_responses: bool) -> tuple[Redis, Redis | None]:
+    """Primary and (optionally) replica clients discovered through Sentinel."""
+    global _sentinel
+
+    sentinels = []
+    for address in settings.redis_sentinels.split(","):
+        host, _, port = address.strip().rpartition(":")
+        sentinels.append((host, int(port)))
+
+    # Credentials and database come from REDIS_URL; Sentinel supplies the hosts
+    options = {
+        key: value
+        for key, value in parse_url(settings.redis_url).items()
+        if key not in {"host", "port", "connection_class"}
+    }
+    if _sentinel is None:
+        _sentinel = Sentinel(
+            sentinels,
+            sentinel_kwargs={"socket_timeout": settings.cache_socket_timeout},
+        )
+    client_options = {
+        **options,
+        **_connection_options(decode_responses=decode_responses),
+        "redis_class": _GuardedRedis,
+        "connection_pool_class": _InstrumentedSentinelPool,
+        "max_connections": settings.cache_max_connections,
+        "retry_on_timeout": True,
+    }
+    service = settings.redis_sentinel_service
+    primary_role, replica_role = _pool_roles(decode_responses=decode_responses)
+    primary = _track_pool(_sentinel.master_for(service, **client_options), primary_role)
+    replica = None
+    if settings.redis_read_from_replicas:
+        replica = _track_pool(
+            _sentinel.slave_for(service, **client_options), replica_role
+        )
+    return primary, replica
+
+
+def _pool_roles(*, decode_responses: bool) -> tuple[str, str]:
+    """Pool statistics roles for the primary and replica clients."""
+    if decode_responses:
+        return "primary_text", "replica_text"
+    return "primary", "replica"
+
+
+def _create_clients(*, decode_responses: bool = False) -> tuple[Redis, Redis | None]:
+    """Build the primary client and, with read routing enabled, a replica client.
+
+    The cache uses binary clients (``decode_responses=False``) because payloads
+    may be binary; ``get_redis`` hands out clients decoding replies to ``str``.
+    """
+    if settings.redis_mode == "cluster":
+        cluster = _GuardedRedisCluster.from_url(
+            settings.redis_url,
+            read_from_replicas=settings.redis_read_from_replicas,
+            max_connections=settings.cache_max_connections,
+            **_connection_options(decode_responses=decode_responses),
+        )
+        # The cluster client routes reads to replicas itself. Its API matches
+        # Redis for every command used here (multi-slot MGET/UNLINK and SCAN
+        # are special-cased below).
+        return cast("Redis", cluster), None
+
+    if settings.redis_mode == "sentinel":
+        return _sentinel_clients(decode_responses=decode_responses)
+
+    primary_role, replica_role = _pool_roles(decode_responses=decode_responses)
+    primary = _standalone_client(
+        settings.redis_url, primary_role, decode_responses=decode_responses
+    )
+    replica = None
+    if settings.redis_read_from_replicas and settings.redis_replica_url:
+        replica = _standalone_client(
+            settings.redis_replica_url, replica_role, decode_responses=decode_responses
+        )
+    return primary, replica
+
+
+async def get_redis() -> Redis:
+    """Get Redis connection from pool.
+
+    Replies are decoded to ``str``. The cache itself uses a separate client
+    returning raw bytes, because cache payloads may be binary; read and write
+    cached values through ``get_cached``/``set_cached`` rather than this client.
+    Every command goes through the circuit breaker, so while Redis is down
+    commands raise ``CacheCircuitOpenError`` instead of waiting for a timeout.
+
+    The topology (standalone, Sentinel or Cluster), pool size and timeouts
+    come from ``core.config.settings`` (``REDIS_MODE``, ``CACHE_MAX_CONNECTIONS``,
+    ``CACHE_SOCKET_TIMEOUT``, ...). This client always talks to the primary;
+    see ``get_redis_replica`` for reads that tolerate replication lag.
+
+    Returns:
+        Redis connection
+
+    Example:
+        >>> redis = await get_redis()
+        >>> await redis.set("key", "value", ex=60)
+        >>> value = await redis.get("key")
+    """
+    global _redis_text, _redis_text_replica
+
+    if _redis_text is None:
+        _redis_text, _redis_text_replica = _create_clients(decode_responses=True)
+
+    return _redis_text
+
+
+async def get_redis_replica() -> Redis:
+    """Get the client for reads that may be served by a replica.
+
+    Returns a replica client when ``REDIS_READ_FROM_REPLICAS`` is enabled
+    (via Sentinel, or ``REDIS_REPLICA_URL`` in standalone mode), otherwise the
+    primary. Like ``get_redis``, it decodes replies to ``str``; everything that
+    writes, locks or must observe its own writes uses ``get_redis``.
+    """
+    primary = await get_redis()
+    return _redis_text_replica or primary
+
+
+async def _cache_redis() -> Redis:
+    """The binary client cache payloads, locks and indexes go through."""
+    global _redis_pool, _redis_replica
+
+    if _redis_pool is None:
+        _redis_pool, _redis_replica = _create_clients()
+        logger.info(
+            "redis_connection_initialized",
+            mode=settings.redis_mode,
+            replica_reads=_redis_replica is not None
+            or (settings.redis_mode == "cluster" and settings.redis_read_from_replicas),
+        )
+
+    return _redis_pool
+
+
+async def _cache_redis_replica() -> Redis:
+    """The binary client for cache reads that tolerate replication lag.
+
+    ``get_cached`` and ``get_many`` read through it.
+    """
+    primary = await _cache_redis()
+    return _redis_replica or primary
+
+
+def get_pool_stats() -> dict[str, dict[str, Any]]:
+    """Get connection pool utilization and checkout wait times by role.
+
+    Cluster clients keep one pool per node internally and are not included.
+    """
+    return {role: stats.snapshot() for role, stats in _pool_stats.items()}
+
+
+async def close_redis() -> None:
+    """Close Redis connection pool.
+
+    Call this on application shutdown.
+    """
+    global _redis_pool, _redis_replica, _redis_text, _redis_text_replica, _sentinel
+
+    await stop_invalidation_listener()
+    for client in (_redis_text_replica, _redis_text, _redis_replica):
+        if client is not None:
+            await client.aclose()
+    _redis_text = _redis_text_replica = _redis_replica = None
+    if _redis_pool is not None:
+        await _redis_pool.aclose()
+        _redis_pool = None
+        logger.info("redis_connection_closed")
+    if _sentinel is not None:
+        for sentinel in _sentinel.sentinels:
+            await sentinel.aclose()
+        _sentinel = None
+    _pool_stats.clear()
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+# Histogram bucket upper bounds (Prometheus "le" labels)
+_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+_SERIALIZE_BUCKETS = (1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 0.01, 0.05)
+_PAYLOAD_BUCKETS = (
+    64,
+    256,
+    1024,
+    4096,
+    16384,
+    65536,
+    262144,
+    1048576,
+    4194304,
+    16777216,
+)
+
+
+class _Histogram:
+    """Fixed-bucket histogram with Prometheus semantics."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # Last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the ``q`` quantile."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return bound
+        return math.inf
+
+    def summary(self) -> dict[str, Any]:
+        """Count, mean and approximate percentiles."""
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class _PrefixMetrics:
+    """Counters and histograms for one key prefix."""
+
+    COUNTERS: ClassVar[tuple[str, ...]] = (
+        "hits",
+        "misses",
+        "l1_hits",
+        "refreshes",
+        "errors",
+        "bypassed",
+        "negative_hits",
+        "chunked",
+        "oversized",
+    )
+
+    # Histogram attribute -> (exported name, description)
+    HISTOGRAMS: ClassVar[dict[str, tuple[str, str]]] = {
+        "get_latency": ("get_latency_seconds", "Redis read round trip time."),
+        "set_latency": ("set_latency_seconds", "Redis write round trip time."),
+        "encode_time": ("encode_seconds", "Time spent serializing values."),
+        "decode_time": ("decode_seconds", "Time spent deserializing values."),
+        "payload_bytes": ("payload_bytes", "Size of stored payloads."),
+    }
+
+    def __init__(self) -> None:
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+        self.get_latency = _Histogram(_LATENCY_BUCKETS)
+        self.set_latency = _Histogram(_LATENCY_BUCKETS)
+        self.encode_time = _Histogram(_SERIALIZE_BUCKETS)
+        self.decode_time = _Histogram(_SERIALIZE_BUCKETS)
+        self.payload_bytes = _Histogram(_PAYLOAD_BUCKETS)
+
+    def histograms(self) -> dict[str, _Histogram]:
+        """Histograms by exported name."""
+        return {
+            name: getattr(self, attr) for attr, (name, _) in self.HISTOGRAMS.items()
+        }
+
+
+# Metrics by key prefix (the decorated function's prefix, or the part of a
+# key before its first ":" for the get/set helpers)
+_prefix_metrics: dict[str, _PrefixMetrics] = {}
+
+
+def _key_prefix(key: str) -> str:
+    """Metrics prefix for a key passed to the get/set helpers."""
+    return key.split(":", 1)[0]
+
+
+def _metrics(prefix: str) -> _PrefixMetrics:
+    """Metrics for a prefix, created on first use."""
+    metrics = _prefix_metrics.get(prefix)
+    if metrics is None:
+        metrics = _prefix_metrics[prefix] = _PrefixMetrics()
+    return metrics
+
+
+def get_cache_metrics() -> dict[str, dict[str, Any]]:
+    """Get per-prefix cache metrics recorded by this process.
+
+    Returns:
+        Mapping of key prefix to its counters, hit rate (L1 hits included)
+        and latency, serialization time and payload size summaries
+    """
+    result: dict[str, dict[str, Any]] = {}
+    for prefix, metrics in sorted(_prefix_metrics.items()):
+        counters = metrics.counters
+        hits = counters["hits"] + counters["l1_hits"]
+        result[prefix] = {
+            **counters,
+            "hit_rate": (hits / max(hits + counters["misses"], 1)) * 100,
+            **{
+                name: histogram.summary()
+                for name, histogram in metrics.histograms().items()
+            },
+        }
+    return result
+
+
+def reset_cache_metrics() -> None:
+    """Forget every recorded metric (useful in tests)."""
+    _prefix_metrics.clear()
+    _lock_metrics.clear()
+
+
+# =============================================================================
+# Serialization
+# =============================================================================
+
+# Framed payloads start with a header byte with the high bit set, which never
+# begins legacy JSON text: 4 bits of codec id, the envelope flag and 2 bits of
+# compression id.
+_FRAME_FLAG = 0x80
+
+# Header bit marking an internal entry (see _Envelope) rather than a user value
+_ENVELOPE_FLAG = 0x04
+_COMPRESSION_MASK = 0x03
+
+
+class _Envelope(dict[str, Any]):
+    """An entry the cache stores on its own behalf, wrapping or replacing a value.
+
+    Stale-while-revalidate, negative and error entries are envelopes. They are
+    always framed with ``_ENVELOPE_FLAG`` set, so a cached user value that
+    happens to look like one is never mistaken for it.
+    """
+
+
+# Key marking JSON objects that stand in for a non-JSON type
+_TYPE_TAG = "__cache_type__"
+
+
+class CacheCodec(Protocol):
+    """Converts cached values to and from bytes."""
+
+    codec_id: int
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize a value."""
+        ...
+
+    def decode(self, data: bytes) -> Any:
+        """Deserialize a value produced by :meth:`encode`."""
+        ...
+
+
+def _tag_rich_type(obj: Any) -> Any:
+    """Encode a non-JSON type as a tagged object (JSON codec ``default`` hook)."""
+    if isinstance(obj, datetime):
+        return {_TYPE_TAG: "datetime", "v": obj.isoformat()}
+    if isinstance(obj, date):
+        return {_TYPE_TAG: "date", "v": obj.isoformat()}
+    if isinstance(obj, dt_time):
+        return {_TYPE_TAG: "time", "v": obj.isoformat()}
+    if isinstance(obj, Decimal):
+        return {_TYPE_TAG: "decimal", "v": str(obj)}
+    if isinstance(obj, (set, frozenset)):
+        return {_TYPE_TAG: "set", "v": list(obj)}
+    # Unknown types degrade to strings, matching the legacy JSON behaviour
+    return str(obj)
+
+
+_RICH_TYPE_DECODERS: dict[str, Callable[[Any], Any]] = {
+    "datetime": datetime.fromisoformat,
+    "date": date.fromisoformat,
+    "time": dt_time.fromisoformat,
+    "decimal": Decimal,
+    "set": set,
+}
+
+
+def _untag_rich_types(data: Any) -> Any:
+    """Restore tagged objects produced by :func:`_tag_rich_type`."""
+    if isinstance(data, dict):
+        tag = data.get(_TYPE_TAG)
+        if tag in _RICH_TYPE_DECODERS and len(data) == 2:
+            return _RICH_TYPE_DECODERS[tag](_untag_rich_types(data["v"]))
+        return {k: _untag_rich_types(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_untag_rich_types(v) for v in data]
+    return data
+
+
+class JsonCodec:
+    """Standard library JSON (the default, compatible with existing entries).
+
+    Non-JSON types such as datetimes, Decimals and UUIDs are stored as strings
+    and come back as strings.
+    """
+
+    codec_id = 0
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize a value as UTF-8 JSON."""
+        return json.dumps(value, default=str).encode()
+
+    def decode(self, data: bytes) -> Any:
+        """Deserialize UTF-8 JSON."""
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """orjson-based JSON: several times faster than the standard library.
+
+    datetimes, dates, times, Decimals and sets round-trip with their types.
+    UUIDs are serialized natively by orjson and decode as strings; use
+    :class:`MsgpackCodec` when they must round-trip too.
+    """
+
+    codec_id = 1
+
+    # Prefixed to payloads containing tagged types; never starts JSON text
+    _TAGGED = b"\x00"
+
+    def __init__(self) -> None:
+        try:
+            import orjson  # noqa: PLC0415  # Optional dependency
+        except ImportError as e:
+            msg = "orjson is not installed. Install with: uv add orjson"
+            raise ConfigurationError(msg) from e
+        self._orjson = orjson
+        self._options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize a value, tagging types orjson cannot represent."""
+        tagged = False
+
+        def default(obj: Any) -> Any:
+            nonlocal tagged
+            tagged = True
+            return _tag_rich_type(obj)
+
+        data: bytes = self._orjson.dumps(value, default=default, option=self._options)
+        return self._TAGGED + data if tagged else data
+
+    def decode(self, data: bytes) -> Any:
+        """Deserialize a value, restoring tagged types only when present."""
+        if data[:1] == self._TAGGED:
+            return _untag_rich_types(self._orjson.loads(data[1:]))
+        return self._orjson.loads(data)
+
+
+class MsgpackCodec:
+    """MessagePack: compact binary encoding with full type round-tripping.
+
+    datetimes, dates, times, Decimals, UUIDs, sets and tuples are stored as
+    msgpack extension types and decode to the original Python types.
+    """
+
+    codec_id = 2
+
+    _EXT_TYPES: ClassVar[dict[int, Callable[[str], Any]]] = {
+        1: datetime.fromisoformat,
+        2: date.fromisoformat,
+        3: dt_time.fromisoformat,
+        4: Decimal,
+        5: uuid.UUID,
+    }
+    _BASE_TYPES: ClassVar[tuple[type[Any], ...]] = (int, float, str, bytes, dict, list)
+
+    def __init__(self) -> None:
+        try:
+            import msgpack  # type: ignore[import-untyped]  # noqa: PLC0415  # Optional dependency
+        except ImportError as e:
+            msg = "msgpack is not installed. Install with: uv add msgpack"
+            raise ConfigurationError(msg) from e
+        self._msgpack = msgpack
+
+    def _default(self, obj: Any) -> Any:  # noqa: PLR0911
+        ext = self._msgpack.ExtType
+        if isinstance(obj, datetime):
+            return ext(1, obj.isoformat().encode())
+        if isinstance(obj, date):
+            return ext(2, obj.isoformat().encode())
+        if isinstance(obj, dt_time):
+            return ext(3, obj.isoformat().encode())
+        if isinstance(obj, (Decimal, uuid.UUID)):
+            return ext(4 if isinstance(obj, Decimal) else 5, str(obj).encode())
+        if isinstance(obj, (set, frozenset)):
+            return ext(6, self.encode(list(obj)))
+        if isinstance(obj, tuple):
+            return ext(7, self.encode(list(obj)))
+        # strict_types routes subclasses (e.g. StrEnum) here; store the base type
+        for base in self._BASE_TYPES:
+            if isinstance(obj, base):
+                return base(obj)
+        return str(obj)
+
+    def _ext_hook(self, code: int, data: bytes) -> Any:
+        if code in self._EXT_TYPES:
+            return self._EXT_TYPES[code](data.decode())
+        if code == 6:
+            return set(self.decode(data))
+        if code == 7:
+            return tuple(self.decode(data))
+        return self._msgpack.ExtType(code, data)
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize a value to MessagePack."""
+        data: bytes = self._msgpack.packb(
+            value, default=self._default, strict_types=True, use_bin_type=True
+        )
+        return data
+
+    def decode(self, data: bytes) -> Any:
+        """Deserialize MessagePack, restoring extension types."""
+        return self._msgpack.unpackb(
+            data, ext_hook=self._ext_hook, raw=False, strict_map_key=False
+        )
 
-logger = logging.getLogger(__name__)
 
-T = TypeVar("T")  # Covariant type variable for cached function return types
+def _load_compression(
+    name: str,
+) -> tuple[int, Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    """Return ``(compression_id, compress, decompress)`` for a compression name."""
+    if name == "zlib":
+        return 1, zlib.compress, zlib.decompress
+    if name == "zstd":
+        try:
+            import zstandard  # noqa: PLC0415  # Optional dependency
+        except ImportError as e:
+            msg = "zstandard is not installed. Install with: uv add zstandard"
+            raise ConfigurationError(msg) from e
+        return 2, zstandard.ZstdCompressor().compress, zstandard.decompress
+    if name == "lz4":
+        try:
+            import lz4.frame  # type: ignore[import-untyped]  # noqa: PLC0415  # Optional dependency
+        except ImportError as e:
+            msg = "lz4 is not installed. Install with: uv add lz4"
+            raise ConfigurationError(msg) from e
+        return 3, lz4.frame.compress, lz4.frame.decompress
+    msg = f"Unknown cache compression: {name!r} (expected zlib, zstd or lz4)"
+    raise ConfigurationError(msg)
+
+
+_CODEC_TYPES: dict[int, type[CacheCodec]] = {
+    JsonCodec.codec_id: JsonCodec,
+    OrjsonCodec.codec_id: OrjsonCodec,
+    MsgpackCodec.codec_id: MsgpackCodec,
+}
+_COMPRESSION_NAMES = {1: "zlib", 2: "zstd", 3: "lz4"}
+
+
+class CacheSerializer:
+    """Encodes cache values with a codec and optional compression.
+
+    Payloads of at least ``compress_threshold`` bytes are compressed. Anything
+    other than uncompressed JSON is framed with a one-byte header naming the
+    codec and compression, so decoding never depends on the current settings:
+    entries written by older versions (plain JSON) or with a different codec
+    still decode after a configuration change.
+
+    Args:
+        codec: Codec used for new entries (default: :class:`JsonCodec`)
+        compression: ``"zlib"``, ``"zstd"``, ``"lz4"`` or None
+        compress_threshold: Minimum encoded size in bytes to compress
+
+    Example:
+        >>> configure_serializer(CacheSerializer(MsgpackCodec(), compression="zstd"))
+    """
+
+    def __init__(
+        self,
+        codec: CacheCodec | None = None,
+        compression: str | None = None,
+        compress_threshold: int = 1024,
+    ) -> None:
+        self.codec = codec or JsonCodec()
+        self.compress_threshold = compress_threshold
+        self._compression = _load_compression(compression) if compression else None
+        self._codecs: dict[int, CacheCodec] = {self.codec.codec_id: self.codec}
+        self._decompressors: dict[int, Callable[[bytes], bytes]] = {}
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value, compressing it if it is large enough."""
+        envelope = isinstance(value, _Envelope)
+        data = self.codec.encode(dict(value) if envelope else value)
+        compression_id = 0
+        if self._compression is not None and len(data) >= self.compress_threshold:
+            compression_id, compress, _ = self._compression
+            data = compress(data)
+        if (
+            self.codec.codec_id == JsonCodec.codec_id
+            and compression_id == 0
+            and not envelope
+        ):
+            # Plain JSON stays unframed for compatibility with existing readers
+            return data
+        header = _FRAME_FLAG | (self.codec.codec_id << 3) | compression_id
+        if envelope:
+            header |= _ENVELOPE_FLAG
+        return bytes([header]) + data
+
+    def loads(self, data: bytes) -> Any:
+        """Decode a payload written by any codec and compression."""
+        if not data or not data[0] & _FRAME_FLAG:
+            return json.loads(data)
+
+        codec_id, compression_id = (data[0] >> 3) & 0x0F, data[0] & _COMPRESSION_MASK
+        payload = data[1:]
+        if compression_id:
+            payload = self._decompressor(compression_id)(payload)
+        value = self._codec(codec_id).decode(payload)
+        return _Envelope(value) if data[0] & _ENVELOPE_FLAG else value
+
+    def _codec(self, codec_id: int) -> CacheCodec:
+        if codec_id not in self._codecs:
+            if codec_id not in _CODEC_TYPES:
+                msg = f"Unknown cache codec id: {codec_id}"
+                raise ValueError(msg)
+            self._codecs[codec_id] = _CODEC_TYPES[codec_id]()
+        return self._codecs[codec_id]
+
+    def _decompressor(self, compression_id: int) -> Callable[[bytes], bytes]:
+        if compression_id not in self._decompressors:
+            if compression_id not in _COMPRESSION_NAMES:
+                msg = f"Unknown cache compression id: {compression_id}"
+                raise ValueError(msg)
+            name = _COMPRESSION_NAMES[compression_id]
+            self._decompressors[compression_id] = _load_compression(name)[2]
+        return self._decompressors[compression_id]
+
+
+# Serializer used when a call does not pass its own
+_default_serializer = CacheSerializer()
+
+
+def configure_serializer(serializer: CacheSerializer) -> None:
+    """Set the serializer used by default for all cache operations.
+
+    Call this once at startup. Existing entries remain readable because every
+    payload records how it was encoded.
+
+    Args:
+        serializer: Serializer for new cache entries
+    """
+    global _default_serializer
+    _default_serializer = serializer
+
+
+def _encode(
+    value: Any,
+    key: str,
+    serializer: CacheSerializer | None = None,
+    prefix: str | None = None,
+) -> bytes:
+    """Encode a value for storage, recording encode time and payload size."""
+    metrics = _metrics(prefix or _key_prefix(key))
+    started = time.perf_counter()
+    payload = (serializer or _default_serializer).dumps(value)
+    metrics.encode_time.observe(time.perf_counter() - started)
+    metrics.payload_bytes.observe(len(payload))
+    return payload
+
+
+def _decode(
+    raw: bytes,
+    key: str,
+    serializer: CacheSerializer | None = None,
+    prefix: str | None = None,
+) -> Any:
+    """Decode a stored payload, treating undecodable entries as misses.
+
+    Returns:
+        The decoded value, or ``_MISSING`` if the payload could not be decoded
+    """
+    metrics = _metrics(prefix or _key_prefix(key))
+    started = time.perf_counter()
+    try:
+        return (serializer or _default_serializer).loads(raw)
+    except Exception as e:  # noqa: BLE001  # Corrupt entries must not break callers
+        logger.warning("cache_decode_failed", key=key, error=str(e))
+        metrics.counters["errors"] += 1
+        return _MISSING
+    finally:
+        metrics.decode_time.observe(time.perf_counter() - started)
+
+
+# =============================================================================
+# In-Process L1 Cache
+# =============================================================================
+
+
+class _LocalCache:
+    """Bounded in-process LRU cache with per-entry TTL.
+
+    Sits in front of Redis to serve hot keys without a network round trip or
+    JSON decoding. Values are stored as decoded Python objects and shared
+    between callers, so treat cached results as read-only. Safe to use from
+    several threads. ``max_bytes`` also bounds the approximate total size of
+    the stored values.
+    """
+
+    def __init__(
+        self, name: str, maxsize: int, ttl: float, *, max_bytes: int | None = None
+    ) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        # key -> (expires_at, value, approximate size in bytes)
+        self._entries: OrderedDict[str, tuple[float, Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _remove(self, key: str) -> bool:
+        """Remove a key while holding the lock; True if it was present."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self.total_bytes -= entry[2]
+        return True
+
+    def _over_budget(self) -> bool:
+        """Whether the cache holds more entries or bytes than allowed."""
+        if len(self._entries) > self.maxsize:
+            return True
+        return self.max_bytes is not None and self.total_bytes > self.max_bytes
+
+    def get(self, key: str) -> Any:
+        """Return the cached value, or ``_MISSING`` if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return _MISSING
+
+            expires_at, value, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return _MISSING
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        size = _approx_size(value) if self.max_bytes is not None else 0
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, value, size)
+            self.total_bytes += size
+            while self._entries and self._over_budget():
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        """Remove a single key if present; True if it was."""
+        with self._lock:
+            return self._remove(key)
+
+    def delete_matching(self, pattern: str) -> int:
+        """Remove all keys matching a Redis-style glob pattern."""
+        with self._lock:
+            matched = [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]
+            for key in matched:
+                self._remove(key)
+            return len(matched)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters for this tier."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "bytes": self.total_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / max(lookups, 1)) * 100,
+        }
+
+
+def _approx_size(value: Any) -> int:
+    """Approximate deep size of a value in bytes.
+
+    Sums ``sys.getsizeof`` over the value and everything reachable through
+    builtin containers and instance ``__dict__``s, counting shared objects once.
+    """
+    seen: set[int] = set()
+    pending = [value]
+    total = 0
+    while pending:
+        item = pending.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            pending.extend(item)
+        elif hasattr(item, "__dict__"):
+            pending.append(vars(item))
+    return total
+
+
+# L1 tiers created by @cached and @memoize, used for local invalidation and statistics
+_local_caches: list[_LocalCache] = []
+
+
+def _evict_local(key: str) -> None:
+    """Evict a key from every L1 tier in this process."""
+    for local in _local_caches:
+        local.delete(key)
+
+
+def _evict_local_matching(pattern: str) -> int:
+    """Evict keys matching a glob pattern from every L1 tier in this process."""
+    return sum(local.delete_matching(pattern) for local in _local_caches)
+
+
+def get_local_cache_stats() -> dict[str, dict[str, Any]]:
+    """Get statistics for the in-process L1 tiers.
+
+    Returns:
+        Mapping of L1 tier name (the decorated function's key prefix) to its
+        size and hit/miss counters. L1 hits are requests that never reached Redis.
+    """
+    stats: dict[str, dict[str, Any]] = {}
+    for local in _local_caches:
+        current = stats.setdefault(
+            local.name,
+            {
+                "size": 0,
+                "maxsize": 0,
+                "bytes": 0,
+                "hits": 0,
+                "misses": 0,
+                "evictions": 0,
+            },
+        )
+        for counter, value in local.stats().items():
+            if counter != "hit_rate":
+                current[counter] += value
+    for current in stats.values():
+        lookups = current["hits"] + current["misses"]
+        current["hit_rate"] = (current["hits"] / max(lookups, 1)) * 100
+    return stats
+
+
+def clear_local_caches() -> None:
+    """Clear every L1 tier in this process (useful in tests)."""
+    for local in _local_caches:
+        local.clear()
+    _namespace_generations.clear()
+
+
+# =============================================================================
+# Cross-Process L1 Invalidation
+# =============================================================================
+
+# Pub/sub channel carrying invalidations between processes
+_DEFAULT_INVALIDATION_CHANNEL = "cache:invalidation"
+
+# Identifies this process's own messages, whose evictions already happened
+_PROCESS_ID = uuid.uuid4().hex
+
+# Channel writes are announced on (None until the listener is started)
+_invalidation_channel: str | None = None
+
+_invalidation_listener: asyncio.Task[None] | None = None
+
+
+def _queue_invalidation(
+    pipe: Pipeline,
+    *,
+    keys: Iterable[str] = (),
+    patterns: Iterable[str] = (),
+    namespaces: Iterable[str] = (),
+) -> None:
+    """Queue a PUBLISH telling other processes to drop L1 entries.
+
+    Queued after the write it announces, so by the time other processes evict
+    and reload, Redis already holds the new value.
+    """
+    if _invalidation_channel is None:
+        return
+    message = {
+        "origin": _PROCESS_ID,
+        "keys": list(keys),
+        "patterns": list(patterns),
+        "namespaces": list(namespaces),
+    }
+    pipe.publish(_invalidation_channel, json.dumps(message))
+
+
+async def _publish_invalidation(redis: Redis, **targets: Iterable[str]) -> None:
+    """Publish an invalidation outside of a write pipeline."""
+    if _invalidation_channel is None:
+        return
+    pipe = redis.pipeline(transaction=False)
+    _queue_invalidation(pipe, **targets)
+    await pipe.execute()
+
+
+def _apply_invalidation(data: bytes) -> None:
+    """Evict the L1 entries named in an invalidation message."""
+    try:
+        message = json.loads(data)
+        if message["origin"] == _PROCESS_ID:
+            return
+        for key in message["keys"]:
+            _evict_local(key)
+        for pattern in message["patterns"]:
+            _evict_local_matching(pattern)
+        for namespace in message["namespaces"]:
+            _namespace_generations.pop(namespace, None)
+            _evict_local_matching(f"{namespace}:*")
+    except (ValueError, KeyError, TypeError) as e:
+        logger.warning("cache_invalidation_message_invalid", error=str(e))
+
+
+async def _listen_for_invalidations(channel: str) -> None:
+    """Apply invalidations from other processes, resubscribing after failures."""
+    delay = 0.1
+    while True:
+        redis = await _cache_redis()
+        if isinstance(redis, RedisCluster):
+            # Cluster clients have no pub/sub; any node receives every PUBLISH
+            redis = Redis.from_url(settings.redis_url, decode_responses=False)
+        pubsub = redis.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(channel)
+            # Messages published while unsubscribed are lost; start clean
+            clear_local_caches()
+            logger.info("cache_invalidation_listener_subscribed", channel=channel)
+            delay = 0.1
+            async for message in pubsub.listen():
+                _apply_invalidation(message["data"])
+        except RedisError as e:
+            logger.warning("cache_invalidation_listener_failed", error=str(e))
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 5.0)
+        finally:
+            await pubsub.aclose()
+            if redis is not _redis_pool:
+                await redis.aclose()
+
+
+async def start_invalidation_listener(
+    channel: str = _DEFAULT_INVALIDATION_CHANNEL,
+) -> None:
+    """Keep this process's L1 tiers coherent with writes made anywhere.
+
+    Every cache write and invalidation is then announced on ``channel`` in the
+    same round trip as the write, and a background subscriber evicts the
+    affected L1 entries in this process. Call it on startup in every process
+    that uses ``@cached(l1_maxsize=...)`` or writes to the cache (API workers
+    and ARQ workers alike), so long L1 TTLs stay safe across many pods.
+
+    Delivery is best effort: if the subscription drops, the L1 tiers are
+    cleared on resubscribe, and ``l1_ttl`` still bounds staleness.
+
+    Args:
+        channel: Pub/sub channel shared by all processes using this cache
+
+    Example:
+        >>> @app.on_event("startup")
+        >>> async def startup_event():
+        ...     await start_invalidation_listener()
+    """
+    global _invalidation_channel, _invalidation_listener
+
+    if _invalidation_listener is not None and not _invalidation_listener.done():
+        return
+    _invalidation_channel = channel
+    _invalidation_listener = asyncio.create_task(_listen_for_invalidations(channel))
+
+
+async def stop_invalidation_listener() -> None:
+    """Stop the invalidation subscriber and stop announcing writes."""
+    global _invalidation_channel, _invalidation_listener
+
+    _invalidation_channel = None
+    if _invalidation_listener is not None:
+        _invalidation_listener.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _invalidation_listener
+        _invalidation_listener = None
+
+
+# =============================================================================
+# Storage Backends
+# =============================================================================
+
+
+class CacheBackendError(RedisError):
+    """Raised when a non-Redis backend fails.
+
+    Subclasses ``RedisError`` so cache operations degrade exactly as they do
+    when Redis is unavailable.
+    """
+
+
+class CacheBackend(Protocol):
+    """Stores encoded cache entries.
+
+    ``cached``, ``get_cached``, ``set_cached``, the bulk operations,
+    ``invalidate_pattern`` and ``warm_cache`` all read and write payloads
+    through the configured backend. Tags, namespaces, distributed locks and
+    cross-process L1 invalidation are built on Redis and need ``RedisBackend``.
+    """
+
+    async def get(self, key: str, *, replica_ok: bool = False) -> bytes | None:
+        """Return the payload stored under ``key``, or None.
+
+        ``replica_ok`` marks reads that tolerate replication lag.
+        """
+        ...
+
+    async def get_many(
+        self, keys: Sequence[str], *, replica_ok: bool = False
+    ) -> list[bytes | None]:
+        """Return the payloads stored under ``keys``, in order."""
+        ...
+
+    async def exists(self, key: str) -> bool:
+        """Whether ``key`` holds an unexpired entry."""
+        ...
+
+    async def exists_many(self, keys: Sequence[str]) -> list[bool]:
+        """Whether each of ``keys`` holds an unexpired entry, in one round trip."""
+        ...
+
+    async def set(
+        self, key: str, value: bytes, ttl: int, *, tags: Sequence[str] = ()
+    ) -> None:
+        """Store a payload for ``ttl`` seconds, indexed under ``tags``."""
+        ...
+
+    async def set_many(self, items: Mapping[str, tuple[bytes, int]]) -> None:
+        """Store ``key -> (payload, ttl)`` entries in one round trip."""
+        ...
+
+    async def delete(self, keys: Sequence[str]) -> int:
+        """Delete keys, returning how many existed."""
+        ...
+
+    async def delete_pattern(self, pattern: str) -> int:
+        """Delete keys matching a Redis-style glob, returning how many."""
+        ...
+
+    async def close(self) -> None:
+        """Release connections or file handles."""
+        ...
+
+
+async def _mget(redis: Redis, keys: list[str]) -> list[bytes | None]:
+    """MGET that also works when keys span Redis Cluster slots."""
+    if isinstance(redis, RedisCluster):
+        return await redis.mget_nonatomic(keys)
+    return await redis.mget(keys)
+
+
+async def _unlink_keys(
+    redis: Redis, keys: Sequence[str | bytes], *, announce: bool = True
+) -> int:
+    """UNLINK a batch of keys in one round trip.
+
+    Cluster pipelines route each command by its key, so there every key gets
+    its own UNLINK; elsewhere one UNLINK carries the whole batch. With
+    ``announce``, other processes are told to evict the keys from L1.
+
+    Returns:
+        Number of keys that existed
+    """
+    pipe = redis.pipeline(transaction=False)
+    queued = 1
+    if isinstance(pipe, ClusterPipeline):
+        for key in keys:
+            pipe.unlink(key)
+        queued = len(keys)
+    else:
+        pipe.unlink(*keys)
+    if announce:
+        names = [key.decode() if isinstance(key, bytes) else key for key in keys]
+        _queue_invalidation(pipe, keys=names)
+    return sum((await pipe.execute())[:queued])
+
+
+class RedisBackend:
+    """Redis through the shared binary cache client (the default).
+
+    Writes maintain tag indexes and announce L1 invalidations to other
+    processes in the same pipeline as the write itself.
+    """
+
+    async def get(self, key: str, *, replica_ok: bool = False) -> bytes | None:
+        """GET, from a replica when ``replica_ok`` and replica reads are on."""
+        redis = await (_cache_redis_replica() if replica_ok else _cache_redis())
+        raw = await redis.get(key)
+        return (await _join_chunks(redis, [key], [raw]))[0]
+
+    async def get_many(
+        self, keys: Sequence[str], *, replica_ok: bool = False
+    ) -> list[bytes | None]:
+        """MGET, from a replica when ``replica_ok`` and replica reads are on."""
+        redis = await (_cache_redis_replica() if replica_ok else _cache_redis())
+        keys = list(keys)
+        return await _join_chunks(redis, keys, await _mget(redis, keys))
+
+    async def exists(self, key: str) -> bool:
+        """EXISTS on the primary."""
+        return bool(await (await _cache_redis()).exists(key))
+
+    async def exists_many(self, keys: Sequence[str]) -> list[bool]:
+        """Pipelined EXISTS per key on the primary (multi-key EXISTS only counts)."""
+        pipe = (await _cache_redis()).pipeline(transaction=False)
+        for key in keys:
+            pipe.exists(key)
+        return [bool(found) for found in await pipe.execute()]
+
+    async def set(
+        self, key: str, value: bytes, ttl: int, *, tags: Sequence[str] = ()
+    ) -> None:
+        """SETEX plus tag index updates and an invalidation announcement.
+
+        Large values are split into chunks, written before the manifest that
+        replaces the value under ``key`` (see ``_split_payload``).
+        """
+        pipe = (await _cache_redis()).pipeline(transaction=False)
+        for write_key, payload in (await _split_payload(key, value, ttl)).items():
+            pipe.setex(write_key, ttl, payload)
+        _queue_tag_writes(pipe, key, tags, ttl)
+        _queue_invalidation(pipe, keys=[key])
+        await pipe.execute()
+
+    async def set_many(self, items: Mapping[str, tuple[bytes, int]]) -> None:
+        """Pipelined SETEX for every entry, announced in the same round trip."""
+        pipe = (await _cache_redis()).pipeline(transaction=False)
+        for key, (value, ttl) in items.items():
+            for write_key, payload in (await _split_payload(key, value, ttl)).items():
+                pipe.setex(write_key, ttl, payload)
+        _queue_invalidation(pipe, keys=list(items))
+        await pipe.execute()
+
+    async def delete(self, keys: Sequence[str]) -> int:
+        """UNLINK keys, along with any chunks they point to, and announce them."""
+        return await _unlink_entries(await _cache_redis(), keys)
+
+    async def delete_pattern(self, pattern: str) -> int:
+        """Stream matching keys from SCAN into UNLINK, then announce the pattern."""
+        redis = await _cache_redis()
+        progress = InvalidationProgress(pattern)
+        await _unlink_matching(redis, progress)
+        await _publish_invalidation(redis, patterns=[pattern])
+        return progress.deleted
+
+    async def close(self) -> None:
+        """Close the shared Redis clients."""
+        await close_redis()
+
+
+class MemoryBackend:
+    """Process-local backend for tests, benchmarks and single-process CLIs.
+
+    Entries are kept encoded, exactly as Redis stores them, so serialization
+    and stale-while-revalidate envelopes behave as in production. With
+    ``maxsize``, the least recently used entries are evicted beyond that size.
+    """
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def _lookup(self, key: str) -> bytes | None:
+        """Return an unexpired payload, dropping it if it has expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key: str, value: bytes, ttl: int) -> None:
+        """Store a payload, evicting the least recently used entries if full."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while self.maxsize is not None and len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def get(self, key: str, *, replica_ok: bool = False) -> bytes | None:
+        """Return the payload stored under ``key``, or None."""
+        return self._lookup(key)
+
+    async def get_many(
+        self, keys: Sequence[str], *, replica_ok: bool = False
+    ) -> list[bytes | None]:
+        """Return the payloads stored under ``keys``, in order."""
+        return [self._lookup(key) for key in keys]
+
+    async def exists(self, key: str) -> bool:
+        """Whether ``key`` holds an unexpired entry."""
+        return self._lookup(key) is not None
+
+    async def exists_many(self, keys: Sequence[str]) -> list[bool]:
+        """Whether each of ``keys`` holds an unexpired entry."""
+        return [self._lookup(key) is not None for key in keys]
+
+    async def set(
+        self, key: str, value: bytes, ttl: int, *, tags: Sequence[str] = ()
+    ) -> None:
+        """Store a payload for ``ttl`` seconds (tags need Redis and are ignored)."""
+        self._store(key, value, ttl)
+
+    async def set_many(self, items: Mapping[str, tuple[bytes, int]]) -> None:
+        """Store ``key -> (payload, ttl)`` entries."""
+        for key, (value, ttl) in items.items():
+            self._store(key, value, ttl)
+
+    async def delete(self, keys: Sequence[str]) -> int:
+        """Delete keys, returning how many existed."""
+        existing = [key for key in keys if self._lookup(key) is not None]
+        for key in existing:
+            del self._entries[key]
+        return len(existing)
+
+    async def delete_pattern(self, pattern: str) -> int:
+        """Delete keys matching a Redis-style glob, returning how many."""
+        matched = [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]
+        return await self.delete(matched)
+
+    async def close(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+
+class DiskBackend:
+    """SQLite file backend for large, rarely changing values.
+
+    Entries survive restarts and are shared by every process on the host
+    without a network hop, which suits batch jobs and CLIs. Queries run in a
+    worker thread so the event loop never waits on disk I/O, and WAL mode lets
+    other processes read while one writes. Expired rows are skipped on read
+    and purged at most every ``purge_interval`` seconds, on write.
+    """
+
+    def __init__(self, path: str | Path, *, purge_interval: float = 300.0) -> None:
+        self.path = Path(path)
+        self.purge_interval = purge_interval
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._next_purge = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use, creating the table if needed."""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS cache_entries ("
+                    "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS cache_entries_expiry "
+                    "ON cache_entries (expires_at)"
+                )
+            self._connection = connection
+        return self._connection
+
+    async def _run(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        """Run ``operation`` against the database in a worker thread."""
+
+        def call() -> T:
+            with self._lock:
+                return operation(self._connect())
+
+        try:
+            return await asyncio.to_thread(call)
+        except sqlite3.Error as e:
+            raise CacheBackendError(str(e)) from e
+
+    def _write(
+        self, connection: sqlite3.Connection, rows: Iterable[tuple[str, bytes, int]]
+    ) -> None:
+        """Upsert ``(key, payload, ttl)`` rows, purging expired ones when due."""
+        now = time.time()
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO cache_entries VALUES (?, ?, ?)",
+                [(key, value, now + ttl) for key, value, ttl in rows],
+            )
+            if now >= self._next_purge:
+                connection.execute(
+                    "DELETE FROM cache_entries WHERE expires_at <= ?", (now,)
+                )
+                self._next_purge = now + self.purge_interval
+
+    async def get(self, key: str, *, replica_ok: bool = False) -> bytes | None:
+        """Return the payload stored under ``key``, or None."""
+        return (await self.get_many([key]))[0]
+
+    async def get_many(
+        self, keys: Sequence[str], *, replica_ok: bool = False
+    ) -> list[bytes | None]:
+        """Return the payloads stored under ``keys``, in order."""
+
+        def select(connection: sqlite3.Connection) -> list[bytes | None]:
+            now = time.time()
+            values = []
+            for key in keys:
+                row = connection.execute(
+                    "SELECT value FROM cache_entries WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                ).fetchone()
+                values.append(None if row is None else row[0])
+            return values
+
+        return await self._run(select)
+
+    async def exists(self, key: str) -> bool:
+        """Whether ``key`` holds an unexpired entry."""
+        return (await self.exists_many([key]))[0]
+
+    async def exists_many(self, keys: Sequence[str]) -> list[bool]:
+        """Whether each of ``keys`` holds an unexpired entry (values are not read)."""
+
+        def select(connection: sqlite3.Connection) -> list[bool]:
+            now = time.time()
+            return [
+                connection.execute(
+                    "SELECT 1 FROM cache_entries WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                ).fetchone()
+                is not None
+                for key in keys
+            ]
+
+        return await self._run(select)
+
+    async def set(
+        self, key: str, value: bytes, ttl: int, *, tags: Sequence[str] = ()
+    ) -> None:
+        """Store a payload for ``ttl`` seconds (tags need Redis and are ignored)."""
+        await self._run(lambda connection: self._write(connection, [(key, value, ttl)]))
+
+    async def set_many(self, items: Mapping[str, tuple[bytes, int]]) -> None:
+        """Store ``key -> (payload, ttl)`` entries in one transaction."""
+        rows = [(key, value, ttl) for key, (value, ttl) in items.items()]
+        await self._run(lambda connection: self._write(connection, rows))
+
+    async def delete(self, keys: Sequence[str]) -> int:
+        """Delete keys, returning how many existed."""
+
+        def delete(connection: sqlite3.Connection) -> int:
+            with connection:
+                return sum(
+                    connection.execute(
+                        "DELETE FROM cache_entries WHERE key = ?", (key,)
+                    ).rowcount
+                    for key in keys
+                )
+
+        return await self._run(delete)
+
+    async def delete_pattern(self, pattern: str) -> int:
+        """Delete keys matching a glob (SQLite GLOB matches Redis's syntax)."""
+
+        def delete(connection: sqlite3.Connection) -> int:
+            with connection:
+                return connection.execute(
+                    "DELETE FROM cache_entries WHERE key GLOB ?", (pattern,)
+                ).rowcount
+
+        return await self._run(delete)
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+# Where cache entries are stored (created from settings on first use)
+_backend: CacheBackend | None = None
+
+
+def _create_backend() -> CacheBackend:
+    """Build the backend selected by ``CACHE_BACKEND``."""
+    if settings.cache_backend == "memory":
+        return MemoryBackend()
+    if settings.cache_backend == "disk":
+        return DiskBackend(settings.cache_disk_path)
+    return RedisBackend()
+
+
+def get_cache_backend() -> CacheBackend:
+    """Get the backend cache entries are stored in.
+
+    Chosen with ``CACHE_BACKEND`` (redis, memory or disk) unless replaced
+    with ``configure_cache_backend``.
+    """
+    global _backend
+
+    if _backend is None:
+        _backend = _create_backend()
+    return _backend
+
+
+def configure_cache_backend(backend: CacheBackend) -> None:
+    """Store cache entries in ``backend`` from now on.
+
+    Example:
+        >>> # Tests and CI without a Redis service
+        >>> configure_cache_backend(MemoryBackend())
+
+        >>> # Batch job: persistent local cache, no network hop
+        >>> configure_cache_backend(DiskBackend("/var/cache/myjob.sqlite3"))
+    """
+    global _backend
+
+    _backend = backend
+
+
+# =============================================================================
+# Large Values
+# =============================================================================
+
+# Starts a manifest stored in place of a large value. Framed payloads begin
+# with a byte with the high bit set and legacy JSON with text, never a NUL.
+_MANIFEST_MAGIC = b"\x00cache-chunks\x00"
+
+# Bytes read from the head of each deleted key to spot manifests
+_MANIFEST_HEAD_BYTES = 256
+
+
+class CacheValueTooLargeError(CacheBackendError):
+    """Raised when a payload exceeds ``CACHE_MAX_VALUE_BYTES``.
+
+    Like any backend error, writes fail softly: ``set_cached`` returns False
+    and decorated functions still return their result.
+    """
+
+
+# Disk store for values over the size limit (CACHE_OVERSIZE_ACTION=disk)
+_overflow: DiskBackend | None = None
+
+
+def _overflow_backend() -> DiskBackend:
+    """Get the SQLite store oversized values are diverted to."""
+    global _overflow
+
+    if _overflow is None:
+        _overflow = DiskBackend(settings.cache_disk_path)
+    return _overflow
+
+
+def _chunk_keys(key: str, count: int) -> list[str]:
+    """Keys holding the chunks of a large value stored under ``key``."""
+    return [f"{key}:chunk:{index}" for index in range(count)]
+
+
+def _payload_digest(payload: bytes) -> str:
+    """Checksum verifying a reassembled payload."""
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _manifest(payload: bytes, chunks: int, *, disk: bool = False) -> bytes:
+    """Encode the manifest stored in place of a chunked or diverted payload."""
+    body = {"n": chunks, "size": len(payload), "digest": _payload_digest(payload)}
+    if disk:
+        body["disk"] = True
+    return _MANIFEST_MAGIC + json.dumps(body).encode()
+
+
+def _parse_manifest(raw: Any) -> dict[str, Any] | None:
+    """Decode a manifest, or return None if ``raw`` is an ordinary payload."""
+    if not (isinstance(raw, bytes) and raw.startswith(_MANIFEST_MAGIC)):
+        return None
+    return json.loads(raw[len(_MANIFEST_MAGIC) :])
+
+
+async def _split_payload(key: str, value: bytes, ttl: int) -> dict[str, bytes]:
+    """Plan the Redis writes for one payload, in the order they must happen.
+
+    Payloads over ``CACHE_CHUNK_SIZE`` become chunks followed by a manifest
+    under ``key``, so each SETEX stays small and Redis serves other clients
+    in between instead of stalling on one multi-megabyte write. Payloads over
+    ``CACHE_MAX_VALUE_BYTES`` are rejected, or written to the disk store with
+    a manifest pointing there when ``CACHE_OVERSIZE_ACTION`` is disk.
+
+    Raises:
+        CacheValueTooLargeError: If the payload is over the limit and rejected
+    """
+    size = len(value)
+    limit = settings.cache_max_value_bytes
+    if limit and size > limit:
+        _metrics(_key_prefix(key)).counters["oversized"] += 1
+        if settings.cache_oversize_action != "disk":
+            msg = f"{key} is {size} bytes, over CACHE_MAX_VALUE_BYTES ({limit})"
+            raise CacheValueTooLargeError(msg)
+        await _overflow_backend().set(key, value, ttl)
+        return {key: _manifest(value, 0, disk=True)}
+
+    chunk_size = settings.cache_chunk_size
+    if not chunk_size or size <= chunk_size:
+        return {key: value}
+
+    _metrics(_key_prefix(key)).counters["chunked"] += 1
+    offsets = range(0, size, chunk_size)
+    writes = {
+        chunk_key: value[offset : offset + chunk_size]
+        for chunk_key, offset in zip(
+            _chunk_keys(key, len(offsets)), offsets, strict=True
+        )
+    }
+    writes[key] = _manifest(value, len(offsets))
+    return writes
+
+
+def _verified(
+    key: str, manifest: dict[str, Any], payload: bytes | None
+) -> bytes | None:
+    """Return a reassembled payload if it matches its manifest, else None."""
+    if (
+        payload is None
+        or len(payload) != manifest["size"]
+        or _payload_digest(payload) != manifest["digest"]
+    ):
+        # A chunk expired or was evicted, or a concurrent write interleaved
+        logger.warning("cache_chunks_invalid", key=key)
+        return None
+    return payload
+
+
+async def _join_chunks(
+    redis: Redis, keys: list[str], raws: list[bytes | None]
+) -> list[bytes | None]:
+    """Replace any manifests among ``raws`` with the payloads they describe.
+
+    Every chunk of every manifest is fetched in one more MGET; reassembled
+    payloads whose size or checksum do not match read as misses.
+    """
+    manifests = {
+        index: manifest
+        for index, raw in enumerate(raws)
+        if (manifest := _parse_manifest(raw)) is not None
+    }
+    if not manifests:
+        return raws
+
+    chunked = [i for i, manifest in manifests.items() if not manifest.get("disk")]
+    chunk_keys = [_chunk_keys(keys[index], manifests[index]["n"]) for index in chunked]
+    chunks = iter(await _mget(redis, [k for group in chunk_keys for k in group]))
+    joined = list(raws)
+    for index, group in zip(chunked, chunk_keys, strict=True):
+        parts = [part for _ in group if (part := next(chunks)) is not None]
+        payload = b"".join(parts) if len(parts) == len(group) else None
+        joined[index] = _verified(keys[index], manifests[index], payload)
+
+    diverted = [index for index in manifests if index not in chunked]
+    if diverted:
+        payloads = await _overflow_backend().get_many([keys[i] for i in diverted])
+        for index, payload in zip(diverted, payloads, strict=True):
+            joined[index] = _verified(keys[index], manifests[index], payload)
+    return joined
+
+
+async def _unlink_entries(
+    redis: Redis, keys: Sequence[str | bytes], *, announce: bool = True
+) -> int:
+    """UNLINK cache entries along with the chunks of any large values among them.
+
+    Reads only the head of each value, in one pipelined round trip, to find
+    manifests. Values diverted to disk are deleted there.
+
+    Returns:
+        Number of entries that existed (chunks are not counted)
+    """
+    names = [key.decode() if isinstance(key, bytes) else key for key in keys]
+    pipe = redis.pipeline(transaction=False)
+    for key in names:
+        pipe.getrange(key, 0, _MANIFEST_HEAD_BYTES - 1)
+    heads = await pipe.execute(raise_on_error=False)
+
+    chunk_keys = []
+    diverted = []
+    for key, head in zip(names, heads, strict=True):
+        manifest = _parse_manifest(head)
+        if manifest is None:
+            continue
+        if manifest.get("disk"):
+            diverted.append(key)
+        chunk_keys.extend(_chunk_keys(key, manifest["n"]))
+
+    deleted = await _unlink_keys(redis, names, announce=announce)
+    if chunk_keys:
+        await _unlink_keys(redis, chunk_keys, announce=False)
+    if diverted:
+        await _overflow_backend().delete(diverted)
+    return deleted
+
+
+# =============================================================================
+# Stale-While-Revalidate Entries
+# =============================================================================
+
+# Marks a stored value wrapped with its compute time and soft expiry
+_ENVELOPE_MARKER = "__swr__"
+
+
+def _wrap_entry(value: Any, compute_time: float, soft_expiry: float) -> _Envelope:
+    """Wrap a value together with its compute time and soft expiry."""
+    return _Envelope(
+        {_ENVELOPE_MARKER: 1, "v": value, "d": compute_time, "x": soft_expiry}
+    )
+
+
+def _unwrap_entry(data: Any) -> tuple[Any, float, float | None]:
+    """Split a decoded entry into ``(value, compute_time, soft_expiry)``.
+
+    Plain (non-envelope) values have no soft expiry and are always fresh.
+    Negative entries unwrap to None; cached exceptions to ``_MISSING``, since
+    only the decorator that stored them can re-raise them.
+    """
+    if isinstance(data, _Envelope):
+        if data.get(_ENVELOPE_MARKER) == 1:
+            return data["v"], data["d"], data["x"]
+        if data.get(_NEGATIVE_MARKER) == 1:
+            return None, 0.0, None
+        if data.get(_ERROR_MARKER) == 1:
+            return _MISSING, 0.0, None
+    return data, 0.0, None
+
+
+def _refresh_due(compute_time: float, soft_expiry: float, beta: float) -> bool:
+    """Decide whether an entry should be recomputed now.
+
+    Past its soft expiry an entry is stale and always refreshed. Before that,
+    XFetch refreshes early with a probability that rises as expiry approaches
+    and with the cost of recomputation (``compute_time * beta``), spreading
+    refreshes out instead of letting every key fall off a cliff at once.
+    """
+    now = time.time()
+    if now >= soft_expiry:
+        return True
+    if beta <= 0:
+        return False
+    # 1 - random() is in (0, 1], keeping log() finite; not used for security
+    jitter = -math.log(1.0 - random.random())  # noqa: S311
+    return now + compute_time * beta * jitter >= soft_expiry
+
+
+# =============================================================================
+# Negative and Error Entries
+# =============================================================================
+
+# Marks a cached "not found" (None) result, stored with its own shorter TTL
+_NEGATIVE_MARKER = "__none__"
+
+# Marks a cached exception: its type, args and instance attributes
+_ERROR_MARKER = "__error__"
+
+
+def _type_name(cls: type) -> str:
+    """Fully qualified name of a class."""
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _error_entry(error: BaseException) -> _Envelope:
+    """Encode an exception so ``_restore_error`` can rebuild it."""
+    # Round-trip through JSON so any codec can store the attributes
+    state = json.loads(json.dumps(vars(error), default=str))
+    return _Envelope(
+        {
+            _ERROR_MARKER: 1,
+            "t": _type_name(type(error)),
+            "a": json.loads(json.dumps(error.args, default=str)),
+            "s": state,
+        }
+    )
+
+
+def _restore_error(
+    data: Any, allowed: tuple[type[BaseException], ...]
+) -> BaseException | None:
+    """Rebuild a cached exception whose type is one of ``allowed`` (or a subclass).
+
+    Only those types are ever instantiated, so a cache entry cannot make this
+    process construct arbitrary classes. The constructor is bypassed (as
+    unpickling does), so keyword-only exception signatures are fine.
+
+    Returns:
+        The exception, or None if ``data`` is not a cached exception of an
+        allowed type
+    """
+    if not (isinstance(data, _Envelope) and data.get(_ERROR_MARKER) == 1):
+        return None
+    pending = list(allowed)
+    while pending:
+        cls = pending.pop()
+        if _type_name(cls) == data["t"]:
+            error = cls.__new__(cls)
+            error.args = tuple(data["a"])
+            error.__dict__.update(data["s"])
+            return error
+        pending.extend(cls.__subclasses__())
+    return None
+
+
+# =============================================================================
+# Distributed Locks
+# =============================================================================
+
+# Take the lock if free; with a fencing counter key, return the next fencing
+# token (-1 without one). 0 means the lock is held.
+_ACQUIRE_LOCK_SCRIPT = """
+if not redis.call("set", KEYS[1], ARGV[1], "NX", "PX", ARGV[2]) then
+    return 0
+end
+if KEYS[2] then
+    return redis.call("incr", KEYS[2])
+end
+return -1
+"""
+
+# Push the expiry back only if we still own the lock
+_EXTEND_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("pexpire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# Delete the lock only if we still own it (compare-and-delete)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Histogram bucket upper bounds for lock wait and hold times
+_LOCK_BUCKETS = (0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0, 60.0, 300.0)
+
+
+class LockTimeoutError(TimeoutError):
+    """Raised by ``async with DistributedLock(...)`` when the lock stays taken."""
+
+
+class LockStore(Protocol):
+    """Keeps lock ownership and fencing counters for ``DistributedLock``."""
+
+    async def acquire(
+        self, name: str, owner: str, ttl_ms: int, *, fencing: bool
+    ) -> int | None:
+        """Take a free lock for ``ttl_ms``.
+
+        Returns:
+            The new fencing token (0 without ``fencing``), or None if the lock
+            is held
+        """
+        ...
+
+    async def extend(self, name: str, owner: str, ttl_ms: int) -> bool:
+        """Expire the lock ``ttl_ms`` from now if ``owner`` still holds it."""
+        ...
+
+    async def release(self, name: str, owner: str) -> bool:
+        """Release the lock if ``owner`` still holds it."""
+        ...
+
+    async def locked(self, name: str) -> bool:
+        """Whether anyone holds the lock."""
+        ...
+
+
+class RedisLockStore:
+    """Locks in Redis, shared by every process and pod (used with ``RedisBackend``).
+
+    A lock and its fencing counter share a hash tag, so Redis Cluster keeps
+    both in the slot the acquire script runs against. Fencing counters never
+    expire, keeping tokens increasing across the lock's whole lifetime.
+    """
+
+    @staticmethod
+    def _keys(name: str) -> tuple[str, str]:
+        """Lock key and fencing counter key."""
+        lock_key = "lock:{" + name + "}"
+        return lock_key, f"{lock_key}:fence"
+
+    async def acquire(
+        self, name: str, owner: str, ttl_ms: int, *, fencing: bool
+    ) -> int | None:
+        """SET NX PX plus INCR of the fencing counter, atomically."""
+        lock_key, fence_key = self._keys(name)
+        script = (await _cache_redis()).register_script(_ACQUIRE_LOCK_SCRIPT)
+        keys = [lock_key, fence_key] if fencing else [lock_key]
+        token = await script(keys=keys, args=[owner, ttl_ms])
+        return None if token == 0 else max(token, 0)
+
+    async def extend(self, name: str, owner: str, ttl_ms: int) -> bool:
+        """Compare-and-PEXPIRE."""
+        script = (await _cache_redis()).register_script(_EXTEND_LOCK_SCRIPT)
+        return bool(await script(keys=[self._keys(name)[0]], args=[owner, ttl_ms]))
+
+    async def release(self, name: str, owner: str) -> bool:
+        """Compare-and-delete."""
+        script = (await _cache_redis()).register_script(_RELEASE_LOCK_SCRIPT)
+        return bool(await script(keys=[self._keys(name)[0]], args=[owner]))
+
+    async def locked(self, name: str) -> bool:
+        """EXISTS on the lock key."""
+        return bool(await (await _cache_redis()).exists(self._keys(name)[0]))
+
+
+class MemoryLockStore:
+    """Process-local locks for tests and single-process runs.
+
+    Used by default with the memory and disk backends; like them it needs no
+    Redis service, but only excludes tasks within this process.
+    """
+
+    def __init__(self) -> None:
+        self._owners: dict[str, tuple[str, float]] = {}
+        self._fences: dict[str, int] = {}
+
+    def _holder(self, name: str) -> str | None:
+        """Current owner of an unexpired lock, dropping it if it has expired."""
+        entry = self._owners.get(name)
+        if entry is not None and entry[1] <= time.monotonic():
+            del self._owners[name]
+            entry = None
+        return None if entry is None else entry[0]
+
+    async def acquire(
+        self, name: str, owner: str, ttl_ms: int, *, fencing: bool
+    ) -> int | None:
+        """Take the lock if free, returning the next fencing token."""
+        if self._holder(name) is not None:
+            return None
+        self._owners[name] = (owner, time.monotonic() + ttl_ms / 1000)
+        if not fencing:
+            return 0
+        self._fences[name] = self._fences.get(name, 0) + 1
+        return self._fences[name]
+
+    async def extend(self, name: str, owner: str, ttl_ms: int) -> bool:
+        """Push the expiry back if ``owner`` still holds the lock."""
+        if self._holder(name) != owner:
+            return False
+        self._owners[name] = (owner, time.monotonic() + ttl_ms / 1000)
+        return True
+
+    async def release(self, name: str, owner: str) -> bool:
+        """Release the lock if ``owner`` still holds it."""
+        if self._holder(name) != owner:
+            return False
+        del self._owners[name]
+        return True
+
+    async def locked(self, name: str) -> bool:
+        """Whether anyone holds the lock."""
+        return self._holder(name) is not None
+
+
+# Shared by every lock in this process when the backend is not Redis
+_memory_lock_store = MemoryLockStore()
+
+
+def _default_lock_store() -> LockStore:
+    """Redis locks with the Redis backend, process-local locks otherwise."""
+    if isinstance(get_cache_backend(), RedisBackend):
+        return RedisLockStore()
+    return _memory_lock_store
+
+
+class _LockMetrics:
+    """Contention counters and wait/hold times for locks sharing a prefix."""
+
+    COUNTERS: ClassVar[tuple[str, ...]] = (
+        "acquired",
+        "contended",
+        "timeouts",
+        "extended",
+        "lost",
+    )
+
+    def __init__(self) -> None:
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+        self.wait = _Histogram(_LOCK_BUCKETS)
+        self.hold = _Histogram(_LOCK_BUCKETS)
+
+
+# Lock metrics by name prefix (the part before the first ":")
+_lock_metrics: dict[str, _LockMetrics] = {}
+
+
+def _lock_metrics_for(name: str) -> _LockMetrics:
+    """Metrics for a lock's prefix, created on first use."""
+    prefix = _key_prefix(name)
+    metrics = _lock_metrics.get(prefix)
+    if metrics is None:
+        metrics = _lock_metrics[prefix] = _LockMetrics()
+    return metrics
+
+
+def get_lock_metrics() -> dict[str, dict[str, Any]]:
+    """Get per-prefix lock metrics recorded by this process.
+
+    Returns:
+        Mapping of lock name prefix to its counters and wait and hold time
+        summaries
+    """
+    return {
+        prefix: {
+            **metrics.counters,
+            "wait_seconds": metrics.wait.summary(),
+            "hold_seconds": metrics.hold.summary(),
+        }
+        for prefix, metrics in sorted(_lock_metrics.items())
+    }
+
+
+class DistributedLock:
+    """Async mutual exclusion across processes and pods.
+
+    The lock expires after ``ttl`` seconds so a crashed holder cannot block
+    everyone forever; with ``auto_extend`` a background task pushes the
+    expiry back every ``ttl / 3`` seconds while the holder is alive, so long
+    critical sections keep it. Waiters retry with full-jitter exponential
+    backoff (``backoff`` doubling up to ``max_backoff``) for at most
+    ``timeout`` seconds (None waits indefinitely, 0 tries once).
+
+    Expiry means a paused holder can outlive its lock. Each acquisition gets a
+    ``fencing_token`` larger than every earlier one; pass it along with
+    writes so the resource can reject a stale holder's late writes.
+
+    Locks live in Redis with ``RedisBackend`` and in process memory with the
+    other backends (see ``LockStore``), or in the ``store`` given.
+
+    Example:
+        >>> async with DistributedLock("reports:nightly", ttl=60) as lock:
+        ...     await build_report(fencing_token=lock.fencing_token)
+
+        >>> # Skip the work if another worker already has it
+        >>> lock = DistributedLock("jobs:cleanup", timeout=0)
+        >>> if await lock.acquire():
+        ...     try:
+        ...         await cleanup()
+        ...     finally:
+        ...         await lock.release()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        ttl: float = 30.0,
+        timeout: float | None = 10.0,
+        auto_extend: bool = True,
+        fencing: bool = True,
+        backoff: float = 0.05,
+        max_backoff: float = 1.0,
+        store: LockStore | None = None,
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.timeout = timeout
+        self.auto_extend = auto_extend
+        self.fencing = fencing
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.fencing_token: int | None = None
+        self._store = store
+        self._owner: str | None = None
+        self._acquired_at = 0.0
+        self._extender: asyncio.Task[None] | None = None
+        self._lost = False
+
+    @property
+    def store(self) -> LockStore:
+        """Where this lock is kept."""
+        if self._store is None:
+            self._store = _default_lock_store()
+        return self._store
+
+    @property
+    def held(self) -> bool:
+        """Whether this instance holds the lock, as far as it knows."""
+        return self._owner is not None and not self._lost
+
+    @property
+    def lost(self) -> bool:
+        """Whether auto-extension found the lock expired or taken over."""
+        return self._lost
+
+    @property
+    def _ttl_ms(self) -> int:
+        return max(1, int(self.ttl * 1000))
+
+    async def acquire(self, *, blocking: bool = True) -> bool:
+        """Take the lock, waiting up to ``timeout`` seconds unless not ``blocking``.
+
+        Returns:
+            True if the lock was acquired
+        """
+        metrics = _lock_metrics_for(self.name)
+        owner = uuid.uuid4().hex
+        started = time.monotonic()
+        deadline = None if self.timeout is None else started + self.timeout
+        delay = self.backoff
+        token = await self.store.acquire(
+            self.name, owner, self._ttl_ms, fencing=self.fencing
+        )
+        if token is None:
+            metrics.counters["contended"] += 1
+        while token is None:
+            remaining = math.inf if deadline is None else deadline - time.monotonic()
+            if not blocking or remaining <= 0:
+                metrics.counters["timeouts"] += blocking
+                metrics.wait.observe(time.monotonic() - started)
+                return False
+            # Full jitter keeps waiters from retrying in lockstep
+            await asyncio.sleep(min(random.uniform(0, delay), remaining))  # noqa: S311
+            delay = min(delay * 2, self.max_backoff)
+            token = await self.store.acquire(
+                self.name, owner, self._ttl_ms, fencing=self.fencing
+            )
+
+        self._owner, self.fencing_token, self._lost = owner, token or None, False
+        self._acquired_at = time.monotonic()
+        metrics.counters["acquired"] += 1
+        metrics.wait.observe(self._acquired_at - started)
+        if self.auto_extend:
+            self._extender = asyncio.ensure_future(self._keep_alive(owner))
+        return True
+
+    async def _keep_alive(self, owner: str) -> None:
+        """Extend the lock every third of its TTL until released or lost."""
+        metrics = _lock_metrics_for(self.name)
+        while True:
+            await asyncio.sleep(self.ttl / 3)
+            try:
+                extended = await self.store.extend(self.name, owner, self._ttl_ms)
+            except RedisError as e:
+                # Transient: the lock is still ours until its TTL runs out
+                logger.warning("lock_extend_failed", lock=self.name, error=str(e))
+                continue
+            if not extended:
+                self._lost = True
+                metrics.counters["lost"] += 1
+                logger.warning("lock_lost", lock=self.name)
+                return
+            metrics.counters["extended"] += 1
+
+    async def extend(self, ttl: float | None = None) -> bool:
+        """Expire the lock ``ttl`` seconds (default: the lock's TTL) from now.
+
+        Returns:
+            False if this instance no longer holds the lock
+        """
+        if self._owner is None:
+            return False
+        ttl_ms = self._ttl_ms if ttl is None else max(1, int(ttl * 1000))
+        extended = await self.store.extend(self.name, self._owner, ttl_ms)
+        self._lost = self._lost or not extended
+        return extended
+
+    async def release(self) -> None:
+        """Release the lock if this instance holds it."""
+        if self._owner is None:
+            return
+        owner, self._owner = self._owner, None
+        if self._extender is not None:
+            self._extender.cancel()
+            self._extender = None
+        _lock_metrics_for(self.name).hold.observe(time.monotonic() - self._acquired_at)
+        if not await self.store.release(self.name, owner) and not self._lost:
+            # Held past its TTL: someone else may have run concurrently
+            logger.warning("lock_expired_before_release", lock=self.name)
+
+    async def locked(self) -> bool:
+        """Whether anyone (this instance included) holds the lock."""
+        return await self.store.locked(self.name)
+
+    async def __aenter__(self) -> DistributedLock:
+        if not await self.acquire():
+            msg = f"Timed out waiting for lock {self.name!r}"
+            raise LockTimeoutError(msg)
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.release()
+
+
+# =============================================================================
+# Request Coalescing (Single-Flight)
+# =============================================================================
+
+# Recomputations in progress in this process, keyed by cache key
+_inflight: dict[str, asyncio.Task[Any]] = {}
+
+# Strong references to fire-and-forget refresh tasks
+_background_tasks: set[asyncio.Task[Any]] = set()
+
+
+async def _single_flight(key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+    """Run ``compute`` once per key; concurrent callers share its result.
+
+    The computation runs in its own task, so a cancelled caller does not
+    cancel the work other callers are waiting on.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(compute())
+        _inflight[key] = task
+
+        def _done(finished: asyncio.Task[Any]) -> None:
+            if _inflight.get(key) is finished:
+                del _inflight[key]
+
+        task.add_done_callback(_done)
+    else:
+        logger.debug("cache_miss_coalesced", key=key)
+
+    return await asyncio.shield(task)
+
+
+def _run_in_background(
+    work: Awaitable[Any], failure_event: str, **context: Any
+) -> asyncio.Task[Any]:
+    """Run ``work`` as a fire-and-forget task, logging it if it fails."""
+
+    def _done(finished: asyncio.Task[Any]) -> None:
+        _background_tasks.discard(finished)
+        if not finished.cancelled() and finished.exception() is not None:
+            logger.warning(failure_event, error=str(finished.exception()), **context)
+
+    task = asyncio.ensure_future(work)
+    _background_tasks.add(task)
+    task.add_done_callback(_done)
+    return task
+
+
+def _schedule_refresh(key: str, compute: Callable[[], Awaitable[Any]]) -> None:
+    """Recompute a key in the background unless a refresh is already running."""
+    if key in _inflight:
+        return
+
+    _run_in_background(_single_flight(key, compute), "cache_refresh_failed", key=key)
+    logger.debug("cache_refresh_scheduled", key=key)
+
+
+async def _wait_for_lock_holder(
+    lock: DistributedLock,
+    key: str,
+    lock_ttl_ms: int,
+    *,
+    poll_interval: float,
+    serializer: CacheSerializer | None = None,
+) -> Any:
+    """Poll for the value another worker is computing.
+
+    Returns:
+        The decoded value, or ``_MISSING`` if the lock expired or was released
+        without the value appearing.
+    """
+    deadline = time.monotonic() + lock_ttl_ms / 1000
+    while time.monotonic() < deadline:
+        await asyncio.sleep(poll_interval)
+        raw = await get_cache_backend().get(key)
+        if raw is not None:
+            value = _decode(raw, key, serializer)
+            if value is not _MISSING:
+                return _unwrap_entry(value)[0]
+        if not await lock.locked():
+            break
+    return _MISSING
+
+
+async def _store_entry(
+    backend: CacheBackend,
+    key: str,
+    entry: Any,
+    ttl: int,
+    *,
+    serializer: CacheSerializer | None,
+    tags: Sequence[str],
+    metrics_prefix: str | None,
+) -> None:
+    """Encode and store a computed entry; storage failures are only logged."""
+    metrics = _metrics(metrics_prefix or _key_prefix(key))
+    try:
+        payload = _encode(entry, key, serializer, metrics_prefix)
+        started = time.perf_counter()
+        await backend.set(key, payload, ttl, tags=tags)
+        metrics.set_latency.observe(time.perf_counter() - started)
+    except RedisError as e:
+        logger.warning("cache_set_failed", key=key, error=str(e))
+        metrics.counters["errors"] += 1
+
+
+async def _compute_and_store(
+    value_fn: Callable[[], Awaitable[Any]],
+    store: Callable[[Any, int], Awaitable[None]],
+    ttl: int,
+    *,
+    stale_ttl: int | None,
+    negative_ttl: int | None,
+    cache_exceptions: tuple[type[BaseException], ...],
+    exception_ttl: int,
+) -> Any:
+    """Run ``value_fn`` and store its result, None or listed exception."""
+    started = time.monotonic()
+    try:
+        result = await value_fn()
+    except cache_exceptions as e:
+        await store(_error_entry(e), exception_ttl)
+        raise
+    if result is None and negative_ttl is not None:
+        await store(_Envelope({_NEGATIVE_MARKER: 1}), negative_ttl)
+        return result
+
+    entry = result
+    if stale_ttl is not None:
+        compute_time = time.monotonic() - started
+        entry = _wrap_entry(result, compute_time, time.time() + ttl)
+    await store(entry, ttl + (stale_ttl or 0))
+    return result
+
+
+async def _recompute(
+    key: str,
+    value_fn: Callable[[], Awaitable[Any]],
+    ttl: int,
+    *,
+    distributed_lock: bool = False,
+    lock_ttl_ms: int = 10_000,
+    lock_poll_interval: float = 0.05,
+    wait_for_lock: bool = True,
+    stale_ttl: int | None = None,
+    negative_ttl: int | None = None,
+    cache_exceptions: tuple[type[BaseException], ...] = (),
+    exception_ttl: int = 30,
+    serializer: CacheSerializer | None = None,
+    tags: Sequence[str] = (),
+    metrics_prefix: str | None = None,
+) -> Any:
+    """Compute a value and store it, optionally under a cluster-wide lock.
+
+    With ``distributed_lock``, a short ``DistributedLock`` ensures only one
+    worker in the cluster runs ``value_fn``; the others poll for its result and
+    fall back to computing it themselves if the lock expires first (or return
+    ``_MISSING`` immediately when ``wait_for_lock`` is False, which callers
+    sharing the result must handle). Redis failures never prevent the value
+    from being returned.
+
+    With ``stale_ttl`` set, the value is stored in a stale-while-revalidate
+    envelope that is fresh for ``ttl`` seconds and kept for ``stale_ttl`` more.
+    With ``negative_ttl`` set, a None result is stored as a negative entry for
+    that long instead; exceptions of the ``cache_exceptions`` types are stored
+    for ``exception_ttl`` seconds and re-raised. The key is added to the index
+    of each of ``tags`` in the same round trip.
+    """
+    backend = get_cache_backend()
+    # Other backends rely on in-process single-flight
+    lock = (
+        DistributedLock(key, ttl=lock_ttl_ms / 1000, auto_extend=False, fencing=False)
+        if distributed_lock and isinstance(backend, RedisBackend)
+        else None
+    )
+    acquired = False
+
+    if lock is not None:
+        try:
+            acquired = await lock.acquire(blocking=False)
+            if not acquired:
+                logger.debug("cache_lock_contended", key=key)
+                if not wait_for_lock:
+                    return _MISSING
+                value = await _wait_for_lock_holder(
+                    lock,
+                    key,
+                    lock_ttl_ms,
+                    poll_interval=lock_poll_interval,
+                    serializer=serializer,
+                )
+                if value is not _MISSING:
+                    return value
+        except RedisError as e:
+            logger.warning("cache_lock_failed", key=key, error=str(e))
+
+    store = functools.partial(
+        _store_entry,
+        backend,
+        key,
+        serializer=serializer,
+        tags=tags,
+        metrics_prefix=metrics_prefix,
+    )
+    try:
+        return await _compute_and_store(
+            value_fn,
+            store,
+            ttl,
+            stale_ttl=stale_ttl,
+            negative_ttl=negative_ttl,
+            cache_exceptions=cache_exceptions,
+            exception_ttl=exception_ttl,
+        )
+    finally:
+        if acquired and lock is not None:
+            try:
+                await lock.release()
+            except RedisError as e:
+                logger.warning("cache_lock_release_failed", key=key, error=str(e))
+
+
+# =============================================================================
+# Adaptive TTLs
+# =============================================================================
+
+
+class _CountMinSketch:
+    """Approximate per-key access counts in fixed memory.
+
+    Each key increments one counter in each of ``depth`` rows; its estimate is
+    the smallest of them, so collisions can inflate a count but never hide
+    one. After ``width * 10`` increments every counter is halved, so counts
+    follow recent popularity rather than all-time totals (as in TinyLFU).
+    """
+
+    def __init__(self, width: int = 8192, depth: int = 4) -> None:
+        self.width = width
+        self.depth = depth
+        self._rows = [array("I", bytes(4 * width)) for _ in range(depth)]
+        self._additions = 0
+        self._sample_size = width * 10
+
+    def _slots(self, key: str) -> list[int]:
+        """Counter index of ``key`` in each row (double hashing)."""
+        # Process-local, like the sketch itself, so randomized str hashes are fine
+        first, second = hash(key), hash((key, self.depth)) | 1
+        return [(first + row * second) % self.width for row in range(self.depth)]
+
+    def add(self, key: str) -> int:
+        """Count one access to ``key`` and return its new estimate."""
+        counts = []
+        for row, slot in zip(self._rows, self._slots(key), strict=True):
+            row[slot] += 1
+            counts.append(row[slot])
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._age()
+        return min(counts)
+
+    def estimate(self, key: str) -> int:
+        """Approximate recent accesses to ``key``."""
+        return min(
+            row[slot] for row, slot in zip(self._rows, self._slots(key), strict=True)
+        )
+
+    def _age(self) -> None:
+        """Halve every counter so old popularity fades."""
+        for index, row in enumerate(self._rows):
+            self._rows[index] = array("I", (count >> 1 for count in row))
+        self._additions //= 2
+
+
+# Recent reads of keys cached with an adaptive TTL, across all decorators
+_access_sketch = _CountMinSketch()
+
+
+@dataclass(frozen=True)
+class AdaptiveTTL:
+    """Scale a ``@cached`` entry's TTL with how often its key is read.
+
+    The TTL runs from ``shortest`` times the decorator's ``ttl`` for a key
+    read once, through ``ttl`` itself, up to ``longest`` times it for keys
+    read ``hot_reads`` times recently (geometrically in between). Under the
+    usual skewed access patterns most keys are cold, so shortening their TTLs
+    frees more memory than the few hot keys gain.
+
+    Hot keys are also refreshed ahead of expiry: the last ``refresh_ahead``
+    fraction of their TTL is served from the cache while a background task
+    recomputes them, so they never miss.
+
+    Frequencies are counted per process by a count-min sketch of a few hundred
+    kilobytes, including L1 hits.
+    """
+
+    shortest: float = 0.25
+    longest: float = 4.0
+    hot_reads: int = 64
+    refresh_ahead: float = 0.2
+
+    def __post_init__(self) -> None:
+        if not 0 < self.shortest <= self.longest:
+            msg = "AdaptiveTTL needs 0 < shortest <= longest"
+            raise ValueError(msg)
+        if self.hot_reads < 2 or not 0 <= self.refresh_ahead < 1:
+            msg = "AdaptiveTTL needs hot_reads >= 2 and 0 <= refresh_ahead < 1"
+            raise ValueError(msg)
+
+    def plan(
+        self, ttl: int, stale_ttl: int | None, reads: int
+    ) -> tuple[int, int | None]:
+        """Fresh and stale seconds to store an entry with after ``reads`` reads."""
+        position = min(math.log(max(reads, 1)) / math.log(self.hot_reads), 1.0)
+        factor = self.shortest * (self.longest / self.shortest) ** position
+        ttl = max(1, round(ttl * factor))
+        if reads < self.hot_reads or not self.refresh_ahead:
+            return ttl, stale_ttl
+        # Fresh until the refresh-ahead point, then served while refreshing
+        ahead = min(max(1, round(ttl * self.refresh_ahead)), ttl - 1)
+        return ttl - ahead, (stale_ttl or 0) + ahead
+
+
+# =============================================================================
+# Caching Decorators
+# =============================================================================
+
+
+# Parameters left out of generated keys: the bound instance or class
+_UNKEYED_PARAMETERS = frozenset({"self", "cls"})
+
+# Hashes key material to a hex digest (chosen with CACHE_KEY_HASH on first use)
+_key_hasher: Callable[[bytes], str] | None = None
+
+
+def _blake2b_128(data: bytes) -> str:
+    """128-bit BLAKE2b hex digest (standard library, the default)."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _load_key_hasher(algorithm: str) -> Callable[[bytes], str]:
+    """Return the 128-bit key hash for ``algorithm`` ("blake2b" or "xxh3")."""
+    if algorithm == "xxh3":
+        try:
+            import xxhash  # noqa: PLC0415  # Optional dependency
+        except ImportError as e:
+            msg = "xxhash is not installed. Install with: uv add xxhash"
+            raise ConfigurationError(msg) from e
+        return cast("Callable[[bytes], str]", xxhash.xxh3_128_hexdigest)
+    return _blake2b_128
+
+
+def configure_key_hash(algorithm: Literal["blake2b", "xxh3"]) -> None:
+    """Hash generated cache keys with ``algorithm`` from now on.
+
+    Overrides ``CACHE_KEY_HASH``. Every process sharing the cache must use the
+    same algorithm, or they will not find each other's entries.
+    """
+    global _key_hasher
+
+    _key_hasher = _load_key_hasher(algorithm)
+
+
+def _key_digest(data: bytes) -> str:
+    """Hash key material with the configured algorithm."""
+    global _key_hasher
+
+    if _key_hasher is None:
+        _key_hasher = _load_key_hasher(settings.cache_key_hash)
+    return _key_hasher(data)
+
+
+@functools.cache
+def _unkeyed_arguments(
+    func: Callable[..., Any],
+) -> tuple[frozenset[int], frozenset[str]]:
+    """Positions and names of ``func``'s arguments that never affect its key.
+
+    These are ``self``/``cls`` and FastAPI dependencies (parameters defaulting
+    to ``Depends(...)``/``Security(...)``), which identify who is calling
+    rather than what is being computed.
+    """
+    try:
+        parameters = list(inspect.signature(func).parameters.values())
+    except (TypeError, ValueError):  # Builtins without a signature
+        return frozenset(), frozenset()
+
+    names = {
+        parameter.name
+        for parameter in parameters
+        if parameter.name in _UNKEYED_PARAMETERS
+        or type(parameter.default).__module__.startswith("fastapi")
+    }
+    positional = [
+        parameter.name
+        for parameter in parameters
+        if parameter.kind
+        in {inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD}
+    ]
+    positions = {index for index, name in enumerate(positional) if name in names}
+    return frozenset(positions), frozenset(names)
+
+
+def _build_cache_key(
+    func: Callable[..., Any],
+    key_prefix: str,
+    key_builder: Callable[..., str] | None,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> str:
+    """Build the cache key for a decorated function call.
+
+    The arguments, minus ``self``/``cls`` and FastAPI dependencies, are
+    encoded canonically (see ``canonical_json``) and hashed to 128 bits, so
+    keys are identical across processes and restarts. Methods therefore share
+    entries between instances; use ``key_builder`` when results depend on
+    instance state.
+
+    Raises:
+        UnstableArgumentError: If an argument has no process-independent
+            encoding (give its class a ``__cache_key__()`` method)
+    """
+    if key_builder:
+        return key_builder(*args, **kwargs)
+
+    prefix = key_prefix or func.__name__
+    positions, names = _unkeyed_arguments(func)
+    if positions:
+        args = tuple(arg for index, arg in enumerate(args) if index not in positions)
+    if names:
+        kwargs = {name: value for name, value in kwargs.items() if name not in names}
+    try:
+        material = canonical_json([args, kwargs])
+    except UnstableArgumentError:
+        raise
+    except (TypeError, ValueError):
+        # Dict keys JSON cannot sort or represent (tuples, mixed types, cycles)
+        material = repr([args, sorted(kwargs.items())])
+    return f"{prefix}:{_key_digest(material.encode())}"
+
+
+def build_cache_key(
+    func: Callable[..., Any],
+    args: tuple[Any, ...] = (),
+    kwargs: dict[str, Any] | None = None,
+    *,
+    key_prefix: str = "",
+) -> str:
+    """Return the key ``cached`` and ``memoize`` use for a call.
+
+    Example:
+        >>> # Delete the entry get_user("123") was cached under
+        >>> await delete_cached(build_cache_key(get_user, ("123",), key_prefix="user"))
+    """
+    return _build_cache_key(func, key_prefix, None, args, kwargs or {})
+
+
+@dataclass(frozen=True)
+class _CachePolicy:
+    """Per-decorator caching options shared by the read-through helpers."""
+
+    ttl: int
+    single_flight: bool = True
+    distributed_lock: bool = False
+    lock_ttl_ms: int = 10_000
+    stale_ttl: int = 0
+    early_refresh_beta: float = 0.0
+    negative_ttl: int | None = None
+    cache_exceptions: tuple[type[BaseException], ...] = ()
+    exception_ttl: int = 30
+    adaptive_ttl: AdaptiveTTL | None = None
+    serializer: CacheSerializer | None = None
+    prefix: str = ""  # Groups this function's metrics
+
+    @property
+    def swr(self) -> bool:
+        """Whether entries are stored in a stale-while-revalidate envelope."""
+        return self.stale_ttl > 0 or self.early_refresh_beta > 0
+
+
+async def _read_through(
+    key: str,
+    value_fn: Callable[[], Awaitable[Any]],
+    policy: _CachePolicy,
+    tags: Sequence[str] = (),
+) -> tuple[Any, bool]:
+    """Serve a key from the cache backend, computing and storing it on a miss.
+
+    Returns:
+        The value, and whether it is fresh (safe to copy into the L1 tier).
+    """
+    backend = get_cache_backend()
+    ttl, stale_ttl = policy.ttl, policy.stale_ttl if policy.swr else None
+    if policy.adaptive_ttl is not None:
+        reads = _access_sketch.estimate(key)
+        ttl, stale_ttl = policy.adaptive_ttl.plan(ttl, stale_ttl, reads)
+    compute = functools.partial(
+        _recompute,
+        key,
+        value_fn,
+        ttl,
+        distributed_lock=policy.distributed_lock,
+        lock_ttl_ms=policy.lock_ttl_ms,
+        stale_ttl=stale_ttl,
+        negative_ttl=policy.negative_ttl,
+        cache_exceptions=policy.cache_exceptions,
+        exception_ttl=policy.exception_ttl,
+        serializer=policy.serializer,
+        tags=tags,
+        metrics_prefix=policy.prefix,
+    )
+    metrics = _metrics(policy.prefix)
+
+    # Try to get from cache
+    started = time.perf_counter()
+    cached_value = await backend.get(key)
+    metrics.get_latency.observe(time.perf_counter() - started)
+    decoded = _MISSING
+    if cached_value is not None:
+        decoded = _decode(cached_value, key, policy.serializer, policy.prefix)
+    error = _restore_error(decoded, policy.cache_exceptions)
+    if error is not None:
+        # A recent call failed with an exception chosen for caching
+        logger.debug("cache_error_hit", key=key)
+        metrics.counters["hits"] += 1
+        metrics.counters["negative_hits"] += 1
+        raise error
+
+    value, compute_time, soft_expiry = _unwrap_entry(decoded)
+    if value is _MISSING:
+        # Cache miss - call original function and store the result
+        logger.debug("cache_miss", key=key)
+        metrics.counters["misses"] += 1
+        if policy.single_flight:
+            value = await _single_flight(key, compute)
+            if value is not _MISSING:
+                return value, True
+            # Joined a background refresh that yielded to another worker's lock
+        return await compute(), True
+
+    logger.debug("cache_hit", key=key)
+    metrics.counters["hits"] += 1
+    if value is None and policy.negative_ttl is not None:
+        metrics.counters["negative_hits"] += 1
+    if soft_expiry is not None and _refresh_due(
+        compute_time, soft_expiry, policy.early_refresh_beta
+    ):
+        # Serve the current value; refresh without blocking the caller
+        metrics.counters["refreshes"] += 1
+        _schedule_refresh(key, functools.partial(compute, wait_for_lock=False))
+        return value, False
+    return value, True
+
+
+def _record_cache_error(metrics: _PrefixMetrics, error: RedisError, key: str) -> None:
+    """Count (and log) a Redis failure that made a cached call skip the cache."""
+    if isinstance(error, CacheCircuitOpenError):
+        # Redis is known to be down; don't log every call
+        metrics.counters["bypassed"] += 1
+        return
+    logger.warning("cache_error", error=str(error), key=key)
+    metrics.counters["errors"] += 1
+
+
+def cached(
+    ttl: int = 3600,
+    key_prefix: str = "",
+    key_builder: Callable[..., str] | None = None,
+    *,
+    l1_maxsize: int = 0,
+    l1_ttl: float = 60,
+    single_flight: bool = True,
+    distributed_lock: bool = False,
+    lock_ttl_ms: int = 10_000,
+    stale_ttl: int = 0,
+    early_refresh_beta: float = 0.0,
+    negative_ttl: int | None = None,
+    cache_exceptions: tuple[type[BaseException], ...] = (),
+    exception_ttl: int = 30,
+    adaptive_ttl: AdaptiveTTL | None = None,
+    serializer: CacheSerializer | None = None,
+    tags: Iterable[str] | Callable[..., Iterable[str]] | None = None,
+    namespace: str | Callable[..., str] | None = None,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Cache async function results in Redis.
+
+    With ``l1_maxsize`` set, an in-process LRU tier is checked before Redis and
+    filled after Redis hits and recomputations. L1 entries expire after
+    ``l1_ttl`` seconds (capped at ``ttl``), so other processes' writes become
+    visible within that window.
+
+    Concurrent misses for the same key are coalesced: one caller runs the
+    function and the others await its result. ``distributed_lock`` extends
+    this across processes so a popular key expiring triggers one
+    recomputation per cluster rather than one per worker.
+
+    Setting ``stale_ttl`` or ``early_refresh_beta`` stores the compute time and
+    a soft expiry next to the value. Once the soft expiry (``ttl``) passes,
+    callers get the stale value immediately for up to ``stale_ttl`` more
+    seconds while a background task refreshes it. ``early_refresh_beta``
+    (XFetch, typically 1.0) triggers that refresh probabilistically before
+    expiry, so hot keys are rarely seen stale or missing at all.
+
+    Lookups of records that do not exist can be cached too, so repeated
+    requests for missing ids stop reaching the database: ``negative_ttl``
+    stores None results as negative entries with their own (shorter) TTL, and
+    ``cache_exceptions`` re-raises the listed exception types from the cache
+    for ``exception_ttl`` seconds. Cached None results and exceptions are not
+    copied into the L1 tier.
+
+    With ``adaptive_ttl``, each entry's TTL follows how often its key is read:
+    frequently read keys live longer and are refreshed ahead of expiry, rarely
+    read ones expire sooner (see ``AdaptiveTTL``).
+
+    Args:
+        ttl: Time to live in seconds (default: 1 hour)
+        key_prefix: Prefix for cache keys (default: function name)
+        key_builder: Custom key building function
+        l1_maxsize: Maximum entries in the in-process L1 tier (0 disables it)
+        l1_ttl: Time to live in seconds for L1 entries
+        single_flight: Coalesce concurrent misses for a key within this process
+        distributed_lock: Also take a Redis lock so only one worker recomputes
+        lock_ttl_ms: Lock expiry in milliseconds (should exceed compute time)
+        stale_ttl: Seconds a stale value may be served while refreshing
+        early_refresh_beta: XFetch aggressiveness (0 disables early refresh;
+            higher values refresh earlier)
+        negative_ttl: TTL in seconds for None results (default: None results
+            are cached like any other value, for ``ttl``)
+        cache_exceptions: Exception types (and their subclasses) to cache
+        exception_ttl: TTL in seconds for cached exceptions
+        adaptive_ttl: Scale ``ttl`` per key by read frequency (default: every
+            entry lives for ``ttl``)
+        serializer: Serializer for this function's entries (default: the one
+            set with ``configure_serializer``)
+        tags: Tags recorded for each entry so ``invalidate_tags`` can delete
+            it; either fixed tags or a function receiving the call's arguments
+        namespace: Namespace whose generation is embedded in every key, so
+            ``bump_namespace`` invalidates all entries at once; either a fixed
+            name or a function receiving the call's arguments
+
+    Returns:
+        Decorated function
+
+    Example:
+        >>> @cached(ttl=300, key_prefix="user")
+        >>> async def get_user(user_id: str) -> dict:
+        ...     # Expensive database query
+        ...     return await db.get_user(user_id)
+
+        >>> # First call: cache miss, queries database
+        >>> user = await get_user("123")
+
+        >>> # Subsequent calls within 5 minutes: cache hit, instant response
+        >>> user = await get_user("123")
+
+        >>> # Hot key: serve from process memory for up to 10 seconds
+        >>> @cached(ttl=300, key_prefix="config", l1_maxsize=1024, l1_ttl=10)
+        >>> async def get_config(name: str) -> dict:
+        ...     return await db.get_config(name)
+
+        >>> # Hot endpoint: never block on expiry, refresh in the background
+        >>> @cached(ttl=60, stale_ttl=300, early_refresh_beta=1.0)
+        >>> async def get_dashboard() -> dict:
+        ...     return await db.build_dashboard()
+
+        >>> # Tag entries so they can be invalidated without a keyspace scan
+        >>> @cached(ttl=300, tags=lambda user_id: ["users", f"user:{user_id}"])
+        >>> async def get_profile(user_id: str) -> dict:
+        ...     return await db.get_profile(user_id)
+        >>> await invalidate_tags("user:123")
+
+        >>> # Remember missing users for 30 seconds instead of querying again
+        >>> @cached(
+        ...     ttl=300,
+        ...     key_prefix="user",
+        ...     negative_ttl=30,
+        ...     cache_exceptions=(ResourceNotFoundError,),
+        ... )
+        >>> async def find_user(user_id: str) -> dict | None:
+        ...     return await db.find_user(user_id)
+
+        >>> # Product pages: popular ones cached up to 4 hours, the long tail 15 min
+        >>> @cached(ttl=3600, key_prefix="product", adaptive_ttl=AdaptiveTTL())
+        >>> async def get_product(product_id: str) -> dict:
+        ...     return await db.get_product(product_id)
+
+        >>> # Invalidate a whole family of entries with one INCR
+        >>> @cached(ttl=300, namespace="api:users")
+        >>> async def list_users(page: int) -> list[dict]:
+        ...     return await db.list_users(page)
+        >>> await bump_namespace("api:users")
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        policy = _CachePolicy(
+            ttl=ttl,
+            single_flight=single_flight,
+            distributed_lock=distributed_lock,
+            lock_ttl_ms=lock_ttl_ms,
+            stale_ttl=stale_ttl,
+            early_refresh_beta=early_refresh_beta,
+            negative_ttl=negative_ttl,
+            cache_exceptions=cache_exceptions,
+            exception_ttl=exception_ttl,
+            adaptive_ttl=adaptive_ttl,
+            serializer=serializer,
+            prefix=key_prefix or func.__name__,
+        )
+        metrics = _metrics(policy.prefix)
+        local: _LocalCache | None = None
+        if l1_maxsize > 0:
+            local = _LocalCache(policy.prefix, l1_maxsize, min(l1_ttl, ttl))
+            _local_caches.append(local)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            cache_key = _build_cache_key(func, key_prefix, key_builder, args, kwargs)
+
+            try:
+                if namespace is not None:
+                    cache_key = await namespaced_key(
+                        _resolve_namespace(namespace, args, kwargs), cache_key
+                    )
+
+                if adaptive_ttl is not None:
+                    _access_sketch.add(cache_key)
+
+                # Check the in-process tier before going to Redis
+                if local is not None:
+                    local_value = local.get(cache_key)
+                    if local_value is not _MISSING:
+                        logger.debug("cache_l1_hit", key=cache_key)
+                        metrics.counters["l1_hits"] += 1
+                        return local_value
+
+                value, fresh = await _read_through(
+                    cache_key,
+                    functools.partial(func, *args, **kwargs),
+                    policy,
+                    _resolve_tags(tags, args, kwargs),
+                )
+                if (
+                    local is not None
+                    and fresh
+                    and (value is not None or negative_ttl is None)
+                ):
+                    local.set(cache_key, value)
+                return value
+
+            except RedisError as e:
+                # If Redis is unavailable, gracefully degrade (call function directly)
+                _record_cache_error(metrics, e, cache_key)
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def cached_batch(
+    ttl: int = 3600,
+    key_prefix: str = "",
+    *,
+    serializer: CacheSerializer | None = None,
+) -> Callable[
+    [Callable[..., Awaitable[Mapping[K, V]]]], Callable[..., Awaitable[dict[K, V]]]
+]:
+    """Cache a function that loads many entities by id, one entry per id.
+
+    The decorated function takes a sequence of ids as its first argument
+    (after ``self``/``cls`` for methods, which are detected by that parameter
+    name) and returns a mapping of id to value. Cached ids are fetched in one MGET round
+    trip; the function is called only for the missing ids, and its results
+    are written back in one pipeline. Ids the function does not return are
+    left out of the result and not cached.
+
+    Each id is keyed as if the function had been called with that id alone,
+    so entries are shared with a single-item ``@cached`` loader using the
+    same ``key_prefix`` and can be addressed with ``build_cache_key``.
+
+    Args:
+        ttl: Time to live in seconds (default: 1 hour)
+        key_prefix: Prefix for cache keys (default: function name)
+        serializer: Serializer for entries (default: module serializer)
+
+    Returns:
+        Decorated function returning ``{id: value}`` in request order
+
+    Example:
+        >>> @cached_batch(ttl=300, key_prefix="user")
+        >>> async def get_users(user_ids: list[str]) -> dict[str, dict]:
+        ...     rows = await db.get_users(user_ids)
+        ...     return {row["id"]: row for row in rows}
+
+        >>> # One Redis round trip; the database only sees the misses
+        >>> users = await get_users(["1", "2", "3"])
+
+        >>> # Drop one user's entry
+        >>> await delete_cached(build_cache_key(get_users, ("1",), key_prefix="user"))
+
+        >>> class UserRepository:
+        ...     @cached_batch(key_prefix="user")
+        ...     async def get_many(self, user_ids: list[str]) -> dict[str, dict]:
+        ...         return await self.db.get_users(user_ids)
+    """
+
+    def decorator(
+        func: Callable[..., Awaitable[Mapping[K, V]]],
+    ) -> Callable[..., Awaitable[dict[K, V]]]:
+        # Methods take self/cls before the ids; it stays out of the keys
+        parameters = list(inspect.signature(func).parameters)
+        receivers = 1 if parameters[:1] and parameters[0] in _UNKEYED_PARAMETERS else 0
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> dict[K, V]:
+            receiver = args[:receivers]
+            ids, *rest = args[receivers:]
+            # Key each id like a single-item call; extra arguments (e.g.
+            # filters) keep their positions and become part of every key
+            unique_ids = list(dict.fromkeys(ids))
+            keys = {
+                item: _build_cache_key(
+                    func, key_prefix, None, (*receiver, item, *rest), kwargs
+                )
+                for item in unique_ids
+            }
+            hits, missing_keys = await get_many(list(keys.values()), serializer)
+
+            results: dict[K, V] = {
+                item: hits[key] for item, key in keys.items() if key in hits
+            }
+            if missing_keys:
+                missing = set(missing_keys)
+                missing_ids = [item for item, key in keys.items() if key in missing]
+                logger.debug(
+                    "cache_batch_miss",
+                    prefix=key_prefix or func.__name__,
+                    hits=len(hits),
+                    misses=len(missing),
+                )
+                loaded = await func(*receiver, missing_ids, *rest, **kwargs)
+                results.update(loaded)
+                fresh = {keys[item]: v for item, v in loaded.items() if item in keys}
+                await set_many(fresh, ttl, serializer)
+
+            return {item: results[item] for item in unique_ids if item in results}
+
+        return wrapper
+
+    return decorator
+
+
+def cache_invalidate(
+    key_pattern: str | None = None,
+    *,
+    tags: Iterable[str] | Callable[..., Iterable[str]] | None = None,
+    namespace: str | Callable[..., str] | None = None,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Decorator to invalidate cache keys matching a pattern, tags or namespace.
+
+    Useful for cache invalidation on data updates. Prefer ``namespace`` or
+    ``tags``: a namespace is invalidated with one INCR and tags delete exactly
+    the tagged entries, while a pattern has to scan the keyspace.
+
+    Args:
+        key_pattern: Redis key pattern (supports * wildcard)
+        tags: Tags to invalidate; either fixed tags or a function receiving
+            the decorated function's arguments
+        namespace: Namespace to bump; either a fixed name or a function
+            receiving the decorated function's arguments
+
+    Example:
+        >>> @cache_invalidate("user:*")
+        >>> async def update_user(user_id: str, data: dict):
+        ...     # Update user in database
+        ...     await db.update_user(user_id, data)
+        ...     # Cache keys matching "user:*" are automatically deleted
+
+        >>> @cache_invalidate(tags=lambda user_id, data: [f"user:{user_id}"])
+        >>> async def rename_user(user_id: str, data: dict):
+        ...     await db.update_user(user_id, data)
+
+        >>> @cache_invalidate(namespace="api:users")
+        >>> async def import_users(rows: list[dict]):
+        ...     await db.insert_users(rows)
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            # Call original function first
+            result = await func(*args, **kwargs)
+
+            # Invalidate cache
+            try:
+                if key_pattern is not None:
+                    await invalidate_pattern(key_pattern)
+                if tags is not None:
+                    await invalidate_tags(*_resolve_tags(tags, args, kwargs))
+                if namespace is not None:
+                    await bump_namespace(_resolve_namespace(namespace, args, kwargs))
+            except RedisError as e:
+                logger.warning(
+                    "cache_invalidation_failed", pattern=key_pattern, error=str(e)
+                )
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+# =============================================================================
+# Sync Memoization
+# =============================================================================
+
+
+class MemoizedFunction(Protocol[R_co]):
+    """A sync function wrapped by ``memoize``, with cache controls attached."""
+
+    def __call__(self, *args: Any, **kwargs: Any) -> R_co:
+        """Return the cached result for these arguments, computing it if needed."""
+        ...
+
+    def invalidate(self, *args: Any, **kwargs: Any) -> bool:
+        """Drop the entry for these arguments; True if there was one."""
+        ...
+
+    def cache_clear(self) -> None:
+        """Drop every entry."""
+        ...
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Size, hit/miss and eviction counters."""
+        ...
+
+
+def _hashable(args: tuple[Any, ...], kwargs: dict[str, Any]) -> bool:
+    """Whether every argument of a call is hashable."""
+    try:
+        hash((args, frozenset(kwargs.items())))
+    except TypeError:
+        return False
+    else:
+        return True
+
+
+def memoize(
+    ttl: float = 3600,
+    key_prefix: str = "",
+    key_builder: Callable[..., str] | None = None,
+    *,
+    maxsize: int = 1024,
+    max_bytes: int | None = None,
+    unhashable: Literal["encode", "bypass", "error"] = "encode",
+) -> Callable[[Callable[..., T]], MemoizedFunction[T]]:
+    """Cache sync function results in process memory (TTL + LRU).
+
+    The sync counterpart of ``cached`` for CLIs, helpers and other code that
+    cannot await: no Redis round trip, and safe to call from several threads.
+    Keys are built exactly as ``cached`` builds them, hits and misses are
+    reported by ``get_cache_metrics`` under the key prefix, and the tier is
+    listed by ``get_local_cache_stats`` and cleared by ``invalidate_pattern``,
+    pub/sub invalidations and ``clear_local_caches``. Concurrent misses for
+    the same arguments may each call the function.
+
+    Args:
+        ttl: Time to live in seconds (default: 1 hour)
+        key_prefix: Prefix for cache keys (default: function name)
+        key_builder: Custom key building function
+        maxsize: Maximum number of entries
+        max_bytes: Maximum approximate total size of the cached values
+        unhashable: What to do with unhashable arguments (lists, dicts, ...):
+            ``"encode"`` keys them by their canonical encoding like hashable
+            ones, ``"bypass"`` calls the function uncached, ``"error"`` raises
+            ``TypeError``
+
+    Returns:
+        Decorator returning a ``MemoizedFunction`` with ``invalidate``,
+        ``cache_clear`` and ``cache_stats``
+
+    Example:
+        >>> @memoize(ttl=600, maxsize=256)
+        >>> def load_rates(currency: str) -> dict[str, Decimal]:
+        ...     return fetch_rates(currency)
+
+        >>> rates = load_rates("EUR")  # computed
+        >>> rates = load_rates("EUR")  # served from memory
+        >>> load_rates.invalidate("EUR")
+
+        >>> # Bound memory by size rather than entry count
+        >>> @memoize(ttl=60, maxsize=100_000, max_bytes=64 * 1024 * 1024)
+        >>> def render_report(report_id: int) -> str:
+        ...     return build_report(report_id)
+    """
+
+    def decorator(func: Callable[..., T]) -> MemoizedFunction[T]:
+        prefix = key_prefix or func.__name__
+        metrics = _metrics(prefix)
+        local = _LocalCache(prefix, maxsize, ttl, max_bytes=max_bytes)
+        _local_caches.append(local)
+
+        def build_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str | None:
+            if unhashable != "encode" and not _hashable(args, kwargs):
+                if unhashable == "error":
+                    msg = f"{func.__qualname__} called with unhashable arguments"
+                    raise TypeError(msg)
+                return None
+            return _build_cache_key(func, key_prefix, key_builder, args, kwargs)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            cache_key = build_key(args, kwargs)
+            if cache_key is None:
+                metrics.counters["bypassed"] += 1
+                return func(*args, **kwargs)
+
+            value = local.get(cache_key)
+            if value is not _MISSING:
+                metrics.counters["l1_hits"] += 1
+                return cast("T", value)
+
+            metrics.counters["misses"] += 1
+            result = func(*args, **kwargs)
+            local.set(cache_key, result)
+            return result
+
+        def invalidate(*args: Any, **kwargs: Any) -> bool:
+            cache_key = build_key(args, kwargs)
+            return cache_key is not None and local.delete(cache_key)
+
+        memoized = cast("Any", wrapper)
+        memoized.invalidate = invalidate
+        memoized.cache_clear = local.clear
+        memoized.cache_stats = local.stats
+        return cast("MemoizedFunction[T]", memoized)
+
+    return decorator
+
+
+# =============================================================================
+# Cache Operations
+# =============================================================================
+
+
+async def get_cached(
+    key: str, default: Any = None, serializer: CacheSerializer | None = None
+) -> Any:
+    """Get value from cache.
+
+    A cached None, including a negative entry stored by
+    ``@cached(negative_ttl=...)``, is returned as None; pass a ``default``
+    other than None to tell it apart from a miss. Cached exceptions read as
+    misses.
+
+    Args:
+        key: Cache key
+        default: Default value if key not found
+        serializer: Serializer to decode with (any codec is detected from the
+            payload; this only matters for custom codecs)
+
+    Returns:
+        Cached value or default
+
+    Example:
+        >>> not_cached = object()
+        >>> user = await get_cached("user:123", default=not_cached)
+        >>> if user is not_cached:
+        ...     user = await db.find_user("123")  # None here is a known miss
+    """
+    metrics = _metrics(_key_prefix(key))
+    try:
+        started = time.perf_counter()
+        raw = await get_cache_backend().get(key, replica_ok=True)
+        metrics.get_latency.observe(time.perf_counter() - started)
+
+        decoded = _MISSING if raw is None else _decode(raw, key, serializer)
+        value = _unwrap_entry(decoded)[0]
+
+    except RedisError as e:
+        logger.warning("cache_get_failed", key=key, error=str(e))
+        metrics.counters["errors"] += 1
+        return default
+
+    if value is _MISSING:
+        metrics.counters["misses"] += 1
+        return default
+    metrics.counters["hits"] += 1
+    return value
+
+
+async def set_cached(
+    key: str,
+    value: Any,
+    ttl: int = 3600,
+    serializer: CacheSerializer | None = None,
+    tags: Iterable[str] = (),
+) -> bool:
+    """Set value in cache.
+
+    Args:
+        key: Cache key
+        value: Value to cache
+        ttl: Time to live in seconds
+        serializer: Serializer to encode with (default: module serializer)
+        tags: Tags to record the key under for ``invalidate_tags``
+
+    Returns:
+        True if successful, False otherwise
+    """
+    _evict_local(key)
+    metrics = _metrics(_key_prefix(key))
+    try:
+        payload = _encode(value, key, serializer)
+        started = time.perf_counter()
+        await get_cache_backend().set(key, payload, ttl, tags=list(tags))
+        metrics.set_latency.observe(time.perf_counter() - started)
+        return True
+
+    except RedisError as e:
+        logger.warning("cache_set_failed", key=key, error=str(e))
+        metrics.counters["errors"] += 1
+        return False
+
+
+async def delete_cached(key: str) -> bool:
+    """Delete value from cache.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        True if key was deleted, False otherwise
+    """
+    _evict_local(key)
+    try:
+        return await get_cache_backend().delete([key]) > 0
+
+    except RedisError as e:
+        logger.warning("cache_delete_failed", key=key, error=str(e))
+        return False
+
+
+def _chunked(items: Iterable[Any], size: int = _BULK_CHUNK_SIZE) -> Iterator[list[Any]]:
+    """Yield successive lists of at most ``size`` items."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+async def get_many(
+    keys: Iterable[str], serializer: CacheSerializer | None = None
+) -> tuple[dict[str, Any], list[str]]:
+    """Get several values in as few round trips as possible (MGET).
+
+    Args:
+        keys: Cache keys
+        serializer: Serializer to decode with (any codec is detected from the
+            payload; this only matters for custom codecs)
+
+    Returns:
+        Tuple of ``(hits, misses)``: a dict of the keys that were found and a
+        list of the keys that were not, in request order. If Redis is
+        unavailable every key is reported as a miss.
+
+    Example:
+        >>> hits, misses = await get_many(["user:1", "user:2", "user:3"])
+        >>> if misses:
+        ...     loaded = await db.get_users(misses)
+    """
+    keys = list(keys)
+    hits: dict[str, Any] = {}
+    misses: list[str] = []
+    try:
+        backend = get_cache_backend()
+        for chunk in _chunked(keys):
+            started = time.perf_counter()
+            values = await backend.get_many(chunk, replica_ok=True)
+            _metrics(_key_prefix(chunk[0])).get_latency.observe(
+                time.perf_counter() - started
+            )
+            for key, raw in zip(chunk, values, strict=True):
+                decoded = _MISSING if raw is None else _decode(raw, key, serializer)
+                value = _unwrap_entry(decoded)[0]
+                counters = _metrics(_key_prefix(key)).counters
+                if value is _MISSING:
+                    counters["misses"] += 1
+                    misses.append(key)
+                else:
+                    counters["hits"] += 1
+                    hits[key] = value
+    except RedisError as e:
+        logger.warning("cache_get_many_failed", count=len(keys), error=str(e))
+        if keys:
+            _metrics(_key_prefix(keys[0])).counters["errors"] += 1
+        return {}, keys
+
+    return hits, misses
+
+
+async def set_many(
+    items: Mapping[str, Any],
+    ttl: int | Mapping[str, int] = 3600,
+    serializer: CacheSerializer | None = None,
+) -> bool:
+    """Set several values using pipelined SETEX commands.
+
+    Args:
+        items: Mapping of cache key to value
+        ttl: Time to live in seconds, either one value for every key or a
+            mapping of key to TTL (keys missing from it use 1 hour)
+        serializer: Serializer to encode with (default: module serializer)
+
+    Returns:
+        True if every value was written, False otherwise
+
+    Example:
+        >>> await set_many(
+        ...     {"user:1": alice, "user:2": bob},
+        ...     ttl={"user:1": 60, "user:2": 300},
+        ... )
+    """
+    for key in items:
+        _evict_local(key)
+    try:
+        backend = get_cache_backend()
+        for chunk in _chunked(items):
+            entries = {}
+            for key in chunk:
+                key_ttl = ttl if isinstance(ttl, int) else ttl.get(key, 3600)
+                entries[key] = (_encode(items[key], key, serializer), key_ttl)
+            started = time.perf_counter()
+            await backend.set_many(entries)
+            _metrics(_key_prefix(chunk[0])).set_latency.observe(
+                time.perf_counter() - started
+            )
+        return True
+
+    except RedisError as e:
+        logger.warning("cache_set_many_failed", count=len(items), error=str(e))
+        if items:
+            _metrics(_key_prefix(next(iter(items)))).counters["errors"] += 1
+        return False
+
+
+async def delete_many(keys: Iterable[str]) -> int:
+    """Delete several keys in chunks using non-blocking UNLINK.
+
+    Args:
+        keys: Cache keys
+
+    Returns:
+        Number of keys that existed and were deleted
+    """
+    keys = list(keys)
+    for key in keys:
+        _evict_local(key)
+    deleted = 0
+    try:
+        backend = get_cache_backend()
+        for chunk in _chunked(keys):
+            deleted += await backend.delete(chunk)
 
-# Global Redis connection pool
-_redis_pool: Redis | None = None
+    except RedisError as e:
+        logger.warning("cache_delete_many_failed", count=len(keys), error=str(e))
 
+    return deleted
 
-# =============================================================================
-# Connection Management
-# =============================================================================
 
+@dataclass
+class InvalidationProgress:
+    """Running totals of a pattern invalidation, passed to progress callbacks."""
 
-async def get_redis() -> Redis:
-    """Get Redis connection from pool.
+    pattern: str
+    matched: int = 0
+    deleted: int = 0
+    scan_pages: int = 0
+    background: bool = False
+    done: bool = False
+    started_at: float = field(default_factory=time.monotonic)
 
-    Returns:
-        Redis connection
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the invalidation started."""
+        return time.monotonic() - self.started_at
 
-    Example:
-        >>> redis = await get_redis()
-        >>> await redis.set("key", "value", ex=60)
-        >>> value = await redis.get("key")
-    """
-    global _redis_pool
 
-    if _redis_pool is None:
-        # Get Redis URL from environment
-        import os
+async def _unlink_scan_pages(
+    redis: Redis,
+    progress: InvalidationProgress,
+    cursor: int = 0,
+    *,
+    node: Any = None,
+    last_node: bool = True,
+    batch_size: int = _BULK_CHUNK_SIZE,
+    max_keys_per_second: float | None = None,
+    on_progress: Callable[[InvalidationProgress], None] | None = None,
+    stop_after: int | None = None,
+) -> int:
+    """UNLINK keys matching ``progress.pattern`` one SCAN page at a time.
 
-        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    ``node`` selects a Redis Cluster primary to scan (None for other
+    topologies, which have a single keyspace).
 
-        _redis_pool = from_url(
-            redis_url,
-            encoding="utf-8",
-            decode_responses=True,
-            max_connections=50,  # Connection pool size
-            socket_keepalive=True,
-            socket_connect_timeout=5,
-            socket_timeout=5,
-            retry_on_timeout=True,
+    Returns:
+        The cursor to resume from, or 0 once the node has been walked
+        (before that, stops early once ``stop_after`` keys have been deleted)
+    """
+    target = {} if node is None else {"target_nodes": node}
+    while True:
+        cursor, keys = await redis.scan(
+            cursor, match=progress.pattern, count=batch_size, **target
         )
+        if isinstance(cursor, dict):  # Cluster replies are keyed by node
+            cursor = next(iter(cursor.values()))
+        progress.scan_pages += 1
+        if keys:
+            progress.matched += len(keys)
+            for chunk in _chunked(keys, batch_size):
+                progress.deleted += await _unlink_entries(redis, chunk, announce=False)
 
-        logger.info("redis_connection_initialized", url=redis_url)
+        progress.done = cursor == 0 and last_node
+        if on_progress is not None:
+            on_progress(progress)
+        if cursor == 0:
+            return 0
 
-    return _redis_pool
+        # Let other coroutines (and other Redis clients) in between pages
+        delay = len(keys) / max_keys_per_second if max_keys_per_second else 0
+        await asyncio.sleep(delay)
 
+        if stop_after is not None and progress.deleted >= stop_after:
+            return cursor
 
-async def close_redis() -> None:
-    """Close Redis connection pool.
 
-    Call this on application shutdown.
+async def _unlink_matching(
+    redis: Redis,
+    progress: InvalidationProgress,
+    position: tuple[int, int] = (0, 0),
+    **options: Any,
+) -> tuple[int, int] | None:
+    """Walk every node's keyspace (one node unless Redis Cluster) from ``position``.
+
+    Returns:
+        The ``(node index, cursor)`` to resume from if ``stop_after`` stopped
+        the walk early, otherwise None
     """
-    global _redis_pool
+    nodes = redis.get_primaries() if isinstance(redis, RedisCluster) else [None]
+    start, cursor = position
+    for index in range(start, len(nodes)):
+        cursor = await _unlink_scan_pages(
+            redis,
+            progress,
+            cursor if index == start else 0,
+            node=nodes[index],
+            last_node=index == len(nodes) - 1,
+            **options,
+        )
+        if cursor:
+            return index, cursor
+    return None
 
-    if _redis_pool is not None:
-        await _redis_pool.close()
-        _redis_pool = None
-        logger.info("redis_connection_closed")
 
+async def _finish_invalidation(
+    redis: Redis,
+    progress: InvalidationProgress,
+    position: tuple[int, int],
+    **options: Any,
+) -> None:
+    """Complete a pattern invalidation handed off to the background."""
+    await _unlink_matching(redis, progress, position, **options)
+    _evict_local_matching(progress.pattern)
+    await _publish_invalidation(redis, patterns=[progress.pattern])
+    logger.info(
+        "cache_invalidated",
+        pattern=progress.pattern,
+        count=progress.deleted,
+        background=True,
+        elapsed=progress.elapsed,
+    )
 
-# =============================================================================
-# Caching Decorators
-# =============================================================================
 
+async def _invalidate_backend_pattern(backend: CacheBackend, pattern: str) -> int:
+    """Invalidate a pattern on a non-Redis backend in a single call."""
+    try:
+        deleted = await backend.delete_pattern(pattern)
+    except RedisError as e:
+        logger.exception("cache_invalidation_failed", pattern=pattern, error=str(e))
+        return 0
+    logger.info("cache_invalidated", pattern=pattern, count=deleted)
+    return deleted
 
-def cached(
-    ttl: int = 3600,
-    key_prefix: str = "",
-    key_builder: Callable[..., str] | None = None,
-) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
-    """Cache async function results in Redis.
+
+async def invalidate_pattern(
+    pattern: str,
+    *,
+    batch_size: int = _BULK_CHUNK_SIZE,
+    max_keys_per_second: float | None = None,
+    on_progress: Callable[[InvalidationProgress], None] | None = None,
+    background_after: int | None = None,
+) -> int:
+    """Invalidate all cache keys matching a pattern.
+
+    This scans the whole keyspace; for entries written with tags, prefer
+    ``invalidate_tags``, whose cost depends only on the number of tagged keys,
+    or a namespace, invalidated with ``bump_namespace`` in O(1).
+
+    Keys are streamed from SCAN and removed with UNLINK (memory is reclaimed
+    off Redis's main thread) in pipelined chunks of at most ``batch_size``
+    keys, so neither this process nor Redis ever holds the full match list.
+    The event loop is yielded to between SCAN pages. Other backends delete
+    the matches in one call and ignore the streaming options.
 
     Args:
-        ttl: Time to live in seconds (default: 1 hour)
-        key_prefix: Prefix for cache keys (default: function name)
-        key_builder: Custom key building function
+        pattern: Redis key pattern (supports * wildcard)
+        batch_size: SCAN page size hint and maximum keys per UNLINK call
+        max_keys_per_second: Throttle deletions to roughly this rate
+        on_progress: Called with running totals after every SCAN page
+        background_after: Once this many keys have been deleted, return and
+            finish the invalidation in a background task (default: never)
 
     Returns:
-        Decorated function
+        Number of keys deleted before returning
 
     Example:
-        >>> @cached(ttl=300, key_prefix="user")
-        >>> async def get_user(user_id: str) -> dict:
-        ...     # Expensive database query
-        ...     return await db.get_user(user_id)
+        >>> # Delete all user caches
+        >>> await invalidate_pattern("user:*")
 
-        >>> # First call: cache miss, queries database
-        >>> user = await get_user("123")
+        >>> # Delete specific user cache
+        >>> await invalidate_pattern("user:123:*")
 
-        >>> # Subsequent calls within 5 minutes: cache hit, instant response
-        >>> user = await get_user("123")
+        >>> # Huge keyspace: throttle, and finish in the background past 50k keys
+        >>> await invalidate_pattern(
+        ...     "report:*", max_keys_per_second=20_000, background_after=50_000
+        ... )
     """
+    # Drop matching entries from this process's L1 tiers as well
+    _evict_local_matching(pattern)
 
-    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
-        @functools.wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> T:
-            # Build cache key
-            if key_builder:
-                cache_key = key_builder(*args, **kwargs)
-            else:
-                prefix = key_prefix or func.__name__
-                # Create unique key from function arguments
-                key_data = f"{args}:{sorted(kwargs.items())}"
-                key_hash = hashlib.md5(
-                    key_data.encode(), usedforsecurity=False
-                ).hexdigest()[:8]
-                cache_key = f"{prefix}:{key_hash}"
+    backend = get_cache_backend()
+    if not isinstance(backend, RedisBackend):
+        return await _invalidate_backend_pattern(backend, pattern)
 
-            try:
-                redis = await get_redis()
+    progress = InvalidationProgress(pattern)
+    options: dict[str, Any] = {
+        "batch_size": batch_size,
+        "max_keys_per_second": max_keys_per_second,
+        "on_progress": on_progress,
+    }
+    try:
+        redis = await _cache_redis()
+        position = await _unlink_matching(
+            redis, progress, stop_after=background_after, **options
+        )
+        if position is None:
+            await _publish_invalidation(redis, patterns=[pattern])
+    except RedisError as e:
+        logger.exception("cache_invalidation_failed", pattern=pattern, error=str(e))
+        return progress.deleted
 
-                # Try to get from cache
-                cached_value = await redis.get(cache_key)
-                if cached_value is not None:
-                    logger.debug("cache_hit", key=cache_key)
-                    return json.loads(cached_value)
+    if position is not None:
+        progress.background = True
+        _run_in_background(
+            _finish_invalidation(redis, progress, position, **options),
+            "cache_invalidation_failed",
+            pattern=pattern,
+        )
+        logger.info(
+            "cache_invalidation_backgrounded", pattern=pattern, count=progress.deleted
+        )
+    else:
+        logger.info("cache_invalidated", pattern=pattern, count=progress.deleted)
+    return progress.deleted
 
-                # Cache miss - call original function
-                logger.debug("cache_miss", key=cache_key)
-                result = await func(*args, **kwargs)
 
-                # Store in cache
-                await redis.setex(
-                    cache_key,
-                    ttl,
-                    json.dumps(result, default=str),
-                )
+# =============================================================================
+# Tag-Based Invalidation
+# =============================================================================
 
-                return result
 
-            except RedisError as e:
-                # If Redis is unavailable, gracefully degrade (call function directly)
-                logger.warning("cache_error", error=str(e), key=cache_key)
-                return await func(*args, **kwargs)
+def _tag_key(tag: str) -> str:
+    """Redis key of a tag's index set.
 
-        return wrapper
+    The tag is a hash tag (``{...}``) so the index and its temporary copies
+    live in the same Redis Cluster slot.
+    """
+    return _TAG_KEY_PREFIX + "{" + tag + "}"
 
-    return decorator
+
+def _resolve_tags(
+    tags: Iterable[str] | Callable[..., Iterable[str]] | None,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> tuple[str, ...]:
+    """Evaluate a decorator's tag specification for one call."""
+    if tags is None:
+        return ()
+    if callable(tags):
+        return tuple(tags(*args, **kwargs))
+    return tuple(tags)
 
 
-def cache_invalidate(key_pattern: str) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
-    """Decorator to invalidate cache keys matching a pattern.
+def _queue_tag_writes(pipe: Pipeline, key: str, tags: Iterable[str], ttl: int) -> None:
+    """Queue commands adding ``key`` to each tag's index on a pipeline.
+
+    Each index expires no earlier than its longest-lived member, so indexes
+    of tags that are never invalidated disappear on their own.
+    Requires Redis 7.0+ for ``EXPIRE NX/GT``.
+    """
+    for tag in tags:
+        tag_key = _tag_key(tag)
+        pipe.sadd(tag_key, key)
+        pipe.expire(tag_key, ttl, nx=True)
+        pipe.expire(tag_key, ttl, gt=True)
+
+
+async def _sscan_batches(
+    redis: Redis, key: str, batch_size: int
+) -> AsyncIterator[list[bytes]]:
+    """Yield a set's members in batches of at most ``batch_size``."""
+    cursor = 0
+    while True:
+        cursor, members = await redis.sscan(key, cursor, count=batch_size)
+        for chunk in _chunked(members, batch_size):
+            yield chunk
+        if cursor == 0:
+            return
 
-    Useful for cache invalidation on data updates.
+
+async def invalidate_tags(*tags: str, batch_size: int = _BULK_CHUNK_SIZE) -> int:
+    """Delete every cache entry recorded under any of the given tags.
+
+    Member keys are read from each tag's index with SSCAN and removed in
+    UNLINK batches of at most ``batch_size`` keys, so the cost depends only on
+    the number of tagged entries, never on the size of the keyspace. The index
+    is detached (renamed) first, so entries tagged while invalidation runs
+    start a fresh index instead of being lost.
 
     Args:
-        key_pattern: Redis key pattern (supports * wildcard)
+        *tags: Tags to invalidate
+        batch_size: Maximum keys per SSCAN page and UNLINK call
+
+    Returns:
+        Number of cache entries deleted
 
     Example:
-        >>> @cache_invalidate("user:*")
-        >>> async def update_user(user_id: str, data: dict):
-        ...     # Update user in database
-        ...     await db.update_user(user_id, data)
-        ...     # Cache keys matching "user:*" are automatically deleted
+        >>> await set_cached("user:123", user, tags=["users", "user:123"])
+        >>> await invalidate_tags("user:123")
     """
-
-    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
-        @functools.wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> T:
-            # Call original function first
-            result = await func(*args, **kwargs)
-
-            # Invalidate cache
+    deleted = 0
+    try:
+        redis = await _cache_redis()
+        for tag in tags:
+            tag_key = _tag_key(tag)
+            detached = f"{tag_key}:invalidating:{uuid.uuid4().hex}"
             try:
-                await invalidate_pattern(key_pattern)
-            except RedisError as e:
-                logger.warning(
-                    "cache_invalidation_failed", pattern=key_pattern, error=str(e)
-                )
+                await redis.rename(tag_key, detached)
+            except ResponseError:
+                continue  # No entries carry this tag
 
-            return result
+            async for members in _sscan_batches(redis, detached, batch_size):
+                keys = [member.decode() for member in members]
+                for key in keys:
+                    _evict_local(key)
+                deleted += await _unlink_entries(redis, keys)
+            await redis.unlink(detached)
 
-        return wrapper
+        logger.info("cache_tags_invalidated", tags=list(tags), count=deleted)
 
-    return decorator
+    except RedisError as e:
+        logger.exception("cache_tag_invalidation_failed", tags=list(tags), error=str(e))
 
+    return deleted
 
-# =============================================================================
-# Cache Operations
-# =============================================================================
 
+async def cleanup_tags(
+    tags: Iterable[str] | None = None, batch_size: int = _BULK_CHUNK_SIZE
+) -> int:
+    """Remove members whose cache entries have expired from tag indexes.
 
-async def get_cached(key: str, default: Any = None) -> Any:
-    """Get value from cache.
+    Indexes expire with their longest-lived member, but a busy tag's index can
+    accumulate keys that expired long ago. Run this periodically (e.g. from a
+    cron job) to keep indexes small. Empty indexes are removed by Redis.
 
     Args:
-        key: Cache key
-        default: Default value if key not found
+        tags: Tags to clean (default: every tag index, found with SCAN)
+        batch_size: Members checked per round trip
 
     Returns:
-        Cached value or default
+        Number of stale members removed
     """
+    removed = 0
     try:
-        redis = await get_redis()
-        value = await redis.get(key)
+        redis = await _cache_redis()
+        if tags is None:
+            tag_keys: Iterable[Any] = [
+                key
+                async for key in redis.scan_iter(
+                    match=f"{_TAG_KEY_PREFIX}*", count=batch_size
+                )
+            ]
+        else:
+            tag_keys = [_tag_key(tag) for tag in tags]
 
-        if value is None:
-            return default
+        for tag_key in tag_keys:
+            async for members in _sscan_batches(redis, tag_key, batch_size):
+                pipe = redis.pipeline(transaction=False)
+                for member in members:
+                    pipe.exists(member)
+                alive = await pipe.execute()
+                stale = [m for m, live in zip(members, alive, strict=True) if not live]
+                if stale:
+                    pipe = redis.pipeline(transaction=False)
+                    pipe.srem(tag_key, *stale)
+                    removed += (await pipe.execute())[0]
 
-        return json.loads(value)
+        logger.info("cache_tags_cleaned", removed=removed)
 
     except RedisError as e:
-        logger.warning("cache_get_failed", key=key, error=str(e))
-        return default
+        logger.exception("cache_tag_cleanup_failed", error=str(e))
 
+    return removed
 
-async def set_cached(key: str, value: Any, ttl: int = 3600) -> bool:
-    """Set value in cache.
 
-    Args:
-        key: Cache key
-        value: Value to cache
-        ttl: Time to live in seconds
+# =============================================================================
+# Namespace Generations
+# =============================================================================
 
-    Returns:
-        True if successful, False otherwise
-    """
-    try:
-        redis = await get_redis()
-        await redis.setex(key, ttl, json.dumps(value, default=str))
-        return True
+# Locally cached namespace generations: namespace -> (generation, expires_at)
+_namespace_generations: dict[str, tuple[int, float]] = {}
 
-    except RedisError as e:
-        logger.warning("cache_set_failed", key=key, error=str(e))
-        return False
 
+def _resolve_namespace(
+    namespace: str | Callable[..., str],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> str:
+    """Evaluate a decorator's namespace specification for one call."""
+    if callable(namespace):
+        return namespace(*args, **kwargs)
+    return namespace
 
-async def delete_cached(key: str) -> bool:
-    """Delete value from cache.
 
-    Args:
-        key: Cache key
+async def _fetch_generation(namespace: str) -> int:
+    """Read a namespace's generation from Redis, creating it if missing.
 
-    Returns:
-        True if key was deleted, False otherwise
+    A missing counter starts at the current time in milliseconds rather than
+    zero, so a counter lost to eviction or a flush never reuses a generation
+    whose entries may still be cached.
     """
-    try:
-        redis = await get_redis()
-        deleted = await redis.delete(key)
-        return deleted > 0
+    redis = await _cache_redis()
+    counter_key = _NAMESPACE_KEY_PREFIX + namespace
+    pipe = redis.pipeline(transaction=False)
+    pipe.set(counter_key, time.time_ns() // 1_000_000, nx=True)
+    pipe.get(counter_key)
+    _, generation = await pipe.execute()
+    return int(generation)
 
-    except RedisError as e:
-        logger.warning("cache_delete_failed", key=key, error=str(e))
-        return False
 
+async def _namespace_generation(namespace: str) -> int:
+    """Current generation of a namespace, cached locally for a short time."""
+    now = time.monotonic()
+    cached_generation = _namespace_generations.get(namespace)
+    if cached_generation is not None and cached_generation[1] > now:
+        return cached_generation[0]
 
-async def invalidate_pattern(pattern: str) -> int:
-    """Invalidate all cache keys matching a pattern.
+    generation = await _single_flight(
+        _NAMESPACE_KEY_PREFIX + namespace,
+        functools.partial(_fetch_generation, namespace),
+    )
+    _namespace_generations[namespace] = (generation, now + _NAMESPACE_LOCAL_TTL)
+    return generation
 
-    Args:
-        pattern: Redis key pattern (supports * wildcard)
 
-    Returns:
-        Number of keys deleted
+async def namespaced_key(namespace: str, key: str) -> str:
+    """Prefix a key with its namespace and the namespace's current generation.
 
-    Example:
-        >>> # Delete all user caches
-        >>> await invalidate_pattern("user:*")
+    Use this with ``get_cached``/``set_cached`` to put manually managed
+    entries in the same namespace as ``@cached(namespace=...)`` functions.
 
-        >>> # Delete specific user cache
-        >>> await invalidate_pattern("user:123:*")
+    Example:
+        >>> key = await namespaced_key("api:users", "user:123")
+        >>> await set_cached(key, user, ttl=300)
     """
-    try:
-        redis = await get_redis()
+    generation = await _namespace_generation(namespace)
+    return f"{namespace}:g{generation}:{key}"
 
-        # Find all matching keys
-        keys = []
-        async for key in redis.scan_iter(match=pattern, count=100):
-            keys.append(key)
 
-        # Delete in batches
-        if keys:
-            deleted = await redis.delete(*keys)
-            logger.info("cache_invalidated", pattern=pattern, count=deleted)
-            return deleted
+async def bump_namespace(namespace: str) -> int:
+    """Invalidate every entry in a namespace with a single INCR.
 
-        return 0
+    Entries are not deleted: their keys embed the old generation, so they are
+    simply never read again and expire through their TTL. Other processes see
+    the new generation within ``_NAMESPACE_LOCAL_TTL`` seconds; this process
+    sees it immediately and drops the namespace's L1 entries.
+
+    Args:
+        namespace: Namespace to invalidate
+
+    Returns:
+        The namespace's new generation, or 0 if Redis is unavailable
 
+    Example:
+        >>> @cached(ttl=300, namespace="api:users")
+        >>> async def get_user(user_id: str) -> dict:
+        ...     return await db.get_user(user_id)
+        >>> await bump_namespace("api:users")  # O(1), however many users
+    """
+    try:
+        redis = await _cache_redis()
+        counter_key = _NAMESPACE_KEY_PREFIX + namespace
+        pipe = redis.pipeline(transaction=False)
+        pipe.set(counter_key, time.time_ns() // 1_000_000, nx=True)
+        pipe.incr(counter_key)
+        _queue_invalidation(pipe, namespaces=[namespace])
+        _, generation, *_ = await pipe.execute()
     except RedisError as e:
-        logger.exception("cache_invalidation_failed", pattern=pattern, error=str(e))
+        logger.exception(
+            "cache_namespace_bump_failed", namespace=namespace, error=str(e)
+        )
         return 0
 
+    _namespace_generations[namespace] = (
+        generation,
+        time.monotonic() + _NAMESPACE_LOCAL_TTL,
+    )
+    _evict_local_matching(f"{namespace}:*")
+    logger.info("cache_namespace_bumped", namespace=namespace, generation=generation)
+    return generation
+
 
 # =============================================================================
 # Cache Warming
@@ -332,16 +4329,24 @@ async def warm_cache(
     value_fn: Callable[[], Awaitable[Any]],
     ttl: int = 3600,
     force: bool = False,
+    *,
+    distributed_lock: bool = False,
+    serializer: CacheSerializer | None = None,
 ) -> bool:
     """Warm cache by pre-loading data.
 
     Useful for frequently accessed data that's expensive to compute.
+    Concurrent warm-ups (and ``@cached`` misses) of the same key in this
+    process share one call to ``value_fn``.
 
     Args:
         key: Cache key
         value_fn: Async function to get the value
         ttl: Time to live in seconds
         force: Force refresh even if key exists
+        distributed_lock: Take a Redis lock so only one worker in the cluster
+            computes the value (e.g. when every pod warms on startup)
+        serializer: Serializer to encode with (default: module serializer)
 
     Returns:
         True if cache was warmed, False if already exists (and not forced)
@@ -358,16 +4363,24 @@ async def warm_cache(
         ... )
     """
     try:
-        redis = await get_redis()
-
         # Check if key exists and not forcing refresh
-        if not force and await redis.exists(key):
+        if not force and await get_cache_backend().exists(key):
             logger.debug("cache_already_warm", key=key)
             return False
 
-        # Get value and cache it
-        value = await value_fn()
-        await redis.setex(key, ttl, json.dumps(value, default=str))
+        # Get value and cache it, coalescing with in-flight computations
+        compute = functools.partial(
+            _recompute,
+            key,
+            value_fn,
+            ttl,
+            distributed_lock=distributed_lock,
+            serializer=serializer,
+        )
+        if await _single_flight(key, compute) is _MISSING:
+            # Joined a background refresh that yielded to another worker's lock
+            await compute()
+        _evict_local(key)
 
         logger.info("cache_warmed", key=key, ttl=ttl)
         return True
@@ -377,6 +4390,191 @@ async def warm_cache(
         return False
 
 
+@dataclass(frozen=True)
+class WarmupEntry:
+    """A key to pre-load, the loader producing its value and its TTL.
+
+    Entries with a higher ``priority`` are warmed first.
+    """
+
+    key: str
+    loader: Callable[[], Awaitable[Any]]
+    ttl: int = 3600
+    priority: int = 0
+
+
+@dataclass
+class WarmupProgress:
+    """Running totals of a manifest warm-up, passed to progress callbacks."""
+
+    total: int
+    warmed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    done: bool = False
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the warm-up started."""
+        return time.monotonic() - self.started_at
+
+
+# Entries registered with register_warmup, by key
+_warmup_manifest: dict[str, WarmupEntry] = {}
+
+
+def register_warmup(
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    *,
+    ttl: int = 3600,
+    priority: int = 0,
+) -> None:
+    """Add a key to the manifest that ``warm_manifest`` warms by default.
+
+    Registering a key again replaces its entry. Register from modules listed
+    in ``CACHE_WARMUP_MODULES`` so the worker and CLI see the same manifest
+    as the application.
+
+    Example:
+        >>> register_warmup("popular_items", get_popular_items, priority=10)
+        >>> register_warmup(
+        ...     "categories", functools.partial(db.get_categories), ttl=86400
+        ... )
+    """
+    _warmup_manifest[key] = WarmupEntry(key, loader, ttl, priority)
+
+
+def get_warmup_manifest() -> list[WarmupEntry]:
+    """Get the registered warm-up entries, highest priority first.
+
+    Imports the modules listed in ``CACHE_WARMUP_MODULES`` first, so their
+    ``register_warmup`` calls have run.
+    """
+    for module in settings.cache_warmup_modules.split(","):
+        if module.strip():
+            importlib.import_module(module.strip())
+    return sorted(_warmup_manifest.values(), key=lambda entry: -entry.priority)
+
+
+async def _load_warmup_entry(entry: WarmupEntry, semaphore: asyncio.Semaphore) -> Any:
+    """Run an entry's loader, returning ``_MISSING`` (logged) if it fails."""
+    async with semaphore:
+        try:
+            return await entry.loader()
+        except Exception as e:  # noqa: BLE001  # One bad loader must not stop the rest
+            logger.warning("cache_warmup_load_failed", key=entry.key, error=str(e))
+            return _MISSING
+
+
+async def _warm_batch(
+    batch: list[WarmupEntry],
+    progress: WarmupProgress,
+    semaphore: asyncio.Semaphore,
+    *,
+    force: bool,
+    serializer: CacheSerializer | None,
+) -> None:
+    """Warm one batch: one EXISTS round trip, bounded loads, one pipelined write."""
+    backend = get_cache_backend()
+    if not force:
+        try:
+            warm = await backend.exists_many([entry.key for entry in batch])
+        except RedisError as e:
+            logger.warning("cache_warmup_failed", count=len(batch), error=str(e))
+            progress.failed += len(batch)
+            return
+        progress.skipped += sum(warm)
+        batch = [
+            entry for entry, is_warm in zip(batch, warm, strict=True) if not is_warm
+        ]
+
+    values = await asyncio.gather(
+        *(_load_warmup_entry(entry, semaphore) for entry in batch)
+    )
+    loaded = {
+        entry.key: (entry, value)
+        for entry, value in zip(batch, values, strict=True)
+        if value is not _MISSING
+    }
+    progress.failed += len(batch) - len(loaded)
+    if not loaded:
+        return
+
+    written = await set_many(
+        {key: value for key, (_, value) in loaded.items()},
+        ttl={key: entry.ttl for key, (entry, _) in loaded.items()},
+        serializer=serializer,
+    )
+    if written:
+        progress.warmed += len(loaded)
+    else:
+        progress.failed += len(loaded)
+
+
+async def warm_manifest(
+    entries: Iterable[WarmupEntry] | None = None,
+    *,
+    concurrency: int | None = None,
+    batch_size: int = _BULK_CHUNK_SIZE,
+    force: bool = False,
+    serializer: CacheSerializer | None = None,
+    on_progress: Callable[[WarmupProgress], None] | None = None,
+) -> WarmupProgress:
+    """Warm many keys, highest priority first, for cold starts after deploys.
+
+    Entries are handled ``batch_size`` at a time: one pipelined EXISTS skips
+    keys that are already cached, at most ``concurrency`` loaders run at once,
+    and the loaded values are written with pipelined SETEX. A failing loader
+    or Redis error is logged and counted, and never stops the warm-up.
+
+    Args:
+        entries: Entries to warm (default: the registered manifest)
+        concurrency: Loaders run at once (default: CACHE_WARMUP_CONCURRENCY)
+        batch_size: Keys per EXISTS check and write round trip
+        force: Reload keys even if they are already cached
+        serializer: Serializer to encode with (default: module serializer)
+        on_progress: Called with running totals after each batch
+
+    Returns:
+        Final totals of warmed, skipped (already warm) and failed keys
+
+    Example:
+        >>> # Application startup, ARQ cron job or the warm-cache CLI command
+        >>> progress = await warm_manifest()
+        >>> logger.info("warmed", warmed=progress.warmed, took=progress.elapsed)
+    """
+    ordered = (
+        get_warmup_manifest()
+        if entries is None
+        else sorted(entries, key=lambda entry: -entry.priority)
+    )
+    progress = WarmupProgress(total=len(ordered))
+    semaphore = asyncio.Semaphore(concurrency or settings.cache_warmup_concurrency)
+
+    for batch in _chunked(ordered, batch_size):
+        await _warm_batch(
+            batch, progress, semaphore, force=force, serializer=serializer
+        )
+        progress.done = (
+            progress.warmed + progress.skipped + progress.failed == progress.total
+        )
+        if on_progress is not None:
+            on_progress(progress)
+
+    progress.done = True
+    logger.info(
+        "cache_manifest_warmed",
+        total=progress.total,
+        warmed=progress.warmed,
+        skipped=progress.skipped,
+        failed=progress.failed,
+        elapsed=progress.elapsed,
+    )
+    return progress
+
+
 # =============================================================================
 # FastAPI Integration
 # =============================================================================
@@ -393,6 +4591,10 @@ app = FastAPI()
 async def startup_event():
     # Initialize Redis connection pool
     await get_redis()
+    # Evict L1 entries when other workers write or invalidate
+    await start_invalidation_listener()
+    # Pre-load registered keys after a deploy without delaying startup
+    app.state.warmup = asyncio.create_task(warm_manifest())
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -402,7 +4604,7 @@ async def shutdown_event():
 # Use caching in endpoints
 from {{ cookiecutter.project_slug }}.core.cache import cached
 
-@cached(ttl=300, key_prefix="api:users")
+@cached(ttl=300, key_prefix="api:users", tags=lambda user_id: [f"user:{user_id}"])
 async def get_user_data(user_id: str) -> dict:
     # This will be cached for 5 minutes
     return await db.get_user(user_id)
@@ -412,14 +4614,14 @@ async def get_user(user_id: str):
     return await get_user_data(user_id)
 
 # Cache invalidation on updates
-from {{ cookiecutter.project_slug }}.core.cache import invalidate_pattern
+from {{ cookiecutter.project_slug }}.core.cache import invalidate_tags
 
 @app.put("/api/users/{user_id}")
 async def update_user(user_id: str, data: dict):
     await db.update_user(user_id, data)
 
-    # Invalidate user cache
-    await invalidate_pattern(f"api:users:*{user_id}*")
+    # Invalidate every entry tagged with this user (no keyspace scan)
+    await invalidate_tags(f"user:{user_id}")
 
     return {"status": "updated"}
 """
@@ -433,11 +4635,15 @@ async def update_user(user_id: str, data: dict):
 async def get_cache_stats() -> dict[str, Any]:
     """Get cache statistics.
 
+    The top-level hit/miss counters are Redis-wide (every client of the
+    instance); ``prefixes`` holds this process's own per-prefix metrics.
+
     Returns:
-        Dictionary with cache statistics
+        Dictionary with cache statistics, including per-prefix cache and lock
+        metrics and L1 counters
     """
     try:
-        redis = await get_redis()
+        redis = await _cache_redis()
         info = await redis.info("stats")
 
         return {
@@ -450,8 +4656,186 @@ async def get_cache_stats() -> dict[str, Any]:
             * 100,
             "memory_used": info.get("used_memory_human", "N/A"),
             "connected_clients": info.get("connected_clients", 0),
+            "prefixes": get_cache_metrics(),
+            "l1": get_local_cache_stats(),
+            "circuit": get_circuit_breaker_state(),
+            "pool": get_pool_stats(),
+            "locks": get_lock_metrics(),
         }
 
     except RedisError as e:
         logger.exception("cache_stats_failed", error=str(e))
-        return {"error": str(e)}
+        # Process-local metrics are still meaningful without Redis
+        return {
+            "error": str(e),
+            "prefixes": get_cache_metrics(),
+            "l1": get_local_cache_stats(),
+            "circuit": get_circuit_breaker_state(),
+            "pool": get_pool_stats(),
+            "locks": get_lock_metrics(),
+        }
+
+
+def _prometheus_labels(**labels: str) -> str:
+    """Format a Prometheus label set, escaping values."""
+    escaped = (
+        f'{name}="'
+        + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        + '"'
+        for name, value in labels.items()
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _render_circuit_metrics() -> list[str]:
+    """Prometheus lines for the circuit breaker."""
+    circuit = _circuit_breaker.snapshot()
+    lines = [
+        "# HELP cache_circuit_state Circuit breaker state (1 = current).",
+        "# TYPE cache_circuit_state gauge",
+    ]
+    for state in (CircuitBreaker.CLOSED, CircuitBreaker.OPEN, CircuitBreaker.HALF_OPEN):
+        labels = _prometheus_labels(state=state)
+        lines.append(f"cache_circuit_state{labels} {int(circuit['state'] == state)}")
+    for counter, description in (
+        ("trips", "Times the circuit breaker opened."),
+        ("rejected", "Redis commands rejected while the circuit was open."),
+    ):
+        lines.append(f"# HELP cache_circuit_{counter}_total {description}")
+        lines.append(f"# TYPE cache_circuit_{counter}_total counter")
+        lines.append(f"cache_circuit_{counter}_total {circuit[counter]}")
+    return lines
+
+
+def _render_pool_metrics() -> list[str]:
+    """Prometheus lines for connection pool utilization and checkout waits."""
+    lines = [
+        "# HELP cache_pool_connections_in_use Connections checked out of the pool.",
+        "# TYPE cache_pool_connections_in_use gauge",
+    ]
+    for role, stats in sorted(_pool_stats.items()):
+        labels = _prometheus_labels(role=role)
+        lines.append(f"cache_pool_connections_in_use{labels} {len(stats.checked_out)}")
+    lines.append("# HELP cache_pool_max_connections Connection pool size.")
+    lines.append("# TYPE cache_pool_max_connections gauge")
+    for role, stats in sorted(_pool_stats.items()):
+        labels = _prometheus_labels(role=role)
+        lines.append(f"cache_pool_max_connections{labels} {stats.max_connections}")
+    lines.append("# HELP cache_pool_checkout_failures_total Failed pool checkouts.")
+    lines.append("# TYPE cache_pool_checkout_failures_total counter")
+    for role, stats in sorted(_pool_stats.items()):
+        labels = _prometheus_labels(role=role)
+        lines.append(
+            f"cache_pool_checkout_failures_total{labels} {stats.checkout_failures}"
+        )
+    lines.append("# HELP cache_pool_wait_seconds Time spent waiting for a connection.")
+    lines.append("# TYPE cache_pool_wait_seconds histogram")
+    for role, stats in sorted(_pool_stats.items()):
+        lines.extend(
+            _render_histogram("cache_pool_wait_seconds", stats.wait, role=role)
+        )
+    return lines
+
+
+def _render_lock_metrics() -> list[str]:
+    """Prometheus lines for distributed lock contention and timing."""
+    lines = []
+    for counter, description in (
+        ("acquired", "Locks acquired."),
+        ("contended", "Acquisitions that found the lock held."),
+        ("timeouts", "Acquisitions that gave up waiting."),
+        ("extended", "Automatic lock extensions."),
+        ("lost", "Locks that expired or were taken over while held."),
+    ):
+        lines.append(f"# HELP cache_lock_{counter}_total {description}")
+        lines.append(f"# TYPE cache_lock_{counter}_total counter")
+        for prefix, metrics in sorted(_lock_metrics.items()):
+            labels = _prometheus_labels(prefix=prefix)
+            lines.append(
+                f"cache_lock_{counter}_total{labels} {metrics.counters[counter]}"
+            )
+    for name, description in (
+        ("wait", "Time spent acquiring locks."),
+        ("hold", "Time locks were held."),
+    ):
+        lines.append(f"# HELP cache_lock_{name}_seconds {description}")
+        lines.append(f"# TYPE cache_lock_{name}_seconds histogram")
+        for prefix, metrics in sorted(_lock_metrics.items()):
+            lines.extend(
+                _render_histogram(
+                    f"cache_lock_{name}_seconds", getattr(metrics, name), prefix=prefix
+                )
+            )
+    return lines
+
+
+def _render_histogram(name: str, histogram: _Histogram, **labels: str) -> list[str]:
+    """Prometheus bucket, sum and count lines for one labelled histogram."""
+    lines = []
+    cumulative = 0
+    bounds = [*map(str, histogram.buckets), "+Inf"]
+    for bound, count in zip(bounds, histogram.counts, strict=True):
+        cumulative += count
+        bucket_labels = _prometheus_labels(**labels, le=bound)
+        lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+    label_set = _prometheus_labels(**labels)
+    lines.append(f"{name}_sum{label_set} {histogram.sum}")
+    lines.append(f"{name}_count{label_set} {histogram.count}")
+    return lines
+
+
+def render_prometheus_metrics() -> str:
+    """Render this process's cache metrics in Prometheus text format.
+
+    Counters and histograms are labelled by key prefix, so TTLs and
+    cache-unfriendly call sites can be tuned per function.
+
+    Example:
+        >>> @app.get("/metrics", response_class=PlainTextResponse)
+        >>> async def metrics() -> str:
+        ...     return render_prometheus_metrics()
+    """
+    prefixes = sorted(_prefix_metrics.items())
+    lines = [
+        "# HELP cache_requests_total Cache lookups by prefix and result.",
+        "# TYPE cache_requests_total counter",
+    ]
+    for prefix, metrics in prefixes:
+        for result in ("hits", "misses", "l1_hits"):
+            labels = _prometheus_labels(prefix=prefix, result=result)
+            lines.append(f"cache_requests_total{labels} {metrics.counters[result]}")
+
+    for counter, description in (
+        ("refreshes", "Background refreshes triggered by SWR or XFetch."),
+        ("errors", "Redis and decoding errors."),
+        ("bypassed", "Calls that skipped Redis because the circuit was open."),
+        ("negative_hits", "Hits on cached None results and cached exceptions."),
+        ("chunked", "Large values written as chunks."),
+        ("oversized", "Values over the size limit, rejected or sent to disk."),
+    ):
+        lines.append(f"# HELP cache_{counter}_total {description}")
+        lines.append(f"# TYPE cache_{counter}_total counter")
+        for prefix, metrics in prefixes:
+            labels = _prometheus_labels(prefix=prefix)
+            lines.append(f"cache_{counter}_total{labels} {metrics.counters[counter]}")
+
+    for name, description in _PrefixMetrics.HISTOGRAMS.values():
+        lines.append(f"# HELP cache_{name} {description}")
+        lines.append(f"# TYPE cache_{name} histogram")
+        for prefix, metrics in prefixes:
+            lines.extend(
+                _render_histogram(
+                    f"cache_{name}", metrics.histograms()[name], prefix=prefix
+                )
+            )
+
+    lines.extend(_render_circuit_metrics())
+    lines.extend(_render_pool_metrics())
+    lines.extend(_render_lock_metrics())
+    lines.append("# HELP cache_l1_entries Entries held in the in-process L1 tier.")
+    lines.append("# TYPE cache_l1_entries gauge")
+    for name, stats in get_local_cache_stats().items():
+        labels = _prometheus_labels(prefix=name)
+        lines.append(f"cache_l1_entries{labels} {stats['size']}")
+
+    return "\n".join(lines) + "\n"
@@ -6,7 +6,17 @@ Pydantic-settings handles the parsing and validation.
 
 from typing import Literal
 
+{% if cookiecutter.include_caching == "yes" -%}
+from pydantic import AliasChoices, Field
+{% endif -%}
 from pydantic_settings import BaseSettings, SettingsConfigDict
+{%- if cookiecutter.include_caching == "yes" %}
+
+
+def _env(name: str) -> AliasChoices:
+    """Accept the prefixed variable name and the bare one used in .env.example."""
+    return AliasChoices(f"{{ cookiecutter.project_slug }}_{name}", name)
+{%- endif %}
 
 
 class Settings(BaseSettings):
@@ -17,6 +27,35 @@ class Settings(BaseSettings):
         log_level: The logging level for the application.
         json_logs: Flag to enable or disable JSON formatted logs.
         include_timestamp: Flag to include timestamps in logs.
+{%- if cookiecutter.include_caching == "yes" %}
+        redis_url: Redis URL (standalone), any node's URL (cluster), or the URL
+            whose credentials/db are used with the sentinels (sentinel).
+        redis_mode: Redis topology: standalone, sentinel or cluster.
+        redis_sentinels: Comma-separated sentinel ``host:port`` addresses.
+        redis_sentinel_service: Name of the monitored primary in Sentinel.
+        redis_replica_url: Replica for read routing in standalone mode.
+        redis_read_from_replicas: Route cache reads to replicas.
+        cache_max_connections: Connection pool size per process.
+        cache_pool_timeout: Seconds to wait for a free pooled connection.
+        cache_socket_timeout: Seconds to wait for a Redis reply.
+        cache_socket_connect_timeout: Seconds to wait when connecting.
+        cache_health_check_interval: Idle seconds before a connection is
+            PINGed on checkout (0 disables).
+        cache_backend: Where cache entries are stored: redis, memory
+            (process-local) or disk (SQLite file).
+        cache_disk_path: SQLite file used by the disk backend.
+        cache_key_hash: Hash for generated cache keys: blake2b (standard
+            library) or xxh3 (faster, needs xxhash). Must match across every
+            process sharing the cache.
+        cache_warmup_modules: Comma-separated modules imported before warming
+            the manifest, so their ``register_warmup`` calls have run.
+        cache_warmup_concurrency: Warm-up loaders run at once.
+        cache_chunk_size: Payloads larger than this many bytes are stored in
+            Redis as chunks of this size (0 disables chunking).
+        cache_max_value_bytes: Largest payload stored in Redis (0: no limit).
+        cache_oversize_action: What happens to larger payloads: reject (not
+            cached) or disk (stored in the SQLite file at cache_disk_path).
+{%- endif %}
     """
 
     model_config = SettingsConfigDict(
@@ -28,6 +67,64 @@ class Settings(BaseSettings):
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
     json_logs: bool = False
     include_timestamp: bool = True
+{%- if cookiecutter.include_caching == "yes" %}
+
+    redis_url: str = Field(
+        default="redis://localhost:6379/0", validation_alias=_env("redis_url")
+    )
+    redis_mode: Literal["standalone", "sentinel", "cluster"] = Field(
+        default="standalone", validation_alias=_env("redis_mode")
+    )
+    redis_sentinels: str = Field(default="", validation_alias=_env("redis_sentinels"))
+    redis_sentinel_service: str = Field(
+        default="mymaster", validation_alias=_env("redis_sentinel_service")
+    )
+    redis_replica_url: str | None = Field(
+        default=None, validation_alias=_env("redis_replica_url")
+    )
+    redis_read_from_replicas: bool = Field(
+        default=False, validation_alias=_env("redis_read_from_replicas")
+    )
+    cache_max_connections: int = Field(
+        default=50, validation_alias=_env("cache_max_connections")
+    )
+    cache_pool_timeout: float = Field(
+        default=2.0, validation_alias=_env("cache_pool_timeout")
+    )
+    cache_socket_timeout: float = Field(
+        default=5.0, validation_alias=_env("cache_socket_timeout")
+    )
+    cache_socket_connect_timeout: float = Field(
+        default=5.0, validation_alias=_env("cache_socket_connect_timeout")
+    )
+    cache_health_check_interval: int = Field(
+        default=30, validation_alias=_env("cache_health_check_interval")
+    )
+    cache_backend: Literal["redis", "memory", "disk"] = Field(
+        default="redis", validation_alias=_env("cache_backend")
+    )
+    cache_disk_path: str = Field(
+        default=".cache/cache.sqlite3", validation_alias=_env("cache_disk_path")
+    )
+    cache_key_hash: Literal["blake2b", "xxh3"] = Field(
+        default="blake2b", validation_alias=_env("cache_key_hash")
+    )
+    cache_warmup_modules: str = Field(
+        default="", validation_alias=_env("cache_warmup_modules")
+    )
+    cache_warmup_concurrency: int = Field(
+        default=16, validation_alias=_env("cache_warmup_concurrency")
+    )
+    cache_chunk_size: int = Field(
+        default=512 * 1024, validation_alias=_env("cache_chunk_size")
+    )
+    cache_max_value_bytes: int = Field(
+        default=64 * 1024 * 1024, validation_alias=_env("cache_max_value_bytes")
+    )
+    cache_oversize_action: Literal["reject", "disk"] = Field(
+        default="reject", validation_alias=_env("cache_oversize_action")
+    )
+{%- endif %}
 
 
 # A single, global instance of the settings
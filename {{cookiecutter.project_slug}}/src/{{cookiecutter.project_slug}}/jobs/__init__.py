@@ -3,8 +3,8 @@
 This package provides background task processing using ARQ (async Redis queue).
 
 Usage:
-    # Start worker
-    arq {{ cookiecutter.project_slug }}.jobs.worker.WorkerSettings
+    # Start a worker serving every queue in QUEUES
+    python -m {{ cookiecutter.project_slug }}.jobs.worker
 
     # Enqueue tasks from your FastAPI app
     from {{ cookiecutter.project_slug }}.jobs.worker import enqueue_task
@@ -0,0 +1,109 @@
+"""Canonical, process-independent encoding of function arguments.
+
+Cache keys and idempotent job IDs are derived from call arguments, so the
+same call must encode identically in every process and across restarts:
+dict keys are sorted, sets are ordered, and objects are identified by their
+type and state instead of their memory address.
+
+Example:
+    >>> canonical_json([("user", 1), {"b": 2, "a": {3, 1}}])
+    '[["user",1],{"a":["1","3"],"b":2}]'
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime
+from datetime import time as dt_time
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class UnstableArgumentError(TypeError):
+    """An argument has no encoding that is the same in every process."""
+
+
+# How arguments of these (non-JSON) types are identified
+_CANONICAL_FORMS: tuple[tuple[type | tuple[type, ...], Callable[[Any], Any]], ...] = (
+    (Enum, lambda value: value.name),
+    (bytes, bytes.hex),
+    ((datetime, date, dt_time, Decimal, uuid.UUID, Path), str),
+)
+
+
+def _instance_state(value: Any) -> dict[str, Any]:
+    """An object's attributes, from its ``__dict__`` and ``__slots__``."""
+    state: dict[str, Any] = {}
+    for cls in type(value).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in {"__dict__", "__weakref__"} and hasattr(value, name):
+                state[name] = getattr(value, name)
+    state.update(getattr(value, "__dict__", {}))
+    return state
+
+
+def _canonical_state(value: Any) -> Any:
+    """The JSON-encodable part of a non-JSON argument that identifies it.
+
+    Objects can define ``__cache_key__()`` to choose their own representation.
+
+    Raises:
+        UnstableArgumentError: If the object has no attributes and only the
+            default ``repr``, which contains its memory address
+    """
+    cache_key = getattr(value, "__cache_key__", None)
+    if cache_key is not None:
+        return cache_key()
+    for types, form in _CANONICAL_FORMS:
+        if isinstance(value, types):
+            return form(value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: getattr(value, f.name) for f in fields(value)}
+    if hasattr(value, "model_dump"):  # Pydantic models
+        return value.model_dump(mode="json")
+    if hasattr(value, "__dict__") or hasattr(type(value), "__slots__"):
+        return _instance_state(value)
+    if type(value).__repr__ is object.__repr__:
+        msg = (
+            f"{type(value).__qualname__} arguments have no stable encoding; "
+            "define __cache_key__() on the class"
+        )
+        raise UnstableArgumentError(msg)
+    return repr(value)
+
+
+def _canonical_default(value: Any) -> Any:
+    """``json.dumps`` hook giving non-JSON arguments a stable, address-free form."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(canonical_json(item) for item in value)
+    type_name = f"{type(value).__module__}.{type(value).__qualname__}"
+    return [type_name, _canonical_state(value)]
+
+
+# Reused across calls: json.dumps builds a new encoder whenever options are passed
+_CANONICAL_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=False,
+    default=_canonical_default,
+)
+
+
+def canonical_json(value: Any) -> str:
+    """Encode a value identically in every process (sorted keys, no addresses).
+
+    Raises:
+        UnstableArgumentError: If an object would only encode with its memory
+            address (see ``__cache_key__``)
+        TypeError: If a dict has keys JSON cannot sort (e.g. mixed types)
+        ValueError: If the value contains a reference cycle
+    """
+    return _CANONICAL_ENCODER.encode(value)
@@ -0,0 +1 @@
+"""Test suite for {{ cookiecutter.project_name }}."""
@@ -0,0 +1,44 @@
+"""Fixtures for cache tests: an in-memory Redis and fresh module state."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from {{ cookiecutter.project_slug }}.core import cache as cache_module  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from types import ModuleType
+
+
+@pytest.fixture
+async def cache(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[ModuleType]:
+    """The cache module wired to a fresh fake Redis, with no state from other tests."""
+    server = fakeredis.FakeServer()
+    redis = fakeredis.FakeAsyncRedis(server=server)
+    text_redis = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    monkeypatch.setattr(cache_module, "_redis_pool", redis)
+    monkeypatch.setattr(cache_module, "_redis_replica", None)
+    monkeypatch.setattr(cache_module, "_redis_text", text_redis)
+    monkeypatch.setattr(cache_module, "_redis_text_replica", None)
+    monkeypatch.setattr(cache_module, "_backend", None)
+    monkeypatch.setattr(cache_module, "_overflow", None)
+    monkeypatch.setattr(cache_module, "_circuit_breaker", cache_module.CircuitBreaker())
+    monkeypatch.setattr(cache_module, "_access_sketch", cache_module._CountMinSketch())
+    monkeypatch.setattr(
+        cache_module, "_memory_lock_store", cache_module.MemoryLockStore()
+    )
+    monkeypatch.setattr(cache_module, "_inflight", {})
+    monkeypatch.setattr(cache_module, "_namespace_generations", {})
+    monkeypatch.setattr(cache_module, "_warmup_manifest", {})
+    monkeypatch.setattr(cache_module, "_local_caches", [])
+    monkeypatch.setattr(cache_module, "_pool_stats", {})
+    cache_module.reset_cache_metrics()
+    yield cache_module
+    await cache_module.stop_invalidation_listener()
+    await text_redis.aclose()
+    await redis.aclose()
@@ -0,0 +1,93 @@
+"""Tests for access-frequency-driven TTLs."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+def test_sketch_counts_and_ages(cache):
+    sketch = cache._CountMinSketch(width=64, depth=4)
+    for _ in range(50):
+        sketch.add("hot")
+    assert sketch.estimate("hot") >= 50
+    assert sketch.estimate("never") <= 50
+
+    for i in range(700):
+        sketch.add(f"k{i}")
+    assert sketch.estimate("hot") < 50  # Aged
+
+
+def test_plan_scales_ttl_with_reads(cache):
+    adaptive = cache.AdaptiveTTL()
+    assert adaptive.plan(3600, None, 1) == (900, None)
+    ttl, stale_ttl = adaptive.plan(3600, None, 8)
+    assert abs(ttl - 3600) < 5
+    assert stale_ttl is None
+    # Hot entries keep part of their lifetime as a refresh-ahead window
+    assert adaptive.plan(3600, None, 1000) == (14400 - 2880, 2880)
+
+    with pytest.raises(ValueError, match="hot_reads"):
+        cache.AdaptiveTTL(hot_reads=1)
+
+
+async def test_hot_keys_get_longer_ttls(cache):
+    calls = []
+
+    @cache.cached(
+        ttl=400,
+        key_prefix="ad",
+        adaptive_ttl=cache.AdaptiveTTL(hot_reads=4),
+        l1_maxsize=10,
+    )
+    async def load(x):
+        calls.append(x)
+        return x
+
+    redis = await cache.get_redis()
+    await load("cold")
+    cold_ttl = await redis.ttl(cache.build_cache_key(load, ("cold",), key_prefix="ad"))
+
+    for _ in range(5):
+        await load("hot")  # L1 hits count as reads too
+    key = cache.build_cache_key(load, ("hot",), key_prefix="ad")
+    await redis.delete(key)
+    cache.clear_local_caches()
+    await load("hot")
+
+    assert 95 <= cold_ttl <= 100
+    assert 1500 <= await redis.ttl(key) <= 1600
+    assert calls == ["cold", "hot", "hot"]
+
+
+async def test_hot_entries_refresh_ahead(cache, monkeypatch):
+    calls = []
+
+    @cache.cached(
+        ttl=100,
+        key_prefix="ra",
+        adaptive_ttl=cache.AdaptiveTTL(hot_reads=2, longest=1.0),
+    )
+    async def load(x):
+        calls.append(x)
+        return len(calls)
+
+    redis = await cache._cache_redis()
+    key = cache.build_cache_key(load, (1,), key_prefix="ra")
+    await load(1)
+    await redis.delete(key)
+    await load(1)  # Now hot: stored with a soft expiry
+
+    entry = cache._decode(await redis.get(key), key)
+    assert isinstance(entry, cache._Envelope)
+    assert 75 <= entry["x"] - time.time() <= 81
+
+    real_time = time.time
+    monkeypatch.setattr(cache.time, "time", lambda: real_time() + 85)
+    assert await load(1) == 2  # Served while refreshing in the background
+    await asyncio.sleep(0.05)
+    assert len(calls) == 3
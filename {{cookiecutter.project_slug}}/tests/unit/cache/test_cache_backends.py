@@ -0,0 +1,96 @@
+"""Tests for the in-process memory and SQLite disk cache backends."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(params=["memory", "disk"])
+async def backend(cache, monkeypatch, tmp_path, request):
+    """The cache configured with a non-Redis backend and an unreachable Redis."""
+    if request.param == "memory":
+        backend = cache.MemoryBackend()
+    else:
+        backend = cache.DiskBackend(tmp_path / "c" / "cache.db", purge_interval=0)
+    cache.configure_cache_backend(backend)
+    monkeypatch.setattr(cache, "_redis_pool", None)
+    monkeypatch.setattr(cache.settings, "redis_url", "redis://127.0.0.1:1/0")
+    yield backend
+    await backend.close()
+
+
+async def _value(value):
+    return value
+
+
+async def test_cache_api_runs_without_redis(cache, backend):
+    calls = []
+
+    @cache.cached(ttl=60, key_prefix="f", stale_ttl=10)
+    async def load(x):
+        calls.append(x)
+        return {"x": x}
+
+    assert await load(1) == {"x": 1}
+    assert await load(1) == {"x": 1}
+    assert calls == [1]
+
+    assert await cache.set_cached("k:1", [1, 2], ttl=60)
+    assert await cache.get_cached("k:1") == [1, 2]
+    assert await cache.set_many({"k:2": 2, "k:3": 3}, ttl=60)
+    assert await cache.get_many(["k:2", "k:3", "k:4"]) == (
+        {"k:2": 2, "k:3": 3},
+        ["k:4"],
+    )
+    assert await cache.invalidate_pattern("k:*") == 3
+    assert await cache.get_cached("k:1", "d") == "d"
+
+    assert await cache.warm_cache("w", lambda: _value("v"))
+    assert not await cache.warm_cache("w", lambda: _value("v"))
+    assert await cache.get_cached("w") == "v"
+    assert await cache.delete_cached("w")
+    assert not await cache.delete_cached("w")
+
+    assert cache.get_circuit_breaker_state()["state"] == "closed"
+
+
+async def test_entries_expire(cache, backend):
+    await cache.set_cached("e", 1, ttl=0)
+    await asyncio.sleep(0.01)
+    assert await cache.get_cached("e") is None
+
+
+async def test_disk_entries_survive_reopening(cache, tmp_path):
+    backend = cache.DiskBackend(tmp_path / "p.db")
+    await backend.set("a", b"1", 60)
+    await backend.close()
+
+    reopened = cache.DiskBackend(tmp_path / "p.db")
+    assert await reopened.get("a") == b"1"
+    assert await reopened.delete_pattern("[a]") == 1
+    await reopened.close()
+
+
+async def test_memory_backend_evicts_least_recently_used(cache):
+    backend = cache.MemoryBackend(maxsize=2)
+    await backend.set("a", b"1", 60)
+    await backend.set("b", b"2", 60)
+    await backend.get("a")
+    await backend.set("c", b"3", 60)
+    assert await backend.get_many(["a", "b", "c"]) == [b"1", None, b"3"]
+
+
+async def test_disk_failures_degrade_like_redis_outages(cache, tmp_path):
+    (tmp_path / "dir.db").mkdir()
+    cache.configure_cache_backend(cache.DiskBackend(tmp_path / "dir.db"))
+
+    @cache.cached(ttl=5)
+    async def load():
+        return 5
+
+    assert await cache.get_cached("x", "d") == "d"
+    assert await load() == 5
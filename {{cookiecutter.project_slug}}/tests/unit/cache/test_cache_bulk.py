@@ -0,0 +1,86 @@
+"""Tests for bulk cache operations and ``@cached_batch``."""
+
+from __future__ import annotations
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+async def test_set_get_and_delete_many(cache):
+    assert await cache.set_many({"a": 1, "b": {"x": 2}}, ttl={"a": 5})
+    redis = await cache.get_redis()
+    assert 0 < await redis.ttl("a") <= 5
+    assert await redis.ttl("b") > 5
+
+    hits, misses = await cache.get_many(["a", "zz", "b"])
+    assert hits == {"a": 1, "b": {"x": 2}}
+    assert misses == ["zz"]
+
+    assert await cache.delete_many(["a", "b", "zz"]) == 2
+
+
+async def test_cached_batch_loads_only_missing_ids(cache):
+    calls = []
+
+    @cache.cached_batch(ttl=60, key_prefix="u")
+    async def load_users(ids, flag=False):
+        calls.append(list(ids))
+        return {i: {"id": i, "flag": flag} for i in ids if i != 9}
+
+    assert await load_users([1, 2, 9]) == {
+        1: {"id": 1, "flag": False},
+        2: {"id": 2, "flag": False},
+    }
+    # Request order is kept, duplicates collapse
+    assert list(await load_users([3, 2, 1, 1])) == [3, 2, 1]
+    # Extra arguments are part of the key
+    await load_users([1], flag=True)
+    assert calls == [[1, 2, 9], [3], [1]]
+
+
+async def test_cached_batch_shares_keys_with_single_item_calls(cache):
+    single_calls = []
+
+    @cache.cached_batch(ttl=60, key_prefix="user")
+    async def load_users(user_ids, region="eu"):
+        return {i: f"{region}-{i}" for i in user_ids}
+
+    @cache.cached(ttl=60, key_prefix="user")
+    async def load_user(user_id, region="eu"):
+        single_calls.append(user_id)
+        return f"single-{user_id}"
+
+    await load_users(["1", "2"])
+    await load_users(["1"], "us")
+
+    assert await load_user("1") == "eu-1"
+    assert await load_user("1", "us") == "us-1"
+    assert single_calls == []
+
+    key = cache.build_cache_key(load_users, ("2",), key_prefix="user")
+    assert await cache.delete_cached(key)
+    assert await load_user("2") == "single-2"
+
+
+async def test_cached_batch_methods_skip_self(cache):
+    class Repository:
+        def __init__(self, region):
+            self.region = region
+            self.calls = []
+
+        @cache.cached_batch(ttl=60, key_prefix="user")
+        async def load_users(self, user_ids, status="active"):
+            self.calls.append(list(user_ids))
+            return {i: f"{self.region}-{i}-{status}" for i in user_ids}
+
+    eu, us = Repository("eu"), Repository("us")
+
+    assert await eu.load_users(["1", "2"]) == {"1": "eu-1-active", "2": "eu-2-active"}
+    # Entries are shared between instances, as for @cached methods
+    assert await us.load_users(["2", "3"]) == {"2": "eu-2-active", "3": "us-3-active"}
+    assert await us.load_users(["3"], "gone") == {"3": "us-3-gone"}
+    assert eu.calls == [["1", "2"]]
+    assert us.calls == [["3"], ["3"]]
+    key = cache.build_cache_key(Repository.load_users, (eu, "1"), key_prefix="user")
+    assert await cache.get_cached(key) == "eu-1-active"
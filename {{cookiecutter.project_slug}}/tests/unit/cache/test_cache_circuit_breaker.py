@@ -0,0 +1,113 @@
+"""Tests for the Redis circuit breaker and the fail-open cache path."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def redis_down(cache, monkeypatch):
+    """Point the cache at a Redis nobody listens on."""
+    monkeypatch.setattr(cache.settings, "redis_url", "redis://127.0.0.1:1/0")
+    monkeypatch.setattr(cache.settings, "redis_mode", "standalone")
+    monkeypatch.setattr(cache.settings, "redis_read_from_replicas", False)
+    monkeypatch.setattr(cache.settings, "cache_socket_connect_timeout", 0.2)
+    monkeypatch.setattr(cache, "_redis_pool", None)
+    breaker = cache.CircuitBreaker(failure_threshold=2, recovery_timeout=0.2)
+    monkeypatch.setattr(cache, "_circuit_breaker", breaker)
+    return breaker
+
+
+async def test_cached_call_survives_unreachable_redis(cache, redis_down):
+    calls = []
+
+    @cache.cached(ttl=60, key_prefix="outage")
+    async def load(x):
+        calls.append(x)
+        return {"x": x}
+
+    # Every call must fall back to the function, never raise
+    for _ in range(5):
+        assert await load(1) == {"x": 1}
+    assert calls == [1] * 5
+    assert redis_down.state == "open"
+    assert cache.get_cache_metrics()["outage"]["bypassed"] >= 1
+
+    assert await cache.get_cached("outage:x", default="d") == "d"
+    assert await cache.set_cached("outage:x", 1) is False
+    assert await cache.delete_cached("outage:x") is False
+
+
+async def test_open_breaker_fails_fast_then_probes(cache, redis_down):
+    @cache.cached(ttl=60)
+    async def load(x):
+        return x
+
+    await load(1)
+    await load(1)
+    assert redis_down.state == "open"
+
+    start = time.monotonic()
+    for _ in range(50):
+        assert await load(1) == 1
+    assert time.monotonic() - start < 0.5
+    assert redis_down.rejected >= 50
+
+    # After the recovery timeout a single probe goes through and fails again
+    await asyncio.sleep(0.25)
+    await load(1)
+    assert redis_down.state == "open"
+
+
+def test_half_open_admits_one_probe(cache):
+    breaker = cache.CircuitBreaker(failure_threshold=1, recovery_timeout=0.0)
+    breaker.record_failure(timeout=False)
+    assert breaker.state == "open"
+
+    breaker.before_call()
+    assert breaker.state == "half_open"
+    with pytest.raises(cache.CacheCircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert 'cache_circuit_state{state="closed"} 1' in cache.render_prometheus_metrics()
+
+
+def test_timeout_rate_trips_breaker(cache):
+    breaker = cache.CircuitBreaker(
+        failure_threshold=100, window_size=10, min_calls=4, timeout_rate_threshold=0.5
+    )
+    for _ in range(3):
+        breaker.record_success()
+        breaker.record_failure(timeout=True)
+    assert breaker.state == "open"
+
+
+async def test_cancelled_probe_releases_half_open_slot(cache, monkeypatch):
+    breaker = cache.CircuitBreaker(failure_threshold=1, recovery_timeout=0.0)
+    breaker.record_failure(timeout=False)
+    monkeypatch.setattr(cache, "_circuit_breaker", breaker)
+
+    task = asyncio.ensure_future(cache._guarded(lambda: asyncio.sleep(1)))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert not breaker._probe_in_flight
+
+
+async def test_health_check_reports_open_breaker(cache, redis_down):
+    health = pytest.importorskip("{{ cookiecutter.project_slug }}.api.health")
+    redis_down.record_failure(timeout=False)
+    redis_down.record_failure(timeout=False)
+
+    check = await health.check_cache()
+
+    assert not check.status
+    assert "circuit breaker open" in check.error
+    assert check.latency_ms is not None
@@ -0,0 +1,76 @@
+"""Tests for the Redis clients, pool instrumentation and the cache health check."""
+
+from __future__ import annotations
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+pytestmark = pytest.mark.unit
+
+
+async def test_get_redis_decodes_replies_but_cache_stays_binary(cache):
+    redis = await cache.get_redis()
+    await redis.set("greeting", "hello")
+    assert await redis.get("greeting") == "hello"
+
+    await cache.set_cached("payload", {"a": 1})
+    assert isinstance(await (await cache._cache_redis()).get("payload"), bytes)
+    assert await cache.get_cached("payload") == {"a": 1}
+
+
+async def test_replica_clients_fall_back_to_the_primary(cache):
+    assert await cache.get_redis_replica() is cache._redis_text
+    assert await cache._cache_redis_replica() is cache._redis_pool
+
+
+async def test_standalone_pool_records_checkout_failures(cache, monkeypatch):
+    monkeypatch.setattr(cache.settings, "cache_max_connections", 3)
+    monkeypatch.setattr(cache.settings, "cache_pool_timeout", 0.1)
+    monkeypatch.setattr(cache.settings, "cache_socket_connect_timeout", 0.1)
+    monkeypatch.setattr(
+        cache, "_circuit_breaker", cache.CircuitBreaker(failure_threshold=100)
+    )
+    client = cache._standalone_client(
+        "redis://127.0.0.1:1/0", "primary", decode_responses=False
+    )
+    assert isinstance(client.connection_pool, cache._InstrumentedPool)
+    assert client.connection_pool.max_connections == 3
+
+    with pytest.raises(RedisConnectionError):
+        await client.get("x")
+    await client.aclose()
+
+    stats = cache.get_pool_stats()["primary"]
+    assert stats["checkout_failures"] == 1
+    assert stats["in_use"] == 0
+    text = cache.render_prometheus_metrics()
+    assert 'cache_pool_max_connections{role="primary"} 3' in text
+    assert 'cache_pool_wait_seconds_count{role="primary"} 1' in text
+
+
+async def test_timed_checkout_tracks_connections_in_use(cache):
+    stats = cache._PoolStats("primary", 2)
+
+    async def connect():
+        return object()
+
+    connection = await cache._timed_checkout(stats, connect())
+    assert stats.snapshot()["in_use"] == 1
+    assert stats.peak_in_use == 1
+
+    stats.checked_out.discard(id(connection))
+    assert stats.snapshot()["utilization"] == 0
+
+
+async def test_health_check_uses_the_configured_backend(cache, monkeypatch):
+    health = pytest.importorskip("{{ cookiecutter.project_slug }}.api.health")
+    # Redis is unreachable, but entries live in process memory
+    monkeypatch.setattr(cache.settings, "redis_url", "redis://127.0.0.1:1/0")
+    monkeypatch.setattr(cache.settings, "cache_socket_connect_timeout", 0.1)
+    monkeypatch.setattr(cache, "_redis_pool", None)
+    monkeypatch.setattr(cache, "_redis_text", None)
+    cache.configure_cache_backend(cache.MemoryBackend())
+
+    check = await health.check_cache()
+
+    assert check.status, check.error
@@ -0,0 +1,82 @@
+"""Tests for ``DistributedLock`` on the Redis and in-process stores."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(params=["redis", "memory"])
+def store(cache, request):
+    """Lock store under test (None selects the default Redis store)."""
+    return None if request.param == "redis" else cache.MemoryLockStore()
+
+
+async def test_auto_extend_holds_the_lock_past_its_ttl(cache, store):
+    holder = cache.DistributedLock("job:x", ttl=0.3, timeout=0, store=store)
+    waiter = cache.DistributedLock(
+        "job:x", ttl=0.3, timeout=0.2, backoff=0.01, store=store
+    )
+
+    assert await holder.acquire()
+    first_token = holder.fencing_token
+    assert await holder.locked()
+    assert not await waiter.acquire()
+    await asyncio.sleep(0.5)
+    assert holder.held
+    assert not await waiter.acquire(blocking=False)
+
+    await holder.release()
+    assert not await holder.locked()
+    async with waiter:
+        assert waiter.fencing_token > first_token
+
+    metrics = cache.get_lock_metrics()["job"]
+    assert metrics["acquired"] == 2
+    assert metrics["timeouts"] >= 1
+    assert metrics["extended"] >= 1
+    assert "cache_lock_wait_seconds_bucket" in cache.render_prometheus_metrics()
+
+
+async def test_context_manager_raises_on_timeout(cache, store):
+    async with cache.DistributedLock("job:x", store=store):
+        with pytest.raises(cache.LockTimeoutError):
+            async with cache.DistributedLock("job:x", timeout=0, store=store):
+                pass
+
+
+async def test_expired_lock_cannot_be_extended_or_released(cache, store):
+    expired = cache.DistributedLock("job:y", ttl=0.3, auto_extend=False, store=store)
+    assert await expired.acquire()
+    await asyncio.sleep(0.35)
+
+    successor = cache.DistributedLock("job:y", timeout=0, store=store)
+    assert await successor.acquire()
+    assert not await expired.extend()
+    await expired.release()
+    assert await successor.locked()
+    await successor.release()
+
+
+async def test_waiter_acquires_after_release(cache):
+    store = cache.MemoryLockStore()
+    holder = cache.DistributedLock("w:1", store=store)
+    await holder.acquire()
+    waiter = cache.DistributedLock(
+        "w:1", timeout=2, backoff=0.01, max_backoff=0.05, store=store
+    )
+
+    acquiring = asyncio.create_task(waiter.acquire())
+    await asyncio.sleep(0.1)
+    await holder.release()
+    assert await acquiring
+    await waiter.release()
+
+
+def test_default_store_follows_the_backend(cache):
+    assert isinstance(cache.DistributedLock("a").store, cache.RedisLockStore)
+    cache.configure_cache_backend(cache.MemoryBackend())
+    assert cache.DistributedLock("a").store is cache._memory_lock_store
@@ -0,0 +1,64 @@
+"""Tests for streaming, rate-limited and background pattern invalidation."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+async def _fill(redis, prefix, count):
+    await redis.mset({f"{prefix}:{i}": b"x" for i in range(count)})
+
+
+async def test_deletes_matching_keys_in_batches(cache):
+    redis = await cache.get_redis()
+    await _fill(redis, "user", 1234)
+    await redis.set("other", b"y")
+    progress = []
+
+    deleted = await cache.invalidate_pattern(
+        "user:*",
+        batch_size=100,
+        on_progress=lambda p: progress.append((p.deleted, p.done)),
+    )
+
+    assert deleted == 1234
+    assert progress[-1] == (1234, True)
+    assert len(progress) > 2
+    assert await redis.exists("other")
+    assert await cache.invalidate_pattern("nothing:*") == 0
+
+
+async def test_large_invalidation_continues_in_background(cache):
+    redis = await cache.get_redis()
+    await _fill(redis, "k", 1000)
+    progress = []
+    finished = asyncio.Event()
+
+    def record(update):
+        progress.append(update)
+        if update.done:
+            finished.set()
+
+    deleted = await cache.invalidate_pattern(
+        "k:*", batch_size=50, background_after=100, on_progress=record
+    )
+
+    assert 100 <= deleted < 1000
+    assert progress[-1].background
+    await asyncio.wait_for(finished.wait(), timeout=5)
+    assert progress[-1].deleted == 1000
+    assert not await redis.keys("k:*")
+
+
+async def test_deletion_rate_is_limited(cache):
+    redis = await cache.get_redis()
+    await _fill(redis, "k", 200)
+
+    started = time.monotonic()
+    await cache.invalidate_pattern("k:*", batch_size=50, max_keys_per_second=1000)
+    assert time.monotonic() - started > 0.1
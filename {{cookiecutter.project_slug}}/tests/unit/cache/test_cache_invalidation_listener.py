@@ -0,0 +1,78 @@
+"""Tests for cross-process L1 invalidation over pub/sub."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+CHANNEL = "cache:invalidation"
+
+
+async def _next_message(pubsub):
+    while True:
+        message = await pubsub.get_message(timeout=1)
+        if message is not None:
+            return json.loads(message["data"])
+
+
+@pytest.fixture
+async def announcements(cache):
+    """Subscriber seeing what this process publishes, with the listener running."""
+    await cache.start_invalidation_listener(CHANNEL)
+    await asyncio.sleep(0.05)
+    pubsub = (await cache.get_redis()).pubsub(ignore_subscribe_messages=True)
+    await pubsub.subscribe(CHANNEL)
+    yield pubsub
+    await pubsub.aclose()
+
+
+async def test_writes_are_announced(cache, announcements):
+    await cache.set_cached("a", 1)
+    assert (await _next_message(announcements))["keys"] == ["a"]
+
+    await cache.invalidate_pattern("a*")
+    assert (await _next_message(announcements))["patterns"] == ["a*"]
+
+    await cache.bump_namespace("ns")
+    assert (await _next_message(announcements))["namespaces"] == ["ns"]
+
+
+async def test_other_processes_evict_local_entries(cache, announcements):
+    calls = []
+
+    @cache.cached(ttl=60, l1_maxsize=10, l1_ttl=600)
+    async def load(x):
+        calls.append(x)
+        return len(calls)
+
+    assert await load(1) == 1
+    key = (await _next_message(announcements))["keys"][0]
+
+    # Another process writes a new value and announces it
+    redis = await cache.get_redis()
+    await redis.set(key, cache._default_serializer.dumps(42))
+    assert await load(1) == 1  # Still served from L1
+    message = {"origin": "other", "keys": [key], "patterns": [], "namespaces": []}
+    await redis.publish(CHANNEL, json.dumps(message))
+    await asyncio.sleep(0.05)
+
+    assert await load(1) == 42
+    assert calls == [1]
+
+
+async def test_malformed_messages_are_ignored(cache, announcements):
+    redis = await cache.get_redis()
+    await redis.publish(CHANNEL, b"garbage")
+    await asyncio.sleep(0.05)
+    assert not cache._invalidation_listener.done()
+
+
+async def test_stop_listener_stops_announcing(cache):
+    await cache.start_invalidation_listener(CHANNEL)
+    await cache.stop_invalidation_listener()
+    assert cache._invalidation_listener is None
+    assert cache._invalidation_channel is None
@@ -0,0 +1,139 @@
+"""Tests for canonical, process-independent cache keys."""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import decimal
+import enum
+import subprocess
+import sys
+import uuid
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+class Color(enum.Enum):
+    RED = 1
+
+
+@dataclasses.dataclass
+class Query:
+    a: int
+    b: list
+
+
+class Plain:
+    def __init__(self, x):
+        self.x = x
+
+
+class Slotted:
+    __slots__ = ("x",)
+
+    def __init__(self, x):
+        self.x = x
+
+
+def load(x=None, *rest, **options):
+    return x
+
+
+def test_keys_ignore_ordering_and_use_a_full_digest(cache):
+    key = cache._build_cache_key(
+        load, "", None, ({"b": 1, "a": [1, 2]}, {3, 1}), {"z": 1, "y": 2}
+    )
+    prefix, digest = key.split(":")
+    assert prefix == "load"
+    assert len(digest) == 32
+    assert key == cache._build_cache_key(
+        load, "", None, ({"a": [1, 2], "b": 1}, {1, 3}), {"y": 2, "z": 1}
+    )
+
+
+def test_keys_are_identical_across_processes(cache):
+    key = cache._build_cache_key(load, "", None, ({"b": 1}, {3, 1}), {"z": 1})
+    code = (
+        "from {{ cookiecutter.project_slug }}.core import cache\n"
+        "def load(x=None, *rest, **options): return x\n"
+        "print(cache._build_cache_key(load, '', None, ({'b': 1}, {3, 1}), {'z': 1}))"
+    )
+    result = subprocess.run(  # noqa: S603  # Fixed interpreter and code
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={"PYTHONHASHSEED": "123", "PYTHONPATH": ":".join(sys.path)},
+        check=True,
+    )
+    assert result.stdout.strip() == key
+
+
+def test_rich_arguments_and_objects(cache):
+    def arguments(last):
+        return (
+            Color.RED,
+            Query(1, [2]),
+            datetime.date(2024, 1, 2),
+            decimal.Decimal("1.5"),
+            uuid.UUID(int=5),
+            b"\x00",
+            Plain(last),
+        )
+
+    key = cache._build_cache_key(load, "p", None, arguments(3), {})
+    assert key == cache._build_cache_key(load, "p", None, arguments(3), {})
+    assert key != cache._build_cache_key(load, "p", None, arguments(4), {})
+
+    # Dict keys JSON cannot represent fall back to repr
+    assert cache._build_cache_key(load, "p", None, ({(1, 2): 3},), {}).startswith("p:")
+    assert cache._build_cache_key(load, "p", None, ({1: 1, "a": 2},), {}).startswith(
+        "p:"
+    )
+
+
+def test_slots_objects_are_keyed_by_their_state(cache):
+    key = cache._build_cache_key(load, "p", None, (Slotted(1),), {})
+    assert key == cache._build_cache_key(load, "p", None, (Slotted(1),), {})
+    assert key != cache._build_cache_key(load, "p", None, (Slotted(2),), {})
+
+
+async def test_address_only_objects_are_rejected(cache):
+    @cache.cached(ttl=60)
+    async def lookup(value):
+        return value
+
+    with pytest.raises(TypeError, match="__cache_key__"):
+        await lookup(object())
+    with pytest.raises(TypeError, match="__cache_key__"):
+        cache._build_cache_key(load, "p", None, ({"a": [object()]},), {})
+
+
+def test_self_and_dependencies_are_not_keyed(cache):
+    depends = type(
+        "Depends",
+        (),
+        {"__module__": "fastapi.params", "__init__": lambda self, d: None},
+    )
+
+    def session():
+        return None
+
+    class Repository:
+        def get(self, x, session=depends(session)):
+            return x
+
+    def key(*args, **kwargs):
+        return cache._build_cache_key(Repository.get, "r", None, args, kwargs)
+
+    first = key(Repository(), 1, session=object())
+    assert first == key(Repository(), 1, session=object())
+    assert first == key(Repository(), 1)
+    assert first != key(Repository(), 2)
+
+
+def test_xxh3_digest(cache, monkeypatch):
+    pytest.importorskip("xxhash")
+    monkeypatch.setattr(cache, "_key_hasher", cache._load_key_hasher("xxh3"))
+    assert len(cache._build_cache_key(load, "", None, (1,), {}).split(":")[1]) == 32
@@ -0,0 +1,106 @@
+"""Tests for chunked storage of large values and the oversize policy."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+async def _keys(redis, pattern):
+    return sorted([key async for key in redis.scan_iter(pattern)])
+
+
+@pytest.fixture
+def small_chunks(cache, monkeypatch):
+    monkeypatch.setattr(cache.settings, "cache_chunk_size", 1000)
+
+
+@pytest.mark.usefixtures("small_chunks")
+async def test_chunked_roundtrip_and_delete(cache):
+    redis = await cache._cache_redis()
+    value = os.urandom(2750).hex()  # Incompressible
+
+    assert await cache.set_cached("big:1", value, ttl=60)
+    assert await cache.set_cached("big:small", "x", ttl=60)
+    chunk_keys = await _keys(redis, "big:1:chunk:*")
+    assert len(chunk_keys) > 5
+    assert (await redis.get("big:1")).startswith(cache._MANIFEST_MAGIC)
+
+    assert await cache.get_cached("big:1") == value
+    hits, _ = await cache.get_many(["big:small", "big:1", "big:none"])
+    assert hits == {"big:small": "x", "big:1": value}
+
+    assert await cache.delete_many(["big:1", "big:small"]) == 2
+    assert await _keys(redis, "big:*") == []
+    assert cache.get_cache_metrics()["big"]["chunked"] == 1
+
+
+@pytest.mark.usefixtures("small_chunks")
+async def test_damaged_chunks_read_as_misses(cache):
+    redis = await cache._cache_redis()
+    await cache.set_cached("big:1", os.urandom(2750).hex(), ttl=60)
+    chunk_keys = await _keys(redis, "big:1:chunk:*")
+
+    await redis.set(chunk_keys[0], b"garbage")
+    assert await cache.get_cached("big:1", default="MISS") == "MISS"
+    await redis.delete(chunk_keys[1])
+    assert await cache.get_cached("big:1", default="MISS") == "MISS"
+
+
+@pytest.mark.usefixtures("small_chunks")
+async def test_tag_invalidation_removes_chunks(cache):
+    redis = await cache._cache_redis()
+    calls = []
+
+    @cache.cached(ttl=60, key_prefix="report", tags=lambda x: [f"r:{x}"])
+    async def report(x):
+        calls.append(x)
+        return os.urandom(2750).hex()
+
+    assert await report(1) == await report(1)
+    assert calls == [1]
+    assert await _keys(redis, "*:chunk:*")
+
+    assert await cache.invalidate_tags("r:1") == 1
+    assert await _keys(redis, "*:chunk:*") == []
+
+
+@pytest.mark.usefixtures("small_chunks")
+async def test_pattern_invalidation_removes_chunks(cache):
+    redis = await cache._cache_redis()
+    await cache.set_cached("big:1", os.urandom(2750).hex(), ttl=60)
+    await cache.set_cached("big:2", os.urandom(2750).hex(), ttl=60)
+
+    # The pattern matches the entry but none of its chunk keys
+    assert await cache.invalidate_pattern("big:[1]") == 1
+    assert await _keys(redis, "big:1*") == []
+    assert await _keys(redis, "big:2:chunk:*")
+
+
+async def test_oversized_values_are_rejected_or_diverted_to_disk(
+    cache, monkeypatch, tmp_path
+):
+    monkeypatch.setattr(cache.settings, "cache_max_value_bytes", 500)
+    monkeypatch.setattr(cache.settings, "cache_disk_path", str(tmp_path / "o.db"))
+    redis = await cache._cache_redis()
+    value = os.urandom(1000).hex()
+
+    assert not await cache.set_cached("ov:1", value, ttl=60)
+    assert await cache.get_cached("ov:1") is None
+
+    monkeypatch.setattr(cache.settings, "cache_oversize_action", "disk")
+    assert await cache.set_cached("ov:1", value, ttl=60)
+    assert len(await redis.get("ov:1")) < 200
+    assert await cache.get_cached("ov:1") == value
+    assert await cache.delete_cached("ov:1")
+    assert await cache._overflow_backend().get("ov:1") is None
+
+    # Pattern invalidation clears the diverted copy too
+    assert await cache.set_cached("ov:2", value, ttl=60)
+    assert await cache.invalidate_pattern("ov:*") == 1
+    assert await cache._overflow_backend().get("ov:2") is None
+    assert cache.get_cache_metrics()["ov"]["oversized"] == 3
+    await cache._overflow_backend().close()
@@ -0,0 +1,60 @@
+"""Tests for the in-process L1 tier of ``@cached``."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+async def test_l1_serves_repeat_reads_and_evicts_lru(cache):
+    calls = []
+
+    @cache.cached(ttl=60, key_prefix="cfg", l1_maxsize=2, l1_ttl=10)
+    async def load(x):
+        calls.append(x)
+        return {"x": x}
+
+    assert await load(1) == {"x": 1}
+    assert await load(1) == {"x": 1}
+    await load(2)
+    await load(3)  # Evicts 1 from L1
+    assert await load(1) == {"x": 1}  # Served by Redis, not recomputed
+
+    assert calls == [1, 2, 3]
+    stats = cache.get_local_cache_stats()["cfg"]
+    assert stats["hits"] == 1
+    assert stats["evictions"] >= 1
+
+
+async def test_l1_entries_expire_after_l1_ttl(cache):
+    calls = []
+
+    @cache.cached(ttl=60, key_prefix="exp", l1_maxsize=10, l1_ttl=0.05)
+    async def load():
+        calls.append(1)
+        return len(calls)
+
+    assert await load() == 1
+    assert await load() == 1
+    await asyncio.sleep(0.06)
+    assert await load() == 1  # L1 expired; Redis still holds the value
+    assert calls == [1]
+    assert cache.get_local_cache_stats()["exp"]["hits"] == 1
+
+
+async def test_clear_local_caches_falls_back_to_redis(cache):
+    calls = []
+
+    @cache.cached(ttl=60, key_prefix="clr", l1_maxsize=10)
+    async def load():
+        calls.append(1)
+        return len(calls)
+
+    assert await load() == 1
+    cache.clear_local_caches()
+    assert await load() == 1
+    assert calls == [1]
+    assert cache.get_local_cache_stats()["clr"]["size"] == 1
@@ -0,0 +1,101 @@
+"""Tests for ``@memoize``, the synchronous in-process cache."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+def test_memoize_caches_evicts_and_invalidates(cache):
+    calls = []
+
+    @cache.memoize(ttl=60, maxsize=2)
+    def load(x, y=0):
+        calls.append((x, y))
+        return [x, y]
+
+    assert load(1) == [1, 0]
+    assert load(1) == [1, 0]
+    assert calls == [(1, 0)]
+
+    load(2)
+    load(3)
+    assert load.cache_stats()["evictions"] == 1
+    load(1)
+    assert len(calls) == 4
+
+    assert load.invalidate(1)
+    assert not load.invalidate(1)
+    load.cache_clear()
+    assert load.cache_stats()["size"] == 0
+    assert cache.get_cache_metrics()["load"]["l1_hits"] == 1
+    assert "load" in cache.get_local_cache_stats()
+
+
+def test_unhashable_arguments(cache):
+    @cache.memoize(unhashable="bypass", key_prefix="bypass")
+    def length(x):
+        return len(x)
+
+    assert length([1, 2]) == 2
+    assert cache.get_cache_metrics()["bypass"]["bypassed"] == 1
+
+    @cache.memoize(unhashable="error", key_prefix="strict")
+    def strict(x):
+        return x
+
+    with pytest.raises(TypeError):
+        strict({})
+
+    @cache.memoize(key_prefix="hashed")
+    def copy(x):
+        return dict(x)
+
+    assert copy({"a": 1}) == {"a": 1}
+    assert copy({"a": 1}) == {"a": 1}
+    assert copy.cache_stats()["hits"] == 1
+
+
+def test_byte_budget_and_ttl(cache):
+    @cache.memoize(ttl=0.05, max_bytes=5000, key_prefix="big")
+    def big(n):
+        return "x" * n
+
+    big(3000)
+    big(3000)
+    big(3001)
+    stats = big.cache_stats()
+    assert stats["size"] == 1
+    assert stats["bytes"] <= 5000
+
+    time.sleep(0.06)
+    big(3001)
+    assert big.cache_stats()["misses"] == 3
+
+    # Larger than the whole budget: returned, never stored
+    big(100_000)
+    assert big.cache_stats()["size"] == 0
+
+
+async def test_thread_safety_and_pattern_invalidation(cache):
+    @cache.memoize(key_prefix="sq")
+    def square(x):
+        return x * x
+
+    def work():
+        for i in range(2000):
+            assert square(i % 50) == (i % 50) ** 2
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert square.cache_stats()["size"] == 50
+
+    await cache.invalidate_pattern("sq:*")
+    assert square.cache_stats()["size"] == 0
@@ -0,0 +1,52 @@
+"""Tests for per-prefix cache metrics and the Prometheus exposition."""
+
+from __future__ import annotations
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+async def _exercise(cache):
+    @cache.cached(ttl=60, key_prefix="prof", l1_maxsize=4)
+    async def load(x):
+        return {"x": x}
+
+    await load(1)  # Miss
+    await load(1)  # L1 hit
+    cache.clear_local_caches()
+    await load(1)  # Redis hit
+
+    await cache.set_cached("user:1", {"a": 1})
+    await cache.get_cached("user:1")
+    await cache.get_cached("user:2")
+    await cache.get_many(["user:1", "user:3"])
+
+
+async def test_counters_are_kept_per_prefix(cache):
+    await _exercise(cache)
+    metrics = cache.get_cache_metrics()
+
+    assert metrics["prof"]["misses"] == 1
+    assert metrics["prof"]["l1_hits"] == 1
+    assert metrics["prof"]["hits"] == 1
+    assert metrics["prof"]["payload_bytes"]["count"] == 1
+    assert metrics["user"]["hits"] == 2
+    assert metrics["user"]["misses"] == 2
+
+    cache.reset_cache_metrics()
+    assert cache.get_cache_metrics().get("user", {}).get("hits", 0) == 0
+
+
+async def test_prometheus_exposition(cache):
+    await _exercise(cache)
+    text = cache.render_prometheus_metrics()
+
+    assert 'cache_requests_total{prefix="prof",result="hits"} 1' in text
+    assert 'cache_get_latency_seconds_bucket{prefix="user",le="+Inf"} 3' in text
+    assert 'cache_l1_entries{prefix="prof"} 1' in text
+
+
+async def test_cache_stats_include_prefixes(cache):
+    await _exercise(cache)
+    assert "prof" in (await cache.get_cache_stats())["prefixes"]
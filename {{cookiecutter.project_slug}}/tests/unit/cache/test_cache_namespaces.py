@@ -0,0 +1,59 @@
+"""Tests for generation-based namespace invalidation."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+async def test_bump_namespace_orphans_entries(cache):
+    calls = []
+
+    @cache.cached(ttl=60, namespace="api:users", l1_maxsize=10)
+    async def list_users(page):
+        calls.append(page)
+        return {"page": page, "n": len(calls)}
+
+    first = await list_users(1)
+    assert await list_users(1) == first
+
+    generation = await cache._namespace_generation("api:users")
+    assert await cache.bump_namespace("api:users") == generation + 1
+    assert (await list_users(1))["n"] == 2
+
+
+async def test_cache_invalidate_bumps_resolved_namespace(cache):
+    calls = []
+
+    @cache.cached(ttl=60, namespace=lambda user_id: f"user:{user_id}")
+    async def load(user_id):
+        calls.append(user_id)
+        return len(calls)
+
+    @cache.cache_invalidate(namespace=lambda user_id: f"user:{user_id}")
+    async def update(user_id):
+        return user_id
+
+    value = await load("a")
+    other = await load("b")
+    assert await load("a") == value
+
+    await update("a")
+    assert await load("a") != value
+    assert await load("b") == other
+
+
+async def test_namespaced_key_embeds_generation(cache):
+    key = await cache.namespaced_key("ns", "k")
+    generation = await cache._namespace_generation("ns")
+    assert key == f"ns:g{generation}:k"
+
+
+async def test_concurrent_generation_fetches_agree(cache):
+    generations = await asyncio.gather(
+        *[cache._namespace_generation("n") for _ in range(20)]
+    )
+    assert len(set(generations)) == 1
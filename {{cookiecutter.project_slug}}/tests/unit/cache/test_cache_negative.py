@@ -0,0 +1,92 @@
+"""Tests for negative (None) and exception caching."""
+
+from __future__ import annotations
+
+import pytest
+
+from {{ cookiecutter.project_slug }}.core.exceptions import ResourceNotFoundError, ValidationError
+
+pytestmark = pytest.mark.unit
+
+
+async def test_none_is_cached_with_negative_ttl(cache):
+    calls = []
+
+    @cache.cached(ttl=60, key_prefix="neg", negative_ttl=30)
+    async def find(x):
+        calls.append(x)
+
+    assert await find(1) is None
+    assert await find(1) is None
+    assert calls == [1]
+    assert cache.get_cache_metrics()["neg"]["negative_hits"] == 1
+
+
+async def test_listed_exceptions_are_cached_and_rebuilt(cache):
+    calls = []
+
+    @cache.cached(ttl=60, key_prefix="exc", cache_exceptions=(ResourceNotFoundError,))
+    async def find(x):
+        calls.append(x)
+        raise ResourceNotFoundError("nope", resource_type="User", resource_id=str(x))
+
+    for _ in range(3):
+        with pytest.raises(ResourceNotFoundError) as raised:
+            await find(7)
+        assert raised.value.message == "nope"
+        assert raised.value.details["resource_id"] == "7"
+    assert calls == [7]
+
+
+async def test_other_exceptions_are_not_cached(cache):
+    calls = []
+
+    @cache.cached(ttl=60, key_prefix="exc", cache_exceptions=(ValidationError,))
+    async def find(x):
+        calls.append(x)
+        raise ResourceNotFoundError("nope")
+
+    for _ in range(2):
+        with pytest.raises(ResourceNotFoundError):
+            await find(1)
+    assert calls == [1, 1]
+
+
+async def test_get_cached_understands_internal_entries(cache):
+    missing = object()
+    await cache.set_cached("k:neg", cache._Envelope({cache._NEGATIVE_MARKER: 1}))
+    await cache.set_cached("k:err", cache._error_entry(ResourceNotFoundError("x")))
+
+    assert await cache.get_cached("k:neg", default=missing) is None
+    assert await cache.get_cached("k:err", default=missing) is missing
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"__none__": 1},
+        {"__error__": 1, "t": "builtins.ValueError", "a": [], "s": {}},
+        {"__swr__": 1, "v": "inner", "d": 0.0, "x": 0.0},
+    ],
+)
+async def test_user_values_shaped_like_internal_entries_are_returned_as_is(
+    cache, value
+):
+    calls = []
+
+    @cache.cached(
+        ttl=60,
+        key_prefix="lookalike",
+        negative_ttl=30,
+        cache_exceptions=(ValueError,),
+    )
+    async def load():
+        calls.append(1)
+        return value
+
+    assert await load() == value
+    assert await load() == value
+    assert calls == [1]
+
+    await cache.set_cached("raw", value)
+    assert await cache.get_cached("raw") == value
@@ -0,0 +1,89 @@
+"""Tests for cache codecs, compression and framed payloads."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, date, datetime, time
+from decimal import Decimal
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+VALUE = {
+    "when": datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC),
+    "day": date(2024, 1, 2),
+    "at": time(1, 2),
+    "price": Decimal("1.10"),
+    "ids": {1, 2},
+    "mixed": [1, "a", None, 2.5],
+    "nested": {"x": [Decimal(2)]},
+}
+
+_CODEC_MODULES = {"orjson": "orjson", "msgpack": "msgpack"}
+_COMPRESSION_MODULES = {"zlib": "zlib", "zstd": "zstandard", "lz4": "lz4.frame"}
+
+
+def _codec(cache, name):
+    pytest.importorskip(_CODEC_MODULES[name])
+    return cache.OrjsonCodec() if name == "orjson" else cache.MsgpackCodec()
+
+
+@pytest.mark.parametrize("codec", ["orjson", "msgpack"])
+@pytest.mark.parametrize("compression", [None, "zlib", "zstd", "lz4"])
+def test_framed_roundtrip(cache, codec, compression):
+    if compression is not None:
+        pytest.importorskip(_COMPRESSION_MODULES[compression])
+    serializer = cache.CacheSerializer(
+        _codec(cache, codec), compression=compression, compress_threshold=10
+    )
+
+    data = serializer.dumps(VALUE)
+
+    assert data[0] & cache._FRAME_FLAG
+    # Any serializer decodes any frame
+    assert cache.CacheSerializer().loads(data) == VALUE
+
+
+def test_msgpack_keeps_uuids_and_tuples(cache):
+    serializer = cache.CacheSerializer(_codec(cache, "msgpack"))
+    value = {"id": uuid.uuid4(), "pair": (1, 2)}
+    assert serializer.loads(serializer.dumps(value)) == value
+
+
+def test_default_serializer_reads_and_writes_legacy_json(cache):
+    serializer = cache.CacheSerializer()
+    assert serializer.dumps({"a": 1}) == b'{"a": 1}'
+    assert serializer.loads(b'{"a": 1}') == {"a": 1}
+
+    compressed = cache.CacheSerializer(compression="zlib", compress_threshold=1)
+    assert serializer.loads(compressed.dumps({"a": 1})) == {"a": 1}
+
+
+def test_unknown_compression_is_rejected(cache):
+    with pytest.raises(cache.ConfigurationError, match="Unknown cache compression"):
+        cache.CacheSerializer(compression="brotli")
+
+
+async def test_cached_values_roundtrip_through_redis(cache):
+    serializer = cache.CacheSerializer(
+        _codec(cache, "msgpack"), compression="zlib", compress_threshold=1
+    )
+    await cache.set_cached("k", VALUE, serializer=serializer)
+    assert await cache.get_cached("k") == VALUE
+
+    calls = []
+
+    @cache.cached(ttl=60, serializer=serializer, stale_ttl=10)
+    async def load(x):
+        calls.append(x)
+        return VALUE
+
+    assert await load(1) == VALUE
+    assert await load(1) == VALUE
+    assert calls == [1]
+
+
+async def test_undecodable_payload_reads_as_default(cache):
+    await (await cache.get_redis()).set("bad", b"\xff\x00garbage")
+    assert await cache.get_cached("bad", default=7) == 7
@@ -0,0 +1,73 @@
+"""Tests for single-flight miss coalescing in ``@cached`` and ``warm_cache``."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+async def test_concurrent_misses_run_the_function_once(cache):
+    calls = []
+
+    @cache.cached(ttl=60, key_prefix="sf")
+    async def load(x):
+        calls.append(x)
+        await asyncio.sleep(0.05)
+        return x * 2
+
+    assert await asyncio.gather(*[load(3) for _ in range(20)]) == [6] * 20
+    assert calls == [3]
+
+
+async def test_failure_is_shared_but_not_cached(cache):
+    calls = []
+
+    @cache.cached(ttl=60, key_prefix="sferr")
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(*[load() for _ in range(5)], return_exceptions=True)
+    assert all(isinstance(r, ValueError) for r in results)
+    assert calls == [1]
+    with pytest.raises(ValueError, match="boom"):
+        await load()
+    assert calls == [1, 1]
+
+
+async def test_distributed_lock_lets_one_process_recompute(cache):
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return {"a": 1}
+
+    # Two "processes": each bypasses the other's in-process single flight
+    results = await asyncio.gather(
+        cache._recompute("k", slow, 60, distributed_lock=True),
+        cache._recompute("k", slow, 60, distributed_lock=True),
+    )
+    assert results == [{"a": 1}, {"a": 1}]
+    assert calls == [1]
+    assert not await (await cache.get_redis()).exists("k:lock")
+
+
+async def test_concurrent_warm_cache_loads_once(cache):
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return 5
+
+    results = await asyncio.gather(
+        *[cache.warm_cache("w", load, force=True) for _ in range(5)]
+    )
+    assert results == [True] * 5
+    assert await cache.get_cached("w") == 5
+    assert calls == [1]
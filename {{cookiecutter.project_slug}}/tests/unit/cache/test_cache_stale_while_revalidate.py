@@ -0,0 +1,69 @@
+"""Tests for stale-while-revalidate and probabilistic early refresh."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+async def test_stale_value_is_served_while_refreshing(cache, monkeypatch):
+    calls = []
+
+    @cache.cached(ttl=10, key_prefix="swr", stale_ttl=100)
+    async def load():
+        calls.append(1)
+        return len(calls)
+
+    assert await load() == 1
+    assert await load() == 1
+
+    real_time = time.time
+    monkeypatch.setattr(cache.time, "time", lambda: real_time() + 20)
+    assert await load() == 1  # Stale, refreshed in the background
+    await asyncio.sleep(0.05)
+    monkeypatch.setattr(cache.time, "time", real_time)
+
+    assert await load() == 2
+    assert calls == [1, 1]
+    key = cache._build_cache_key(load, "swr", None, (), {})
+    assert await (await cache.get_redis()).ttl(key) > 10
+
+
+def test_refresh_due_probability_grows_towards_expiry(cache):
+    now = time.time()
+    assert cache._refresh_due(1.0, now - 1, 0.0)
+    assert not cache._refresh_due(1.0, now + 1000, 1.0)
+    hits = sum(cache._refresh_due(1.0, time.time() + 0.5, 1.0) for _ in range(2000))
+    assert 500 < hits < 2000
+
+
+async def test_miss_joining_a_yielded_refresh_gets_a_real_value(cache):
+    calls = []
+
+    @cache.cached(ttl=60, key_prefix="swrlock", distributed_lock=True)
+    async def load():
+        calls.append(1)
+        return "fresh"
+
+    async def unused():
+        raise AssertionError
+
+    key = cache._build_cache_key(load, "swrlock", None, (), {})
+    # Another worker holds the recompute lock
+    holder = cache.DistributedLock(key, ttl=0.2, auto_extend=False, fencing=False)
+    assert await holder.acquire(blocking=False)
+
+    refresh = functools.partial(
+        cache._recompute, key, unused, 60, distributed_lock=True, wait_for_lock=False
+    )
+    cache._schedule_refresh(key, refresh)
+    await asyncio.sleep(0)
+    assert key in cache._inflight
+
+    assert await load() == "fresh"
+    assert calls == [1]
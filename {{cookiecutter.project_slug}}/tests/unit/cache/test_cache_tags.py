@@ -0,0 +1,73 @@
+"""Tests for tag-based invalidation."""
+
+from __future__ import annotations
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+async def test_invalidate_tags_drops_tagged_entries(cache):
+    calls = []
+
+    @cache.cached(
+        ttl=60,
+        key_prefix="profile",
+        tags=lambda user_id: ["users", f"user:{user_id}"],
+        l1_maxsize=10,
+    )
+    async def load_profile(user_id):
+        calls.append(user_id)
+        return {"id": user_id}
+
+    await load_profile(1)
+    await load_profile(2)
+    await load_profile(1)
+    assert calls == [1, 2]
+
+    await cache.set_cached("other", 1, tags=["user:1"])
+    redis = await cache.get_redis()
+    assert 60 < await redis.ttl("cache:tag:{user:1}") <= 3600
+
+    assert await cache.invalidate_tags("user:1") == 2
+    assert await cache.get_cached("other") is None
+    # The L1 copy is dropped too
+    await load_profile(1)
+    await load_profile(2)
+    assert calls == [1, 2, 1]
+    assert await cache.invalidate_tags("unknown") == 0
+
+
+async def test_cache_invalidate_decorator_resolves_tags(cache):
+    calls = []
+
+    @cache.cached(
+        ttl=60, key_prefix="profile", tags=lambda user_id: [f"user:{user_id}"]
+    )
+    async def load_profile(user_id):
+        calls.append(user_id)
+        return {"id": user_id}
+
+    @cache.cache_invalidate(tags=lambda user_id: [f"user:{user_id}"])
+    async def update_profile(user_id):
+        return "ok"
+
+    await load_profile(2)
+    assert await update_profile(2) == "ok"
+    await load_profile(2)
+    assert calls == [2, 2]
+
+
+async def test_cleanup_tags_prunes_expired_members(cache):
+    @cache.cached(ttl=60, key_prefix="profile", tags=lambda user_id: ["users"])
+    async def load_profile(user_id):
+        return {"id": user_id}
+
+    await load_profile(1)
+    await load_profile(2)
+    await (await cache.get_redis()).delete(
+        cache.build_cache_key(load_profile, (1,), key_prefix="profile")
+    )
+
+    assert await cache.cleanup_tags() == 1
+    assert await cache.cleanup_tags(["users"]) == 0
@@ -0,0 +1,68 @@
+"""Tests for manifest-driven cache warming."""
+
+from __future__ import annotations
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+def _loader(loads, key, value):
+    async def load():
+        loads.append(key)
+        return value
+
+    return load
+
+
+async def _failing_loader():
+    raise ValueError("db down")
+
+
+async def test_warm_manifest_skips_warm_keys_and_counts_failures(cache):
+    loads = []
+    await cache.set_cached("w:already", "old", ttl=60)
+    entries = [
+        cache.WarmupEntry("w:a", _loader(loads, "w:a", 1), ttl=60, priority=1),
+        cache.WarmupEntry("w:b", _loader(loads, "w:b", {"x": 2}), ttl=60, priority=5),
+        cache.WarmupEntry("w:already", _loader(loads, "w:already", "new"), ttl=60),
+        cache.WarmupEntry("w:bad", _failing_loader, ttl=60),
+    ]
+    done = []
+
+    progress = await cache.warm_manifest(
+        entries, concurrency=2, batch_size=2, on_progress=lambda p: done.append(p.done)
+    )
+
+    assert (progress.total, progress.warmed, progress.skipped, progress.failed) == (
+        4,
+        2,
+        1,
+        1,
+    )
+    assert done == [False, True]
+    # Highest priority first
+    assert loads == ["w:b", "w:a"]
+    assert await cache.get_cached("w:b") == {"x": 2}
+    assert await cache.get_cached("w:already") == "old"
+
+    assert (await cache.warm_manifest(entries[:1], force=True)).warmed == 1
+
+
+@pytest.mark.parametrize("backend_name", ["memory", "disk"])
+async def test_registered_manifest_warms_any_backend(cache, tmp_path, backend_name):
+    async def load():
+        return "v"
+
+    if backend_name == "memory":
+        backend = cache.MemoryBackend()
+    else:
+        backend = cache.DiskBackend(tmp_path / "c.db")
+    cache.configure_cache_backend(backend)
+    cache.register_warmup("reg:1", load, ttl=30, priority=3)
+    assert [entry.key for entry in cache.get_warmup_manifest()] == ["reg:1"]
+
+    assert (await cache.warm_manifest()).warmed == 1
+    assert (await cache.warm_manifest()).skipped == 1
+    assert await backend.exists_many(["reg:1", "nope"]) == [True, False]
+    await backend.close()
@@ -0,0 +1,24 @@
+"""Fixtures for job tests: an ARQ Redis client backed by an in-memory Redis."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("arq")
+
+from arq.connections import ArqRedis  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+@pytest.fixture
+async def arq_redis() -> AsyncIterator[ArqRedis]:
+    """ARQ pool over a fresh fake Redis, as the worker and enqueue helpers use."""
+    fake = fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer())
+    redis = ArqRedis(connection_pool=fake.connection_pool)
+    yield redis
+    await redis.aclose()
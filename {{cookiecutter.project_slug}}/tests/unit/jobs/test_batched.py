@@ -0,0 +1,93 @@
+"""Tests for ``@batched`` tasks."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from structlog.testing import capture_logs
+
+from {{ cookiecutter.project_slug }}.jobs import worker
+
+pytestmark = pytest.mark.unit
+
+
+def _job_ctx(job_id):
+    return {"redis": "pool", "job_id": job_id, "job_try": int(job_id) + 1}
+
+
+async def test_concurrent_jobs_are_handled_together():
+    calls = []
+
+    @worker.batched(max_size=3, max_wait=0.05)
+    async def handler(ctx, items):
+        calls.append((ctx, [(item.job_id, item.ctx["job_try"]) for item in items]))
+        return [item.args[0] * 10 for item in items]
+
+    results = await asyncio.gather(*(handler(_job_ctx(str(i)), i) for i in range(5)))
+
+    assert results == [0, 10, 20, 30, 40]
+    assert [jobs for _, jobs in calls] == [
+        [("0", 1), ("1", 2), ("2", 3)],
+        [("3", 4), ("4", 5)],
+    ]
+    # The handler's context holds only what the jobs share
+    assert [ctx for ctx, _ in calls] == [{"redis": "pool"}] * 2
+
+
+async def test_exception_result_fails_only_its_job():
+    @worker.batched(max_size=10, max_wait=0.01)
+    async def handler(_ctx, items):
+        return [ValueError("bad") if item.args[0] == 1 else "ok" for item in items]
+
+    results = await asyncio.gather(
+        handler(_job_ctx("0"), 0), handler(_job_ctx("1"), 1), return_exceptions=True
+    )
+
+    assert results[0] == "ok"
+    assert isinstance(results[1], ValueError)
+
+
+async def test_raising_handler_fails_every_job():
+    @worker.batched(max_size=10, max_wait=0.01)
+    async def handler(_ctx, _items):
+        raise RuntimeError
+
+    results = await asyncio.gather(
+        handler(_job_ctx("0"), 0), handler(_job_ctx("1"), 1), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_cancelled_job_drops_out_of_its_batch():
+    calls = []
+
+    @worker.batched(max_size=10, max_wait=0.01)
+    async def handler(_ctx, items):
+        calls.append([item.args[0] for item in items])
+        return [None] * len(items)
+
+    waiting = asyncio.ensure_future(handler(_job_ctx("0"), 0))
+    await asyncio.sleep(0)
+    waiting.cancel()
+
+    assert await handler(_job_ctx("1"), 1) is None
+    assert calls == [[1]]
+
+
+async def test_send_email_task_sends_one_email(monkeypatch):
+    sleep = asyncio.sleep
+    monkeypatch.setattr(asyncio, "sleep", lambda _: sleep(0))
+
+    with capture_logs() as logs:
+        result = await worker.send_email_task({}, "to@example.com", "Hi", "Body")
+
+    assert result["status"] == "sent"
+    assert result["recipient"] == "to@example.com"
+    assert {
+        "event": "sending_email",
+        "recipient": "to@example.com",
+        "subject": "Hi",
+        "log_level": "info",
+    } in logs
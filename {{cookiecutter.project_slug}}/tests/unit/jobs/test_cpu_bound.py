@@ -0,0 +1,124 @@
+"""Tests for ``@cpu_bound`` tasks and the worker's process pool."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from {{ cookiecutter.project_slug }}.jobs import worker
+
+pytestmark = pytest.mark.unit
+
+
+@worker.cpu_bound
+def pid_after(seconds):
+    time.sleep(seconds)
+    return os.getpid()
+
+
+async def _exited(pid):
+    for _ in range(50):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        await asyncio.sleep(0.1)
+    return False
+
+
+@pytest.fixture
+async def worker_ctx(monkeypatch):
+    """Context of a started worker, with a one-process CPU pool."""
+    monkeypatch.setattr(worker.WorkerSettings, "cpu_pool_size", 1)
+    ctx = {}
+    await worker.startup(ctx)
+    yield ctx
+    await worker.shutdown(ctx)
+
+
+def _job_ctx(worker_ctx, job_id):
+    # ARQ gives every job its own copy of the worker's context
+    return {**worker_ctx, "job_id": job_id, "job_try": 1}
+
+
+async def test_jobs_share_the_worker_pool(worker_ctx, tmp_path):
+    upload = tmp_path / "upload.csv"
+    upload.write_text("id,name\n1,a\n2,b\n")
+    pool = worker_ctx["cpu_pool"]
+    # No process is started before the first call
+    assert pool._executor._started.empty()
+
+    results = [
+        await worker.process_file_upload(
+            _job_ctx(worker_ctx, str(i)), f"f{i}", str(upload)
+        )
+        for i in range(3)
+    ]
+    pids = {await pid_after(_job_ctx(worker_ctx, str(i)), 0) for i in range(3, 6)}
+
+    assert [result["records_processed"] for result in results] == [3, 3, 3]
+    assert worker_ctx["cpu_pool"] is pool
+    assert len(pids) == 1
+    assert os.getpid() not in pids
+
+
+async def test_shutdown_stops_the_pool(monkeypatch):
+    monkeypatch.setattr(worker.WorkerSettings, "cpu_pool_size", 1)
+    worker_ctx = {}
+    await worker.startup(worker_ctx)
+    pid = await pid_after(_job_ctx(worker_ctx, "1"), 0)
+
+    await worker.shutdown(worker_ctx)
+
+    assert await _exited(pid)
+
+
+async def test_warm_pool_is_started_at_startup(monkeypatch):
+    monkeypatch.setattr(worker.WorkerSettings, "cpu_pool_size", 1)
+    monkeypatch.setattr(worker.WorkerSettings, "cpu_pool_warm", True)
+    worker_ctx = {}
+
+    await worker.startup(worker_ctx)
+    try:
+        assert not worker_ctx["cpu_pool"]._executor._started.empty()
+    finally:
+        await worker.shutdown(worker_ctx)
+
+
+async def test_call_without_startup_is_rejected():
+    with pytest.raises(RuntimeError, match="No CpuPool"):
+        await pid_after({"job_id": "1"}, 0)
+
+
+async def test_unpicklable_arguments_are_rejected(worker_ctx):
+    with pytest.raises(TypeError, match="must be picklable"):
+        await pid_after(_job_ctx(worker_ctx, "1"), lambda: 0)
+
+
+def test_local_functions_are_rejected():
+    def local():
+        pass
+
+    with pytest.raises(TypeError, match="module level"):
+        worker.cpu_bound(local)
+
+
+async def test_cancelled_call_retires_its_processes(worker_ctx):
+    busy_pid = await pid_after(_job_ctx(worker_ctx, "1"), 0)
+    pool = worker_ctx["cpu_pool"]
+    retired = pool._executor
+
+    call = asyncio.ensure_future(pid_after(_job_ctx(worker_ctx, "2"), 60))
+    await asyncio.sleep(0.2)
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+
+    assert pool._executor is not retired
+    assert not pool._retired
+    # The stuck process was killed, and new calls run in a fresh one
+    assert await _exited(busy_pid)
+    assert await pid_after(_job_ctx(worker_ctx, "1"), 0) != busy_pid
@@ -0,0 +1,93 @@
+"""Tests for idempotent enqueueing with ``enqueue_task``."""
+
+from __future__ import annotations
+
+import pytest
+
+from {{ cookiecutter.project_slug }}.jobs import worker
+
+pytestmark = pytest.mark.unit
+
+
+async def test_deduplicate_queues_one_job_per_arguments(arq_redis):
+    queue = worker.queue_for("process_file_upload")
+
+    first = await worker.enqueue_task(
+        arq_redis, "process_file_upload", "f1", path="/x", _deduplicate=True
+    )
+    again = await worker.enqueue_task(
+        arq_redis,
+        "process_file_upload",
+        "f1",
+        path="/x",
+        _deduplicate=True,
+        _defer_by=5,
+    )
+    other = await worker.enqueue_task(
+        arq_redis, "process_file_upload", "f2", path="/x", _deduplicate=True
+    )
+
+    assert first == again != other
+    assert await arq_redis.zcard(queue) == 2
+
+
+async def test_derived_job_id_is_canonical(arq_redis):
+    a = await worker.enqueue_task(
+        arq_redis, "task", tags={"b", "a"}, opts={"x": 1, "y": 2}, _deduplicate=True
+    )
+    b = await worker.enqueue_task(
+        arq_redis, "task", opts={"y": 2, "x": 1}, tags={"a", "b"}, _deduplicate=True
+    )
+    assert a == b
+    assert a == worker._idempotent_job_id(
+        "task", None, (), {"tags": {"a", "b"}, "opts": {"x": 1, "y": 2}}
+    )
+
+
+async def test_idempotency_key_overrides_arguments(arq_redis):
+    first = await worker.enqueue_task(arq_redis, "task", 1, _idempotency_key="req-1")
+    again = await worker.enqueue_task(arq_redis, "task", 2, _idempotency_key="req-1")
+
+    assert first == again
+    assert await arq_redis.zcard(worker.default_queue_name) == 1
+
+
+async def test_marker_is_written_with_the_job(arq_redis):
+    job_id = await worker.enqueue_task(arq_redis, "task", 1, _deduplicate=True)
+    marker = worker._IDEMPOTENCY_PREFIX + job_id
+
+    assert 0 < await arq_redis.pttl(marker) <= 3_600_000
+    assert await arq_redis.exists(f"arq:job:{job_id}")
+
+    # Without the marker, ARQ's check on the queued job still deduplicates
+    await arq_redis.delete(marker)
+    assert await worker.enqueue_task(arq_redis, "task", 1, _deduplicate=True) == job_id
+    assert await arq_redis.zcard(worker.default_queue_name) == 1
+    assert not await arq_redis.exists(marker)
+
+
+async def test_failed_enqueue_leaves_no_marker(arq_redis):
+    with pytest.raises(ValueError, match="_defer_until or _defer_by"):
+        await worker.enqueue_task(
+            arq_redis, "task", 1, _deduplicate=True, _defer_by=1, _defer_until=1
+        )
+
+    assert await arq_redis.keys(worker._IDEMPOTENCY_PREFIX + "*") == []
+    job_id = await worker.enqueue_task(arq_redis, "task", 1, _deduplicate=True)
+    assert await arq_redis.exists(f"arq:job:{job_id}")
+
+
+async def test_plain_enqueue_is_not_deduplicated(arq_redis):
+    ids = {await worker.enqueue_task(arq_redis, "task", 1) for _ in range(2)}
+    assert len(ids) == 2
+
+
+async def test_job_id_cannot_be_combined_with_idempotency(arq_redis):
+    with pytest.raises(ValueError, match="_job_id"):
+        await worker.enqueue_task(arq_redis, "task", _deduplicate=True, _job_id="x")
+
+
+async def test_arguments_without_stable_encoding_are_rejected(arq_redis):
+    with pytest.raises(TypeError, match="__cache_key__"):
+        await worker.enqueue_task(arq_redis, "task", object(), _deduplicate=True)
+    assert await arq_redis.zcard(worker.default_queue_name) == 0
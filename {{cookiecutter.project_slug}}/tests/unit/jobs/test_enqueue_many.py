@@ -0,0 +1,51 @@
+"""Tests for pipelined bulk enqueueing with ``enqueue_many``."""
+
+from __future__ import annotations
+
+import pytest
+from arq.constants import default_queue_name
+from arq.jobs import Job
+
+from {{ cookiecutter.project_slug }}.jobs import worker
+
+pytestmark = pytest.mark.unit
+
+
+async def test_enqueue_many_keeps_order_and_skips_duplicates(arq_redis):
+    specs = (
+        ("cleanup_old_data", (i,), None, {"_job_id": f"j{i % 7}"}) for i in range(10)
+    )
+
+    job_ids = await worker.enqueue_many(arq_redis, specs, chunk_size=3)
+
+    assert job_ids == [f"j{i}" for i in range(7)] + [None] * 3
+    assert await arq_redis.zcard(default_queue_name) == 7
+    info = await Job("j3", arq_redis).info()
+    assert info.function == "cleanup_old_data"
+    assert info.args == (3,)
+    # enqueue_job sees the same jobs
+    assert await arq_redis.enqueue_job("other", _job_id="j3") is None
+
+
+async def test_enqueue_many_routes_tasks_to_their_queues(arq_redis):
+    [job_id] = await worker.enqueue_many(
+        arq_redis, [("send_email_task", ("to@example.com", "s", "b"), None, None)]
+    )
+    assert await arq_redis.zscore(worker.queue_for("send_email_task"), job_id)
+
+
+async def test_enqueue_many_honours_queue_and_defer(arq_redis):
+    spec = worker.JobSpec("task", (1,), {"a": 2}, {"_queue_name": "q", "_defer_by": 60})
+
+    [job_id] = await worker.enqueue_many(arq_redis, [spec])
+
+    info = await Job(job_id, arq_redis, _queue_name="q").info()
+    assert info.kwargs == {"a": 2}
+    score = await arq_redis.zscore("q", job_id)
+    assert score > info.enqueue_time.timestamp() * 1000 + 59_000
+    assert await arq_redis.pttl(f"arq:job:{job_id}") > 60_000
+
+
+async def test_enqueue_many_rejects_unknown_options(arq_redis):
+    with pytest.raises(ValueError, match="bogus"):
+        await worker.enqueue_many(arq_redis, [("task", (), None, {"bogus": 1})])
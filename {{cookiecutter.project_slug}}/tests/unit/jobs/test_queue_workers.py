@@ -0,0 +1,108 @@
+"""Tests for queue routing and the multi-queue worker."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+
+import arq.worker
+import pytest
+from arq.constants import default_queue_name
+from arq.worker import func
+
+from {{ cookiecutter.project_slug }}.jobs import worker
+
+pytestmark = pytest.mark.unit
+
+
+async def test_queue_workers_are_sized_and_paced_by_weight():
+    workers = worker._queue_workers({})
+
+    assert [w.queue_name for w in workers] == [q.name for q in worker.QUEUES]
+    # The default queue keeps WorkerSettings.max_jobs
+    assert [w.max_jobs for w in workers] == [6, worker.WorkerSettings.max_jobs, 2]
+    assert [w.poll_delay_s for w in workers] == [0.5, 1.0, 3.0]
+    assert [bool(w.cron_jobs) for w in workers] == [False, True, False]
+
+
+async def test_queue_workers_share_one_cpu_pool():
+    ctx = {}
+    await worker.startup(ctx)
+    try:
+        workers = worker._queue_workers(ctx)
+        assert all(w.ctx["cpu_pool"] is ctx["cpu_pool"] for w in workers)
+    finally:
+        await worker.shutdown(ctx)
+
+
+async def test_tasks_are_routed_and_reported_per_queue(arq_redis):
+    await worker.enqueue_task(arq_redis, "send_email_task", "a@example.com", "s", "b")
+    await worker.enqueue_task(arq_redis, "example_background_task", "u", {})
+    await worker.enqueue_many(
+        arq_redis,
+        [
+            ("process_file_upload", ("f", "/p"), None, None),
+            ("process_file_upload", ("g", "/p"), None, {"_defer_by": 600}),
+        ],
+    )
+
+    stats = await worker.get_queue_stats(arq_redis)
+
+    assert stats["arq:queue:high"]["depth"] == 1
+    assert stats[default_queue_name]["depth"] == 1
+    assert stats["arq:queue:bulk"]["depth"] == 2
+    assert stats["arq:queue:bulk"]["ready"] == 1
+
+
+async def _no_redis_info(_redis, _log):
+    pass
+
+
+@pytest.fixture
+def slow_job(monkeypatch):
+    """Register a job that sleeps for its argument and records when it is done."""
+    started = asyncio.Event()
+    finished = []
+
+    async def slow_job(_ctx, seconds):
+        started.set()
+        await asyncio.sleep(seconds)
+        finished.append(seconds)
+
+    monkeypatch.setattr(
+        worker.WorkerSettings, "functions", [func(slow_job, name="slow_job")]
+    )
+    monkeypatch.setattr(worker.WorkerSettings, "cron_jobs", [])
+    monkeypatch.setattr(worker, "_POLL_DELAY", 0.01)
+    # The in-memory Redis has no INFO command
+    monkeypatch.setattr(arq.worker, "log_redis_info", _no_redis_info)
+    return started, finished
+
+
+async def _run_until_sigterm(arq_redis, started):
+    run = asyncio.ensure_future(worker.run_queue_workers(arq_redis))
+    await asyncio.wait_for(started.wait(), 5)
+    os.kill(os.getpid(), signal.SIGTERM)
+    await asyncio.wait_for(run, 5)
+
+
+async def test_sigterm_lets_running_jobs_finish(arq_redis, slow_job):
+    started, finished = slow_job
+    await arq_redis.enqueue_job("slow_job", 0.3)
+
+    await _run_until_sigterm(arq_redis, started)
+
+    assert finished == [0.3]
+
+
+async def test_sigterm_cancels_jobs_after_the_grace_period(
+    arq_redis, slow_job, monkeypatch
+):
+    started, finished = slow_job
+    monkeypatch.setattr(worker.WorkerSettings, "shutdown_timeout", 0.1)
+    await arq_redis.enqueue_job("slow_job", 60)
+
+    await _run_until_sigterm(arq_redis, started)
+
+    assert finished == []